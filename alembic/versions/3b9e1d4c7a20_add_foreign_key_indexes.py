@@ -0,0 +1,41 @@
+"""add foreign key indexes
+
+Revision ID: 3b9e1d4c7a20
+Revises: fae7c2bae564
+Create Date: 2026-10-18 11:02:17.583190
+
+"""  # noqa: D400, D415, INP001
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9e1d4c7a20"
+down_revision: str | Sequence[str] | None = "fae7c2bae564"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # concurrent index builds cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index("ix_project_creator_guid", "project", ["creator_guid"], postgresql_concurrently=True)
+        op.create_index("ix_project_mentor_guid", "project", ["mentor_guid"], postgresql_concurrently=True)
+        op.create_index(
+            "ix_task_project_guid_created_at",
+            "task",
+            ["project_guid", "created_at"],
+            postgresql_concurrently=True,
+        )
+        op.create_index("ix_task_executor_guid", "task", ["executor_guid"], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_task_executor_guid", table_name="task", postgresql_concurrently=True)
+        op.drop_index("ix_task_project_guid_created_at", table_name="task", postgresql_concurrently=True)
+        op.drop_index("ix_project_mentor_guid", table_name="project", postgresql_concurrently=True)
+        op.drop_index("ix_project_creator_guid", table_name="project", postgresql_concurrently=True)
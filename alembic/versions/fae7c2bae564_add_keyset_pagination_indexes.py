@@ -0,0 +1,60 @@
+"""add keyset pagination indexes
+
+Revision ID: fae7c2bae564
+Revises: 5158edd5a8d9
+Create Date: 2026-10-18 10:12:41.204518
+
+"""  # noqa: D400, D415, INP001
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "fae7c2bae564"
+down_revision: str | Sequence[str] | None = "5158edd5a8d9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # concurrent index builds cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_project_created_at_guid",
+            "project",
+            ["created_at", "guid"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_project_updated_at_guid",
+            "project",
+            ["updated_at", "guid"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_user_created_at_guid",
+            "user",
+            ["created_at", "guid"],
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_user_updated_at_guid",
+            "user",
+            ["updated_at", "guid"],
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_user_updated_at_guid", table_name="user", postgresql_concurrently=True)
+        op.drop_index("ix_user_created_at_guid", table_name="user", postgresql_concurrently=True)
+        op.drop_index("ix_project_updated_at_guid", table_name="project", postgresql_concurrently=True)
+        op.drop_index("ix_project_created_at_guid", table_name="project", postgresql_concurrently=True)
@@ -1,9 +1,19 @@
-from multiprocessing import cpu_count
+import gc
+
+from gunicorn.arbiter import Arbiter
 
 from src.config import get_settings
 
 bind = f"{get_settings().HOST}:{get_settings().PORT}"
-workers = (cpu_count() * 2) + 1
+workers = get_settings().WORKERS
 worker_class = "uvicorn_worker.UvicornWorker"
+# imports, settings, routes and the openapi schema are built once in the master and shared with workers,
+# engines, redis and the broker are built per worker in the app lifespan
+preload_app = get_settings().PRELOAD_APP
 capture_output = True
 loglevel = "INFO"
+
+
+def when_ready(server: Arbiter) -> None:  # noqa: ARG001
+    # keeps the collector of workers from touching, and so copying, the pages of objects built in the master
+    gc.freeze()
@@ -0,0 +1,38 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+
+from src.common.exc import ExecutorSaturatedError
+
+logger = getLogger()
+
+
+class BoundedThreadPoolExecutor:
+    """Runs blocking calls off the event loop, rejects new calls once workers and queue are full"""
+
+    __slots__ = ("_executor", "_max_pending", "_pending")
+
+    def __init__(self, max_workers: int, max_queue_size: int, thread_name_prefix: str = "") -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._max_pending = max_workers + max_queue_size
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def run[*Ts, R](self, func: Callable[[*Ts], R], *args: *Ts) -> R:
+        if self._pending >= self._max_pending:
+            logger.warning("Executor is saturated with %i pending calls", self._pending)
+            msg = "Server is busy, try again later"
+            raise ExecutorSaturatedError(msg)
+
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,12 @@
+from dataclasses import fields
+from typing import Any
+
+
+def get_changed_fields(before: Any, after: Any) -> dict[str, Any]:
+    """Fields of the `after` dataclass instance whose values differ from `before`"""
+
+    return {
+        field.name: getattr(after, field.name)
+        for field in fields(after)
+        if getattr(after, field.name) != getattr(before, field.name)
+    }
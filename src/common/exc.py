@@ -10,3 +10,8 @@ class BaseAppError(Exception):
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}: {self.msg}"
+
+
+@dataclass(eq=False, frozen=True, slots=True)
+class ExecutorSaturatedError(BaseAppError):
+    pass
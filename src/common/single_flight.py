@@ -0,0 +1,31 @@
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+from contextvars import Context
+from typing import Any
+
+
+class SingleFlight[K: Hashable, V]:
+    """Concurrent calls with the same key share one in-flight call. It runs in an empty context, so it does not
+    use the first caller's unit of work or other request state that ends with that caller. Callers in a unit of work
+    should not go through it, the call checks out its own connection
+    """
+
+    __slots__ = ("_in_flight",)
+
+    def __init__(self) -> None:
+        self._in_flight: dict[K, asyncio.Task[V]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    async def do[*Ts](self, key: K, func: Callable[[*Ts], Coroutine[Any, Any, V]], *args: *Ts) -> V:
+        task = self._in_flight.get(key)
+
+        if task is None:
+            task = asyncio.create_task(func(*args), context=Context())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # a cancelled caller must not cancel the call shared with other callers
+        return await asyncio.shield(task)
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import time
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+
+class TTLLRUCache[K, V]:
+    """Bounded per-process LRU cache, each entry expires at its own unix timestamp"""
+
+    __slots__ = ("_entries", "_max_size", "stats")
+
+    def __init__(self, max_size: int) -> None:
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._max_size = max_size
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        value, expires_at = entry
+
+        if expires_at <= time():
+            del self._entries[key]
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: K, value: V, expires_at: float) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -1,6 +1,7 @@
+import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Annotated, Any, Final
+from typing import Annotated, Any, Final, Literal
 
 import yaml
 from pydantic import AmqpDsn, DirectoryPath, EmailStr, Field, PostgresDsn, RedisDsn
@@ -33,6 +34,8 @@ class Settings(BaseSettings):
     TESTING: Annotated[bool, Field(default=False)]
     HOST: Annotated[str, Field(default="localhost")]
     PORT: Annotated[int, Field(default=8000)]
+    WORKERS: Annotated[int, Field(default_factory=lambda: (os.cpu_count() or 1) * 2 + 1, gt=0)]
+    PRELOAD_APP: Annotated[bool, Field(default=True)]
     DOCS_URL: Annotated[str | None, Field(default=None)]
     REDOC_URL: Annotated[str | None, Field(default=None)]
 
@@ -43,11 +46,26 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: Annotated[str, Field(default="HS256")]
     ACCESS_TOKEN_EXPIRES: int
     REFRESH_TOKEN_EXPIRES: int
+    AUTH_TOKEN_CACHE_SIZE: Annotated[int, Field(default=10_000, gt=0)]
+    HASHER_POOL_SIZE: Annotated[int, Field(default_factory=lambda: os.cpu_count() or 1, gt=0)]
+    HASHER_QUEUE_SIZE: Annotated[int, Field(default=64, ge=0)]
+    USER_LOCAL_CACHE_SIZE: Annotated[int, Field(default=10_000, gt=0)]
+    USER_LOCAL_CACHE_TTL: Annotated[float, Field(default=5.0, gt=0)]
+    CACHE_COMPRESS_THRESHOLD: Annotated[int, Field(default=1024, ge=0)]
 
     PG_URL: PostgresDsn
     PG_URL_TEST: PostgresDsn
+    PG_CONNECTION_BUDGET: Annotated[int, Field(default=90, gt=0)]
+    PG_POOL_TIMEOUT: Annotated[float, Field(default=5.0, gt=0)]
+    PG_RENDERED_JSON: Annotated[bool, Field(default=False)]
+    PG_REPLICA_URLS: Annotated[list[PostgresDsn], Field(default_factory=list)]
+    PG_REPLICA_BALANCING: Annotated[Literal["round_robin", "least_connections"], Field(default="round_robin")]
+    PG_STICKY_READS_WINDOW: Annotated[float, Field(default=5.0, gt=0)]
 
     RMQ_URL: AmqpDsn
+    WORKER_PROCESSES: Annotated[int, Field(default=1, gt=0)]
+    WORKER_PREFETCH: Annotated[int, Field(default=16, gt=0)]
+    WORKER_MAX_CONCURRENCY: Annotated[int, Field(default=8, gt=0)]
 
     REDIS_URL: RedisDsn
 
@@ -56,6 +74,12 @@ class Settings(BaseSettings):
     EMAIL_USERNAME: str
     EMAIL_PASSWORD: str
     EMAIL_SENDER: EmailStr
+    EMAIL_POOL_SIZE: Annotated[int, Field(default=4, gt=0)]
+    EMAIL_KEEPALIVE: Annotated[float, Field(default=60.0, gt=0)]
+    EMAIL_HEALTH_CHECK_AFTER: Annotated[float, Field(default=10.0, ge=0)]
+    REPORT_CACHE_TTL: Annotated[int, Field(default=600, gt=0)]
+    REPORT_DEDUP_WINDOW: Annotated[int, Field(default=60, gt=0)]
+    REPORT_DEDUP_CLAIM_TTL: Annotated[int, Field(default=60, gt=0)]
 
 
 @lru_cache(maxsize=1)
@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from logging import getLogger
+from math import floor
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+logger = getLogger()
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    size: int
+    checked_out: int
+    peak_checked_out: int
+    waiting: int
+    timeouts: int
+
+    @property
+    def saturation(self) -> float:
+        return self.checked_out / self.size if self.size else 0.0
+
+    @property
+    def peak_saturation(self) -> float:
+        return self.peak_checked_out / self.size if self.size else 0.0
+
+
+class BudgetedQueuePool(AsyncAdaptedQueuePool):
+    """Fixed size pool, checkouts over the size wait in the pool queue until `pool_timeout` and then fail"""
+
+    peak_checked_out: int = 0
+    waiting: int = 0
+    timeouts: int = 0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        self.waiting += 1
+        try:
+            connection = super()._do_get()
+
+        except exc.TimeoutError:
+            self.timeouts += 1
+            logger.warning("Connection checkout timed out, pool %s", self.get_stats())
+            raise
+
+        finally:
+            self.waiting -= 1
+
+        self.peak_checked_out = max(self.peak_checked_out, self.checkedout())
+        return connection
+
+    def get_stats(self) -> PoolStats:
+        return PoolStats(
+            size=self.size(),
+            checked_out=self.checkedout(),
+            peak_checked_out=self.peak_checked_out,
+            waiting=self.waiting,
+            timeouts=self.timeouts,
+        )
+
+
+class ConnectionBudget:
+    """Splits a deployment wide connection budget of one postgres server between processes and their engines"""
+
+    __slots__ = ("_processes", "_total")
+
+    def __init__(self, total: int, processes: int) -> None:
+        self._total = total
+        self._processes = processes
+
+    def get_pool_size(self, share: float) -> int:
+        pool_size = floor(self._total / self._processes * share)
+
+        if pool_size < 1:
+            logger.warning(
+                "Connection budget %s is too small for %s processes, share %s gets 1 connection",
+                self._total,
+                self._processes,
+                share,
+            )
+            return 1
+
+        return pool_size
+
+    def create_engine(self, url: str, share: float, pool_timeout: float) -> AsyncEngine:
+        return create_async_engine(
+            url=url,
+            echo=False,
+            pool_pre_ping=True,
+            poolclass=BudgetedQueuePool,
+            pool_size=self.get_pool_size(share),
+            max_overflow=0,
+            pool_timeout=pool_timeout,
+            pool_recycle=3600,
+        )
+
+
+def get_engine_pool_stats(engine: AsyncEngine) -> PoolStats | None:
+    pool = engine.sync_engine.pool
+    return pool.get_stats() if isinstance(pool, BudgetedQueuePool) else None
@@ -2,7 +2,7 @@ from datetime import date
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -15,6 +15,10 @@ if TYPE_CHECKING:
 
 class ProjectModel(SQLAlchemyTimedBaseModel):
     __tablename__ = "project"
+    __table_args__ = (
+        Index("ix_project_created_at_guid", "created_at", "guid"),
+        Index("ix_project_updated_at_guid", "updated_at", "guid"),
+    )
     # main data
     title: Mapped[str] = mapped_column(String(256))
     description: Mapped[str] = mapped_column(Text)
@@ -23,8 +27,8 @@ class ProjectModel(SQLAlchemyTimedBaseModel):
     start_date: Mapped[date]
     constraint_date: Mapped[date]
     # foreign keys
-    creator_guid: Mapped[UUID] = mapped_column(ForeignKey("user.guid"))
-    mentor_guid: Mapped[UUID | None] = mapped_column(ForeignKey("user.guid"))
+    creator_guid: Mapped[UUID] = mapped_column(ForeignKey("user.guid"), index=True)
+    mentor_guid: Mapped[UUID | None] = mapped_column(ForeignKey("user.guid"), index=True)
     # relations
     creator: Mapped["UserModel"] = relationship(
         back_populates="created_projects",
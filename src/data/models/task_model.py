@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.data.models.sqlalchemy_timed_base import SQLAlchemyTimedBaseModel
@@ -13,13 +13,14 @@ if TYPE_CHECKING:
 
 class TaskModel(SQLAlchemyTimedBaseModel):
     __tablename__ = "task"
+    __table_args__ = (Index("ix_task_project_guid_created_at", "project_guid", "created_at"),)
     # main data
     title: Mapped[str] = mapped_column(String(256))
     description: Mapped[str] = mapped_column(Text)
     is_completed: Mapped[bool]
     # foreign keys
     project_guid: Mapped[UUID] = mapped_column(ForeignKey("project.guid"))
-    executor_guid: Mapped[UUID] = mapped_column(ForeignKey("user.guid"))
+    executor_guid: Mapped[UUID] = mapped_column(ForeignKey("user.guid"), index=True)
     # relations
     project: Mapped["ProjectModel"] = relationship(back_populates="tasks")
     executor: Mapped["UserModel"] = relationship(back_populates="tasks")
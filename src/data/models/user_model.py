@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String
+from sqlalchemy import Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.data.models.sqlalchemy_timed_base import SQLAlchemyTimedBaseModel
@@ -13,6 +13,10 @@ if TYPE_CHECKING:
 
 class UserModel(SQLAlchemyTimedBaseModel):
     __tablename__ = "user"
+    __table_args__ = (
+        Index("ix_user_created_at_guid", "created_at", "guid", postgresql_where=text("is_deleted = false")),
+        Index("ix_user_updated_at_guid", "updated_at", "guid", postgresql_where=text("is_deleted = false")),
+    )
     # main data
     username: Mapped[str] = mapped_column(String(128), index=True, unique=True)
     email: Mapped[str] = mapped_column(String(128), index=True, unique=True)
@@ -0,0 +1,48 @@
+import zlib
+from enum import IntEnum
+from logging import getLogger
+from typing import Any
+
+import orjson
+
+logger = getLogger()
+
+
+class CacheCodecHeader(IntEnum):
+    ORJSON = 1
+    ZLIB_ORJSON = 2
+
+
+class CacheValueCodec:
+    """Encodes cache values as orjson and compresses only payloads above the threshold.
+
+    The first byte of every value records its codec, so codecs can change without flushing the cache.
+    """
+
+    __slots__ = ("_compress_level", "_compress_threshold")
+
+    def __init__(self, compress_threshold: int, compress_level: int = zlib.Z_DEFAULT_COMPRESSION) -> None:
+        self._compress_threshold = compress_threshold
+        self._compress_level = compress_level
+
+    def encode(self, value: Any) -> bytes:
+        payload = orjson.dumps(value)
+
+        if len(payload) < self._compress_threshold:
+            return CacheCodecHeader.ORJSON.to_bytes() + payload
+
+        return CacheCodecHeader.ZLIB_ORJSON.to_bytes() + zlib.compress(payload, self._compress_level)
+
+    def decode(self, data: bytes) -> Any | None:
+        """Returns None for values in an unknown format, they are treated as cache misses"""
+
+        header, payload = data[:1], memoryview(data)[1:]
+
+        match int.from_bytes(header):
+            case CacheCodecHeader.ORJSON:
+                return orjson.loads(payload)
+            case CacheCodecHeader.ZLIB_ORJSON:
+                return orjson.loads(zlib.decompress(payload))
+            case _:
+                logger.warning("Unknown cache value header %r", header)
+                return None
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Any
 from uuid import UUID
 
+from src.domain.common.entities import ListCursor, RenderedList
 from src.domain.project.entities import Project
 
 
@@ -12,12 +14,22 @@ class AbstractProjectRepository(ABC):
         offset: int,
         order_by: str,
         reverse: bool,
+        after: ListCursor | None,
     ) -> list[Project]: ...
     @abstractmethod
+    async def get_list_rendered(
+        self,
+        limit: int,
+        offset: int,
+        order_by: str,
+        reverse: bool,
+        after: ListCursor | None,
+    ) -> RenderedList: ...
+    @abstractmethod
     async def get_one_by_guid(self, guid: UUID) -> Project: ...
     @abstractmethod
     async def create_one(self, project: Project) -> UUID: ...
     @abstractmethod
-    async def patch_one(self, project: Project) -> UUID: ...
+    async def patch_one(self, guid: UUID, values: dict[str, Any]) -> UUID: ...
     @abstractmethod
     async def delete_one(self, project: Project) -> UUID: ...
@@ -1,18 +1,16 @@
+from dataclasses import fields
+from typing import Any, Final
+
+from sqlalchemy import ColumnElement, Row
+
 from src.data.models.project_model import ProjectModel
 from src.domain.project.entities import Project
 
+# table columns in the order of the entity fields, rows of them unpack straight into the entity
+PROJECT_COLUMNS: Final[tuple[ColumnElement[Any], ...]] = tuple(
+    ProjectModel.__table__.c[field.name] for field in fields(Project)
+)
+
 
-def convert_project_model_to_entity(model: ProjectModel) -> Project:
-    return Project(
-        guid=model.guid,
-        title=model.title,
-        description=model.description,
-        tech_stack=model.tech_stack,
-        additional_metadata=model.additional_metadata,
-        start_date=model.start_date,
-        constraint_date=model.constraint_date,
-        creator_guid=model.creator_guid,
-        mentor_guid=model.mentor_guid,
-        created_at=model.created_at,
-        updated_at=model.updated_at,
-    )
+def convert_project_row_to_entity(row: Row[Any]) -> Project:
+    return Project(*row)
@@ -1,13 +1,15 @@
 from dataclasses import asdict
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, desc, insert, select, update
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
 from src.data.models.project_model import ProjectModel
 from src.data.repositories.project.base import AbstractProjectRepository
-from src.data.repositories.project.converters import convert_project_model_to_entity
+from src.data.repositories.project.converters import PROJECT_COLUMNS, convert_project_row_to_entity
 from src.data.repositories.sqlalchemy_base import SQLAlchemyRepository
+from src.domain.common.entities import ListCursor, RenderedList
 from src.domain.project.entities import Project
 from src.domain.project.exc import ProjectInvalidDataError, ProjectNotFoundError
 
@@ -21,27 +23,35 @@ class SQLAlchemyProjectRepository(AbstractProjectRepository, SQLAlchemyRepositor
         offset: int,
         order_by: str,
         reverse: bool,
+        after: ListCursor | None,
     ) -> list[Project]:
-        stmt = select(ProjectModel).offset(offset).limit(limit)
-
-        if reverse:
-            stmt = stmt.order_by(desc(order_by))
-        else:
-            stmt = stmt.order_by(order_by)
+        stmt = self._paginate(select(*PROJECT_COLUMNS), ProjectModel.__table__, limit, offset, order_by, reverse, after)
 
         async with self._get_session() as session:
             res = await session.execute(stmt)
-            project_models_seq = res.scalars().all()
-            return [convert_project_model_to_entity(model) for model in project_models_seq]
+            return [convert_project_row_to_entity(row) for row in res]
+
+    async def get_list_rendered(
+        self,
+        limit: int,
+        offset: int,
+        order_by: str,
+        reverse: bool,
+        after: ListCursor | None,
+    ) -> RenderedList:
+        project_table = ProjectModel.__table__
+        rows = self._paginate(select(*PROJECT_COLUMNS), project_table, limit, offset, order_by, reverse, after)
+
+        async with self._get_session() as session:
+            return await self._render_json_list(session, rows.subquery(), order_by, reverse)
 
     async def get_one_by_guid(self, guid: UUID) -> Project:
-        stmt = select(ProjectModel).where(ProjectModel.guid == guid)
+        stmt = select(*PROJECT_COLUMNS).where(ProjectModel.__table__.c.guid == guid)
 
         try:
             async with self._get_session() as session:
                 res = await session.execute(stmt)
-                project_model = res.scalars().one()
-                return convert_project_model_to_entity(project_model)
+                return convert_project_row_to_entity(res.one())
 
         except NoResultFound as e:
             msg = f"Project {guid} not found"
@@ -53,25 +63,20 @@ class SQLAlchemyProjectRepository(AbstractProjectRepository, SQLAlchemyRepositor
         try:
             async with self._get_session() as session:
                 res = await session.execute(stmt)
-                await session.commit()
+                await self._commit(session)
                 return res.scalars().one()
 
         except IntegrityError as e:
             msg = f"Error while adding project: {e!r}"
             raise ProjectInvalidDataError(msg) from e
 
-    async def patch_one(self, project: Project) -> UUID:
-        stmt = (
-            update(ProjectModel)
-            .where(ProjectModel.guid == project.guid)
-            .values(asdict(project))
-            .returning(ProjectModel.guid)
-        )
+    async def patch_one(self, guid: UUID, values: dict[str, Any]) -> UUID:
+        stmt = update(ProjectModel).where(ProjectModel.guid == guid).values(values).returning(ProjectModel.guid)
 
         try:
             async with self._get_session() as session:
                 res = await session.execute(stmt)
-                await session.commit()
+                await self._commit(session)
                 return res.scalars().one()
 
         except IntegrityError as e:
@@ -84,7 +89,7 @@ class SQLAlchemyProjectRepository(AbstractProjectRepository, SQLAlchemyRepositor
         try:
             async with self._get_session() as session:
                 res = await session.execute(stmt)
-                await session.commit()
+                await self._commit(session)
                 return res.scalars().one()
 
         except IntegrityError as e:
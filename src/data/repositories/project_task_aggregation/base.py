@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
-from src.domain.project_task_aggregation.entities import ProjectTaskAggregation
+from src.domain.project_task_aggregation.entities import ProjectTaskAggregation, ProjectTaskAggregationVersion
 
 
 class AbstractProjectTaskAggregationRepository(ABC):
     @abstractmethod
     async def get_one_project_with_tasks_by_guid(self, project_guid: UUID) -> ProjectTaskAggregation: ...
+    @abstractmethod
+    async def get_version_by_project_guid(self, project_guid: UUID) -> ProjectTaskAggregationVersion: ...
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.domain.project_task_aggregation.entities import ProjectTaskAggregationVersion
+
+
+class AbstractProjectReportCacheRepository(ABC):
+    @abstractmethod
+    async def add_one(self, project_guid: UUID, version: ProjectTaskAggregationVersion, report: str) -> None: ...
+    @abstractmethod
+    async def get_one(self, project_guid: UUID, version: ProjectTaskAggregationVersion) -> str | None: ...
@@ -0,0 +1,41 @@
+from datetime import timedelta
+from uuid import UUID
+
+from redis.asyncio import Redis as AsyncRedis
+
+from src.data.repositories.cache_codec import CacheValueCodec
+from src.data.repositories.project_task_aggregation.cache_base import AbstractProjectReportCacheRepository
+from src.domain.project_task_aggregation.entities import ProjectTaskAggregationVersion
+
+
+class RedisProjectReportCacheRepository(AbstractProjectReportCacheRepository):
+    """Reports are keyed by the project version, a project or task mutation makes the old report unreachable
+    and it expires with the ttl
+    """
+
+    __slots__ = ("_codec", "_key", "_redis", "_ttl")
+
+    def __init__(self, redis: AsyncRedis, codec: CacheValueCodec, ttl: timedelta) -> None:
+        self._redis = redis
+        self._codec = codec
+        self._ttl = ttl
+        self._key = "cache:project_report:{guid}:{project_updated_at}:{tasks_updated_at}:{task_count}"
+
+    def _get_key(self, project_guid: UUID, version: ProjectTaskAggregationVersion) -> str:
+        return self._key.format(
+            guid=project_guid,
+            project_updated_at=version.project_updated_at.isoformat(),
+            tasks_updated_at=version.tasks_updated_at.isoformat() if version.tasks_updated_at else "",
+            task_count=version.task_count,
+        )
+
+    async def add_one(self, project_guid: UUID, version: ProjectTaskAggregationVersion, report: str) -> None:
+        await self._redis.set(self._get_key(project_guid, version), self._codec.encode(report), ex=self._ttl)
+
+    async def get_one(self, project_guid: UUID, version: ProjectTaskAggregationVersion) -> str | None:
+        res: bytes | None = await self._redis.get(self._get_key(project_guid, version))  # type: ignore
+
+        if res is None:
+            return None
+
+        return self._codec.decode(res)
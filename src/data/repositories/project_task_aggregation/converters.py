@@ -1,13 +1,18 @@
-from src.data.models.project_model import ProjectModel
-from src.data.repositories.project.converters import convert_project_model_to_entity
-from src.data.repositories.task.converters import convert_task_model_to_entity
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Row
+
+from src.data.repositories.project.converters import convert_project_row_to_entity
+from src.data.repositories.task.converters import convert_task_row_to_entity
 from src.domain.project_task_aggregation.entities import ProjectTaskAggregation
 
 
-def convert_project_task_aggregation_model_to_entity(
-    model: ProjectModel,
+def convert_project_task_aggregation_rows_to_entity(
+    project_row: Row[Any],
+    task_rows: Sequence[Row[Any]],
 ) -> ProjectTaskAggregation:
     return ProjectTaskAggregation(
-        project=convert_project_model_to_entity(model),
-        tasks=[convert_task_model_to_entity(task_model) for task_model in model.tasks],
+        project=convert_project_row_to_entity(project_row),
+        tasks=[convert_task_row_to_entity(task_row) for task_row in task_rows],
     )
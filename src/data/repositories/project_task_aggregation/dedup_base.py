@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+from src.domain.project.entities import ProjectReportData
+from src.domain.project_task_aggregation.enums import ProjectReportDedupStage
+
+
+class AbstractProjectReportDedupRepository(ABC):
+    @abstractmethod
+    async def add_claim(
+        self,
+        stage: ProjectReportDedupStage,
+        report_data: ProjectReportData,
+        claim_id: str,
+    ) -> bool: ...
+    @abstractmethod
+    async def delete_claim(self, stage: ProjectReportDedupStage, report_data: ProjectReportData) -> None: ...
+    @abstractmethod
+    async def add_done(self, stage: ProjectReportDedupStage, report_data: ProjectReportData) -> None: ...
+    @abstractmethod
+    async def exists_done(self, stage: ProjectReportDedupStage, report_data: ProjectReportData) -> bool: ...
@@ -0,0 +1,53 @@
+from datetime import timedelta
+from hashlib import sha256
+
+from redis.asyncio import Redis as AsyncRedis
+
+from src.data.repositories.project_task_aggregation.dedup_base import AbstractProjectReportDedupRepository
+from src.domain.project.entities import ProjectReportData
+from src.domain.project_task_aggregation.enums import ProjectReportDedupStage
+
+
+class RedisProjectReportDedupRepository(AbstractProjectReportDedupRepository):
+    """A report is a duplicate for `ttl` after it was done at a stage. While it is being done, a claim that
+    expires after `claim_ttl` keeps other copies out, so a claim left by a killed process does not block it for long
+    """
+
+    __slots__ = ("_claim_ttl", "_key", "_redis", "_ttl")
+
+    def __init__(self, redis: AsyncRedis, ttl: timedelta, claim_ttl: timedelta) -> None:
+        self._redis = redis
+        self._ttl = ttl
+        self._claim_ttl = claim_ttl
+        self._key = "dedup:project_report:{stage}:{state}:{payload_hash}"
+
+    def _get_key(self, stage: ProjectReportDedupStage, state: str, report_data: ProjectReportData) -> str:
+        payload = f"{report_data.project_guid}:{report_data.email}"
+        return self._key.format(stage=stage, state=state, payload_hash=sha256(payload.encode()).hexdigest())
+
+    async def add_claim(self, stage: ProjectReportDedupStage, report_data: ProjectReportData, claim_id: str) -> bool:
+        key = self._get_key(stage, "claim", report_data)
+
+        # set only by the first of concurrent copies
+        if await self._redis.set(key, claim_id, nx=True, ex=self._claim_ttl):
+            return True
+
+        # a retry of the same attempt, e.g. a redelivery after a crash, takes its claim over
+        if await self._redis.get(key) == claim_id.encode():
+            await self._redis.expire(key, self._claim_ttl)
+            return True
+
+        return False
+
+    async def delete_claim(self, stage: ProjectReportDedupStage, report_data: ProjectReportData) -> None:
+        await self._redis.delete(self._get_key(stage, "claim", report_data))
+
+    async def add_done(self, stage: ProjectReportDedupStage, report_data: ProjectReportData) -> None:
+        # the done key is visible before the claim is gone, so a copy that gets the claim next sees it
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._get_key(stage, "done", report_data), b"", ex=self._ttl)
+            pipe.delete(self._get_key(stage, "claim", report_data))
+            await pipe.execute()
+
+    async def exists_done(self, stage: ProjectReportDedupStage, report_data: ProjectReportData) -> bool:
+        return bool(await self._redis.exists(self._get_key(stage, "done", report_data)))
@@ -1,27 +1,54 @@
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import selectinload
 
 from src.data.models.project_model import ProjectModel
+from src.data.models.task_model import TaskModel
+from src.data.repositories.project.converters import PROJECT_COLUMNS
 from src.data.repositories.project_task_aggregation.base import AbstractProjectTaskAggregationRepository
-from src.data.repositories.project_task_aggregation.converters import convert_project_task_aggregation_model_to_entity
+from src.data.repositories.project_task_aggregation.converters import convert_project_task_aggregation_rows_to_entity
 from src.data.repositories.sqlalchemy_base import SQLAlchemyRepository
+from src.data.repositories.task.converters import TASK_COLUMNS
 from src.domain.project.exc import ProjectNotFoundError
-from src.domain.project_task_aggregation.entities import ProjectTaskAggregation
+from src.domain.project_task_aggregation.entities import ProjectTaskAggregation, ProjectTaskAggregationVersion
 
 
 class SQLAlchemyProjectTaskAggregationRepository(AbstractProjectTaskAggregationRepository, SQLAlchemyRepository):
     __slots__ = ("_session_factory",)
 
     async def get_one_project_with_tasks_by_guid(self, project_guid: UUID) -> ProjectTaskAggregation:
-        stmt = select(ProjectModel).where(ProjectModel.guid == project_guid).options(selectinload(ProjectModel.tasks))
+        project_table, task_table = ProjectModel.__table__, TaskModel.__table__
+        project_stmt = select(*PROJECT_COLUMNS).where(project_table.c.guid == project_guid)
+        # newest first like the project tasks relationship, read from ix_task_project_guid_created_at
+        tasks_stmt = (
+            select(*TASK_COLUMNS)
+            .where(task_table.c.project_guid == project_guid)
+            .order_by(task_table.c.created_at.desc())
+        )
+        try:
+            async with self._get_session() as session:
+                project_res = await session.execute(project_stmt)
+                project_row = project_res.one()
+                tasks_res = await session.execute(tasks_stmt)
+                return convert_project_task_aggregation_rows_to_entity(project_row, tasks_res.all())
+
+        except NoResultFound as e:
+            msg = f"Project {project_guid} not found"
+            raise ProjectNotFoundError(msg) from e
+
+    async def get_version_by_project_guid(self, project_guid: UUID) -> ProjectTaskAggregationVersion:
+        project_table, task_table = ProjectModel.__table__, TaskModel.__table__
+        stmt = (
+            select(project_table.c.updated_at, func.max(task_table.c.updated_at), func.count(task_table.c.guid))
+            .select_from(project_table.outerjoin(task_table, task_table.c.project_guid == project_table.c.guid))
+            .where(project_table.c.guid == project_guid)
+            .group_by(project_table.c.guid)
+        )
         try:
             async with self._get_session() as session:
                 res = await session.execute(stmt)
-                project_model = res.scalars().one()
-                return convert_project_task_aggregation_model_to_entity(project_model)
+                return ProjectTaskAggregationVersion(*res.one())
 
         except NoResultFound as e:
             msg = f"Project {project_guid} not found"
@@ -1,8 +1,45 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from itertools import chain
+from typing import Any, Final
+from uuid import UUID
 
+import orjson
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    FromClause,
+    Select,
+    Subquery,
+    Text,
+    case,
+    cast,
+    extract,
+    func,
+    literal,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from src.data.repositories.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from src.domain.common.entities import ListCursor, RenderedList
+
+_JSON_TIMESTAMP_FORMAT: Final[str] = 'YYYY-MM-DD"T"HH24:MI:SS'
+_JSON_TIMESTAMP_US_FORMAT: Final[str] = 'YYYY-MM-DD"T"HH24:MI:SS.US'
+
+
+def _to_json_value(column: ColumnElement[Any]) -> ColumnElement[Any]:
+    if not isinstance(column.type, DateTime):
+        return column
+
+    # the same text pydantic serializes naive datetimes to, postgres trims trailing zeros of microseconds
+    return case(
+        (extract("microseconds", column) % 1_000_000 == 0, func.to_char(column, _JSON_TIMESTAMP_FORMAT)),
+        else_=func.to_char(column, _JSON_TIMESTAMP_US_FORMAT),
+    )
+
 
 class SQLAlchemyRepository:
     def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
@@ -10,5 +47,79 @@ class SQLAlchemyRepository:
 
     @asynccontextmanager
     async def _get_session(self) -> AsyncGenerator[AsyncSession, None]:
+        unit_of_work = SQLAlchemyUnitOfWork.get_current()
+
+        if unit_of_work is not None:
+            yield unit_of_work.get_session(self._session_factory)
+            return
+
         async with self._session_factory() as session:
             yield session
+
+    @staticmethod
+    async def _commit(session: AsyncSession) -> None:
+        """Sessions of a unit of work are committed once when it exits"""
+
+        unit_of_work = SQLAlchemyUnitOfWork.get_current()
+
+        if unit_of_work is None or not unit_of_work.owns_session(session):
+            await session.commit()
+
+    @staticmethod
+    def _get_ordering(table: FromClause, order_by: str, reverse: bool) -> tuple[ColumnElement[Any], ...]:
+        if reverse:
+            return table.c[order_by].desc(), table.c.guid.desc()
+
+        return table.c[order_by], table.c.guid
+
+    @classmethod
+    def _paginate[T: tuple[Any, ...]](
+        cls,
+        stmt: Select[T],
+        table: FromClause,
+        limit: int,
+        offset: int,
+        order_by: str,
+        reverse: bool,
+        after: ListCursor | None,
+    ) -> Select[T]:
+        """Orders by (order_by, guid), with a cursor seeks past the previous page instead of scanning it"""
+
+        if after is not None:
+            keyset = tuple_(table.c[order_by], table.c.guid)
+            after_keyset = (after.value, after.guid)
+            stmt = stmt.where(keyset < after_keyset if reverse else keyset > after_keyset)
+
+        return stmt.order_by(*cls._get_ordering(table, order_by, reverse)).offset(offset).limit(limit)
+
+    @classmethod
+    async def _render_json_list(
+        cls,
+        session: AsyncSession,
+        rows: Subquery,
+        order_by: str,
+        reverse: bool,
+    ) -> RenderedList:
+        """Aggregates the ordered rows into one JSON array of objects keyed by column names in postgres"""
+
+        ordering = cls._get_ordering(rows, order_by, reverse)
+        json_object = func.json_build_object(
+            *chain.from_iterable((literal(column.name, Text), _to_json_value(column)) for column in rows.c),
+        )
+        last_key = func.json_build_array(_to_json_value(rows.c[order_by]), rows.c.guid)
+        stmt = select(
+            # json is cast to text, otherwise the driver parses it into python objects
+            cast(func.json_agg(aggregate_order_by(json_object, *ordering)), Text),
+            func.count(),
+            cast(func.array_agg(aggregate_order_by(last_key, *ordering))[func.count()], Text),
+        )
+
+        res = await session.execute(stmt)
+        content, count, last_key_json = res.one()
+
+        if not count:
+            return RenderedList(content=b"[]", count=0, last=None)
+
+        last_value, last_guid = orjson.loads(last_key_json)
+        last = ListCursor(value=last_value, guid=UUID(last_guid))
+        return RenderedList(content=content.encode(), count=count, last=last)
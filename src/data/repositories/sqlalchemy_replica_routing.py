@@ -0,0 +1,121 @@
+from collections.abc import Callable, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import partial
+from itertools import count
+from typing import Any, Final
+from uuid import UUID
+
+from redis.asyncio import Redis as AsyncRedis
+from sqlalchemy import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ClauseElement
+
+from src.data.repositories.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+
+_RECENT_WRITER_KEY_PREFIX: Final[str] = "db:recent_writer:"
+
+
+class ReplicaBalancing(StrEnum):
+    ROUND_ROBIN = "round_robin"
+    LEAST_CONNECTIONS = "least_connections"
+
+
+class ReplicaPool:
+    __slots__ = ("_balancing", "_counter", "_engines")
+
+    def __init__(self, engines: Sequence[AsyncEngine], balancing: ReplicaBalancing) -> None:
+        self._engines = tuple(engine.sync_engine for engine in engines)
+        self._balancing = balancing
+        self._counter = count()
+
+    def __bool__(self) -> bool:
+        return bool(self._engines)
+
+    def pick(self) -> Engine:
+        if self._balancing == ReplicaBalancing.LEAST_CONNECTIONS:
+            return min(self._engines, key=lambda engine: engine.pool.checkedout())  # type: ignore
+
+        return self._engines[next(self._counter) % len(self._engines)]
+
+
+@dataclass(slots=True)
+class _ReadRoutingState:
+    use_primary: bool
+    on_first_write: Callable[[], None]
+    has_written: bool = False
+
+
+_read_routing_state: ContextVar[_ReadRoutingState | None] = ContextVar("_read_routing_state", default=None)
+
+
+class ReplicaRoutingSession(Session):
+    """Sends SELECTs to a replica unless the session has written, the request sticks to the primary
+    or the statement is executed with `bind_arguments={"use_primary": True}`
+    """
+
+    def __init__(self, *args: Any, replica_pool: ReplicaPool | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._replica_pool = replica_pool
+        self._has_written = False
+
+    def _mark_written(self) -> None:
+        self._has_written = True
+        state = _read_routing_state.get()
+
+        if state is not None and not state.has_written:
+            state.has_written = state.use_primary = True
+            state.on_first_write()
+
+    def get_bind(
+        self,
+        mapper: Any = None,
+        *,
+        clause: ClauseElement | None = None,
+        use_primary: bool = False,
+        **kwargs: Any,
+    ) -> Engine | Connection:
+        if clause is None or not getattr(clause, "is_select", False):
+            self._mark_written()
+
+        elif self._replica_pool and not use_primary and not self._has_written:
+            state = _read_routing_state.get()
+            if state is None or not state.use_primary:
+                return self._replica_pool.pick()
+
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+class ReadYourWritesTracker:
+    """Keeps reads of a user on the primary for a while after their request wrote, across workers"""
+
+    __slots__ = ("_enabled", "_redis", "_window_ms")
+
+    def __init__(self, redis: AsyncRedis, window: float, enabled: bool) -> None:
+        self._redis = redis
+        self._window_ms = int(window * 1000)
+        self._enabled = enabled
+
+    @staticmethod
+    def _get_key(user_guid: UUID) -> str:
+        return f"{_RECENT_WRITER_KEY_PREFIX}{user_guid}"
+
+    async def bind_user(self, user_guid: UUID) -> None:
+        if not self._enabled:
+            return
+
+        use_primary = bool(await self._redis.exists(self._get_key(user_guid)))
+        _read_routing_state.set(
+            _ReadRoutingState(use_primary=use_primary, on_first_write=partial(self._on_first_write, user_guid)),
+        )
+
+    def _on_first_write(self, user_guid: UUID) -> None:
+        unit_of_work = SQLAlchemyUnitOfWork.get_current()
+
+        if unit_of_work is not None:
+            unit_of_work.add_after_commit_callback(partial(self._mark_recent_writer, user_guid))
+
+    async def _mark_recent_writer(self, user_guid: UUID) -> None:
+        await self._redis.set(self._get_key(user_guid), 1, px=self._window_ms)
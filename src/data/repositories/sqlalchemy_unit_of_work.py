@@ -0,0 +1,78 @@
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Self
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+_current_unit_of_work: ContextVar["SQLAlchemyUnitOfWork | None"] = ContextVar("_current_unit_of_work", default=None)
+
+
+class SQLAlchemyUnitOfWork:
+    """Repository calls made inside `begin()` share one session per session factory, committed once on exit"""
+
+    __slots__ = ("_after_commit_callbacks", "_sessions")
+
+    def __init__(self) -> None:
+        self._sessions: dict[async_sessionmaker[AsyncSession], AsyncSession] = {}
+        self._after_commit_callbacks: list[Callable[[], Awaitable[None]]] = []
+
+    @classmethod
+    def get_current(cls) -> Self | None:
+        return _current_unit_of_work.get()  # type: ignore
+
+    @classmethod
+    @asynccontextmanager
+    async def begin(cls) -> AsyncGenerator[Self, None]:
+        current_unit_of_work = cls.get_current()
+
+        if current_unit_of_work is not None:
+            yield current_unit_of_work
+            return
+
+        unit_of_work = cls()
+        token = _current_unit_of_work.set(unit_of_work)
+        try:
+            yield unit_of_work
+            await unit_of_work._commit()
+
+        finally:
+            _current_unit_of_work.reset(token)
+            await unit_of_work._close()
+
+        for callback in unit_of_work._after_commit_callbacks:
+            await callback()
+
+    @classmethod
+    async def run_after_commit(cls, callback: Callable[[], Awaitable[None]]) -> None:
+        """Defers the callback until the current unit of work commits, runs it at once outside of one"""
+
+        current_unit_of_work = cls.get_current()
+
+        if current_unit_of_work is None:
+            await callback()
+        else:
+            current_unit_of_work.add_after_commit_callback(callback)
+
+    def add_after_commit_callback(self, callback: Callable[[], Awaitable[None]]) -> None:
+        self._after_commit_callbacks.append(callback)
+
+    def get_session(self, session_factory: async_sessionmaker[AsyncSession]) -> AsyncSession:
+        session = self._sessions.get(session_factory)
+
+        if session is None:
+            # the connection is checked out lazily on the first statement
+            session = self._sessions[session_factory] = session_factory()
+
+        return session
+
+    def owns_session(self, session: AsyncSession) -> bool:
+        return any(session is owned_session for owned_session in self._sessions.values())
+
+    async def _commit(self) -> None:
+        for session in self._sessions.values():
+            await session.commit()
+
+    async def _close(self) -> None:
+        for session in self._sessions.values():
+            await session.close()
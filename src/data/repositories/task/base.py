@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
 from uuid import UUID
 
+from src.domain.common.entities import RenderedList
 from src.domain.task.entities import Task
 
 
@@ -8,10 +11,14 @@ class AbstractTaskRepository(ABC):
     @abstractmethod
     async def get_list_by_project_guid(self, project_guid: UUID) -> list[Task]: ...
     @abstractmethod
+    async def get_list_rendered_by_project_guid(self, project_guid: UUID) -> RenderedList: ...
+    @abstractmethod
     async def get_one_by_guid(self, guid: UUID) -> Task: ...
     @abstractmethod
     async def create_one(self, task: Task) -> UUID: ...
     @abstractmethod
-    async def patch_one(self, task: Task) -> UUID: ...
+    async def create_many(self, tasks: Sequence[Task]) -> list[UUID]: ...
+    @abstractmethod
+    async def patch_one(self, project_guid: UUID, guid: UUID, values: dict[str, Any]) -> UUID: ...
     @abstractmethod
-    async def delete_one(self, task: Task) -> UUID: ...
+    async def delete_one(self, project_guid: UUID, guid: UUID) -> UUID: ...
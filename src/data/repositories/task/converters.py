@@ -1,17 +1,16 @@
+from dataclasses import fields
+from typing import Any, Final
+
+from sqlalchemy import ColumnElement, Row
+
 from src.data.models.task_model import TaskModel
 from src.domain.task.entities import Task
 
+# table columns in the order of the entity fields, rows of them unpack straight into the entity
+TASK_COLUMNS: Final[tuple[ColumnElement[Any], ...]] = tuple(TaskModel.__table__.c[field.name] for field in fields(Task))
+
 
-def convert_task_model_to_entity(
-    model: TaskModel,
+def convert_task_row_to_entity(
+    row: Row[Any],
 ) -> Task:
-    return Task(
-        guid=model.guid,
-        created_at=model.created_at,
-        updated_at=model.updated_at,
-        title=model.title,
-        description=model.description,
-        is_completed=model.is_completed,
-        project_guid=model.project_guid,
-        executor_guid=model.executor_guid,
-    )
+    return Task(*row)
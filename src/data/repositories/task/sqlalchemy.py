@@ -1,36 +1,49 @@
+from collections.abc import Sequence
 from dataclasses import asdict
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy import delete, insert, select, update
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
 from src.data.models.task_model import TaskModel
+from src.data.models.user_model import UserModel
 from src.data.repositories.sqlalchemy_base import SQLAlchemyRepository
 from src.data.repositories.task.base import AbstractTaskRepository
-from src.data.repositories.task.converters import convert_task_model_to_entity
+from src.data.repositories.task.converters import TASK_COLUMNS, convert_task_row_to_entity
+from src.domain.common.entities import RenderedList
 from src.domain.task.entities import Task
-from src.domain.task.exc import TaskInvalidDataError, TaskNotFoundError
+from src.domain.task.exc import TaskBatchInvalidDataError, TaskInvalidDataError, TaskNotFoundError
 
 
 class SQLAlchemyTaskRepository(AbstractTaskRepository, SQLAlchemyRepository):
     __slots__ = ("_session_factory",)
 
     async def get_list_by_project_guid(self, project_guid: UUID) -> list[Task]:
-        stmt = select(TaskModel).where(TaskModel.project_guid == project_guid)
+        task_table = TaskModel.__table__
+        stmt = (
+            select(*TASK_COLUMNS)
+            .where(task_table.c.project_guid == project_guid)
+            .order_by(task_table.c.created_at.desc())
+        )
 
         async with self._get_session() as session:
             res = await session.execute(stmt)
-            task_model_seq = res.scalars().all()
-            return [convert_task_model_to_entity(task_model) for task_model in task_model_seq]
+            return [convert_task_row_to_entity(task_row) for task_row in res]
+
+    async def get_list_rendered_by_project_guid(self, project_guid: UUID) -> RenderedList:
+        rows = select(*TASK_COLUMNS).where(TaskModel.__table__.c.project_guid == project_guid)
+
+        async with self._get_session() as session:
+            return await self._render_json_list(session, rows.subquery(), "created_at", reverse=True)
 
     async def get_one_by_guid(self, guid: UUID) -> Task:
-        stmt = select(TaskModel).where(TaskModel.guid == guid)
+        stmt = select(*TASK_COLUMNS).where(TaskModel.__table__.c.guid == guid)
 
         try:
             async with self._get_session() as session:
                 res = await session.execute(stmt)
-                task_model = res.scalars().one()
-                return convert_task_model_to_entity(task_model)
+                return convert_task_row_to_entity(res.one())
 
         except NoResultFound as e:
             msg = f"Task {guid} not found"
@@ -42,35 +55,85 @@ class SQLAlchemyTaskRepository(AbstractTaskRepository, SQLAlchemyRepository):
         try:
             async with self._get_session() as session:
                 res = await session.execute(stmt)
-                await session.commit()
+                await self._commit(session)
                 return res.scalars().one()
 
         except IntegrityError as e:
             msg = f"Error while adding task {task.title}: {e!r}"
             raise TaskInvalidDataError(msg) from e
 
-    async def patch_one(self, task: Task) -> UUID:
-        stmt = update(TaskModel).where(TaskModel.guid == task.guid).values(asdict(task)).returning(TaskModel.guid)
+    async def create_many(self, tasks: Sequence[Task]) -> list[UUID]:
+        executor_guids = {task.executor_guid for task in tasks}
+        executors_stmt = select(UserModel.guid).where(UserModel.guid.in_(executor_guids))
+
+        try:
+            async with self._get_session() as session:
+                res = await session.execute(executors_stmt)
+                missing_executor_guids = executor_guids.difference(res.scalars().all())
+
+                if not missing_executor_guids:
+                    # a list of parameter sets is sent as multi-row inserts in one transaction
+                    await session.execute(insert(TaskModel), [asdict(task) for task in tasks])
+                    await self._commit(session)
+
+        except IntegrityError as e:
+            msg = f"Error while adding tasks: {e!r}"
+            raise TaskInvalidDataError(msg) from e
+
+        if missing_executor_guids:
+            msg = "Error while adding tasks: executors not found"
+            item_errors = {
+                i: f"Executor {task.executor_guid} not found"
+                for i, task in enumerate(tasks)
+                if task.executor_guid in missing_executor_guids
+            }
+            raise TaskBatchInvalidDataError(msg, item_errors)
+
+        return [task.guid for task in tasks]
+
+    async def patch_one(self, project_guid: UUID, guid: UUID, values: dict[str, Any]) -> UUID:
+        stmt = (
+            update(TaskModel)
+            .where(TaskModel.guid == guid, TaskModel.project_guid == project_guid)
+            .values(values)
+            .returning(TaskModel.guid)
+        )
 
         try:
             async with self._get_session() as session:
                 res = await session.execute(stmt)
-                await session.commit()
-                return res.scalars().one()
+                task_guid = res.scalars().one_or_none()
+                await self._commit(session)
 
         except IntegrityError as e:
-            msg = f"Error while patching task {task.guid}: {e!r}"
+            msg = f"Error while patching task {guid}: {e!r}"
             raise TaskInvalidDataError(msg) from e
 
-    async def delete_one(self, task: Task) -> UUID:
-        stmt = delete(TaskModel).where(TaskModel.guid == task.guid).returning(TaskModel.guid)
+        if task_guid is None:
+            msg = f"Project {project_guid} has no task {guid}"
+            raise TaskNotFoundError(msg)
+
+        return task_guid
+
+    async def delete_one(self, project_guid: UUID, guid: UUID) -> UUID:
+        stmt = (
+            delete(TaskModel)
+            .where(TaskModel.guid == guid, TaskModel.project_guid == project_guid)
+            .returning(TaskModel.guid)
+        )
 
         try:
             async with self._get_session() as session:
                 res = await session.execute(stmt)
-                await session.commit()
-                return res.scalars().one()
+                task_guid = res.scalars().one_or_none()
+                await self._commit(session)
 
         except IntegrityError as e:
-            msg = f"Error while deleting task {task.guid}: {e!r}"
+            msg = f"Error while deleting task {guid}: {e!r}"
             raise TaskInvalidDataError(msg) from e
+
+        if task_guid is None:
+            msg = f"Project {project_guid} has no task {guid}"
+            raise TaskNotFoundError(msg)
+
+        return task_guid
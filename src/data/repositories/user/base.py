@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Any
 from uuid import UUID
 
+from src.domain.common.entities import ListCursor
 from src.domain.user.entities import User
 
 
@@ -12,6 +14,7 @@ class AbstractUserRepository(ABC):
         limit: int,
         order_by: str,
         reverse: bool,
+        after: ListCursor | None,
     ) -> list[User]: ...
     @abstractmethod
     async def get_one_by_guid(self, guid: UUID) -> User: ...
@@ -20,4 +23,4 @@ class AbstractUserRepository(ABC):
     @abstractmethod
     async def create_one(self, user: User) -> UUID: ...
     @abstractmethod
-    async def patch_one(self, user: User) -> UUID: ...
+    async def patch_one(self, guid: UUID, values: dict[str, Any]) -> UUID: ...
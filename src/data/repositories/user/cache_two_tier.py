@@ -0,0 +1,99 @@
+import asyncio
+from contextlib import suppress
+from dataclasses import replace
+from logging import getLogger
+from time import time
+from typing import Final
+from uuid import UUID
+
+from redis.asyncio import Redis as AsyncRedis
+
+from src.common.ttl_lru_cache import CacheStats, TTLLRUCache
+from src.data.repositories.user.cache_redis import RedisUserCasheRepository
+from src.data.repositories.user.cashe_base import AbstractUserCacheRepository
+from src.domain.user.entities import User
+
+logger = getLogger()
+
+_INVALIDATION_CHANNEL: Final[str] = "cache:user:invalidate"
+_RESUBSCRIBE_DELAY_SECONDS: Final[float] = 1.0
+
+
+class TwoTierUserCacheRepository(AbstractUserCacheRepository):
+    """In-process LRU tier in front of the redis tier.
+
+    Deletions are broadcast over redis pub/sub, so every worker evicts its local copy.
+    """
+
+    __slots__ = ("_listener_task", "_local_cache", "_local_ttl", "_redis", "_redis_repository", "redis_stats")
+
+    def __init__(
+        self,
+        redis_repository: RedisUserCasheRepository,
+        redis: AsyncRedis,
+        local_max_size: int,
+        local_ttl: float,
+    ) -> None:
+        self._redis_repository = redis_repository
+        self._redis = redis
+        self._local_cache: TTLLRUCache[UUID, User] = TTLLRUCache(max_size=local_max_size)
+        self._local_ttl = local_ttl
+        self._listener_task: asyncio.Task[None] | None = None
+        self.redis_stats = CacheStats()
+
+    @property
+    def local_stats(self) -> CacheStats:
+        return self._local_cache.stats
+
+    async def add_one(self, user: User) -> None:
+        await self._redis_repository.add_one(user)
+        self._local_cache.set(user.guid, replace(user), expires_at=time() + self._local_ttl)
+
+    async def get_one(self, guid: UUID) -> User | None:
+        user = self._local_cache.get(guid)
+
+        if user is not None:
+            return replace(user)
+
+        user = await self._redis_repository.get_one(guid)
+
+        if user is None:
+            self.redis_stats.misses += 1
+            return None
+
+        self.redis_stats.hits += 1
+        self._local_cache.set(guid, replace(user), expires_at=time() + self._local_ttl)
+        return user
+
+    async def delete_one(self, guid: UUID) -> None:
+        self._local_cache.delete(guid)
+        await self._redis_repository.delete_one(guid)
+        await self._redis.publish(_INVALIDATION_CHANNEL, guid.bytes)
+
+    async def _listen_invalidations(self) -> None:
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(_INVALIDATION_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._local_cache.delete(UUID(bytes=message["data"]))
+
+            except Exception:
+                # invalidations could be missed until the listener resubscribes
+                logger.exception("User cache invalidation listener failed")
+                self._local_cache.clear()
+                await asyncio.sleep(_RESUBSCRIBE_DELAY_SECONDS)
+
+    def start_invalidation_listener(self) -> None:
+        if self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen_invalidations())
+
+    async def stop_invalidation_listener(self) -> None:
+        if self._listener_task is None:
+            return
+
+        self._listener_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._listener_task
+        self._listener_task = None
@@ -1,37 +1,28 @@
 from collections.abc import Mapping
+from dataclasses import fields
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Final
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Row
 
 from src.data.models.user_model import UserModel
 from src.domain.user.entities import User
 from src.domain.user.enums import UserGender
 
+# table columns in the order of the entity fields, rows of them unpack straight into the entity
+USER_COLUMNS: Final[tuple[ColumnElement[Any], ...]] = tuple(UserModel.__table__.c[field.name] for field in fields(User))
+
 
-def convert_user_model_to_entity(
-    user_model: UserModel,
+def convert_user_row_to_entity(
+    user_row: Row[Any],
 ) -> User:
-    if user_model.gender is not None:
-        gender = UserGender(user_model.gender)
-    else:
-        gender = None
+    user = User(*user_row)
 
-    return User(
-        guid=user_model.guid,
-        username=user_model.username,
-        email=user_model.email,
-        password=user_model.password,
-        first_name=user_model.first_name,
-        second_name=user_model.second_name,
-        gender=gender,
-        company=user_model.company,
-        join_date=user_model.join_date,
-        job_title=user_model.job_title,
-        date_of_birth=user_model.date_of_birth,
-        created_at=user_model.created_at,
-        updated_at=user_model.updated_at,
-        is_deleted=user_model.is_deleted,
-        deleted_at=user_model.deleted_at,
-    )
+    if user.gender is not None:
+        user.gender = UserGender(user.gender)
+
+    return user
 
 
 def convert_user_map_to_entity(
@@ -47,13 +38,18 @@ def convert_user_map_to_entity(
     else:
         join_date = None
 
+    if user_map.get("date_of_birth") is not None:
+        date_of_birth = date.fromisoformat(user_map["date_of_birth"])
+    else:
+        date_of_birth = None
+
     if user_map.get("deleted_at") is not None:
         deleted_at = datetime.fromisoformat(user_map["deleted_at"])
     else:
         deleted_at = None
 
     return User(
-        guid=user_map["guid"],
+        guid=UUID(user_map["guid"]),
         username=user_map["username"],
         email=user_map["email"],
         password=user_map["password"],
@@ -63,7 +59,7 @@ def convert_user_map_to_entity(
         company=user_map["company"],
         join_date=join_date,
         job_title=user_map["job_title"],
-        date_of_birth=user_map["date_of_birth"],
+        date_of_birth=date_of_birth,
         created_at=datetime.fromisoformat(user_map["created_at"]),
         updated_at=datetime.fromisoformat(user_map["updated_at"]),
         is_deleted=user_map["is_deleted"],
@@ -1,13 +1,15 @@
 from dataclasses import asdict
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import desc, insert, select, update
+from sqlalchemy import insert, select, update
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
 from src.data.models.user_model import UserModel
 from src.data.repositories.sqlalchemy_base import SQLAlchemyRepository
 from src.data.repositories.user.base import AbstractUserRepository
-from src.data.repositories.user.converters import convert_user_model_to_entity
+from src.data.repositories.user.converters import USER_COLUMNS, convert_user_row_to_entity
+from src.domain.common.entities import ListCursor
 from src.domain.user.entities import User
 from src.domain.user.exc import UserInvalidDataError, UserNotFoundError
 
@@ -21,40 +23,36 @@ class SQLAlchemyUserRepository(AbstractUserRepository, SQLAlchemyRepository):
         limit: int,
         order_by: str,
         reverse: bool,
+        after: ListCursor | None,
     ) -> list[User]:
-        stmt = select(UserModel).where(UserModel.is_deleted == False).offset(offset).limit(limit)  # noqa: E712
-
-        if reverse:
-            stmt = stmt.order_by(desc(order_by))
-        else:
-            stmt = stmt.order_by(order_by)
+        user_table = UserModel.__table__
+        stmt = select(*USER_COLUMNS).where(user_table.c.is_deleted == False)  # noqa: E712
+        stmt = self._paginate(stmt, user_table, limit, offset, order_by, reverse, after)
 
         async with self._get_session() as session:
             res = await session.execute(stmt)
-            user_model_seq = res.scalars().all()
-            return [convert_user_model_to_entity(user_model) for user_model in user_model_seq]
+            return [convert_user_row_to_entity(user_row) for user_row in res]
 
     async def get_one_by_guid(self, guid: UUID) -> User:
-        stmt = select(UserModel).where(UserModel.guid == guid)
+        stmt = select(*USER_COLUMNS).where(UserModel.__table__.c.guid == guid)
 
         try:
             async with self._get_session() as session:
-                res = await session.execute(stmt)
-                user_model = res.scalars().one()
-                return convert_user_model_to_entity(user_model)
+                # user lookups feed the user cache and auth, replication lag must not leak into them
+                res = await session.execute(stmt, bind_arguments={"use_primary": True})
+                return convert_user_row_to_entity(res.one())
 
         except NoResultFound as e:
             msg = f"User {guid} not found"
             raise UserNotFoundError(msg) from e
 
     async def get_one_by_username(self, username: str) -> User:
-        stmt = select(UserModel).where(UserModel.username == username)
+        stmt = select(*USER_COLUMNS).where(UserModel.__table__.c.username == username)
 
         try:
             async with self._get_session() as session:
-                res = await session.execute(stmt)
-                user_model = res.scalars().one()
-                return convert_user_model_to_entity(user_model)
+                res = await session.execute(stmt, bind_arguments={"use_primary": True})
+                return convert_user_row_to_entity(res.one())
 
         except NoResultFound as e:
             msg = f"User {username} not found"
@@ -66,22 +64,22 @@ class SQLAlchemyUserRepository(AbstractUserRepository, SQLAlchemyRepository):
         try:
             async with self._get_session() as session:
                 res = await session.execute(stmt)
-                await session.commit()
+                await self._commit(session)
                 return res.scalars().one()
 
         except IntegrityError as e:
             msg = f"Error while adding user {user.username}: {e!r}"
             raise UserInvalidDataError(msg) from e
 
-    async def patch_one(self, user: User) -> UUID:
-        stmt = update(UserModel).where(UserModel.guid == user.guid).values(asdict(user)).returning(UserModel.guid)
+    async def patch_one(self, guid: UUID, values: dict[str, Any]) -> UUID:
+        stmt = update(UserModel).where(UserModel.guid == guid).values(values).returning(UserModel.guid)
 
         try:
             async with self._get_session() as session:
                 res = await session.execute(stmt)
-                await session.commit()
+                await self._commit(session)
                 return res.scalars().one()
 
         except IntegrityError as e:
-            msg = f"Error while patching user {user.guid}: {e!r}"
+            msg = f"Error while patching user {guid}: {e!r}"
             raise UserInvalidDataError(msg) from e
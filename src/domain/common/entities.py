@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class ListCursor:
+    """Position after the last row of the previous page, ordered by (order_by value, guid)"""
+
+    value: Any
+    guid: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedList:
+    """JSON array of entities rendered by the database, `last` is the position of its last item"""
+
+    content: bytes
+    count: int
+    last: ListCursor | None
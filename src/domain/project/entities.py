@@ -45,3 +45,14 @@ class ProjectPatchData:
 class ProjectReportData:
     project_guid: UUID
     email: str
+
+
+@dataclass(slots=True)
+class ProjectReportRecipients:
+    project_guid: UUID
+    emails: list[str]
+
+
+@dataclass(slots=True)
+class ProjectReportBatchData:
+    reports: list[ProjectReportRecipients]
@@ -1,5 +1,6 @@
 from logging import getLogger
 
+from src.domain.common.entities import ListCursor
 from src.domain.project.entities import Project
 from src.services.project_service import ProjectService
 
@@ -18,6 +19,7 @@ class GetProjectListUseCase:
         limit: int,
         order_by: str,
         reverse: bool,
+        after: ListCursor | None,
     ) -> list[Project]:
-        logger.info("Getting project list with offset=%i and limit=%i", offset, limit)
-        return await self._project_service.get_list(limit, offset, order_by, reverse)
+        logger.info("Getting project list with offset=%i, limit=%i and after=%s", offset, limit, after)
+        return await self._project_service.get_list(limit, offset, order_by, reverse, after)
@@ -0,0 +1,24 @@
+from logging import getLogger
+
+from src.domain.common.entities import ListCursor, RenderedList
+from src.services.project_service import ProjectService
+
+logger = getLogger()
+
+
+class GetProjectListRenderedUseCase:
+    __slots__ = ("_project_service",)
+
+    def __init__(self, project_service: ProjectService) -> None:
+        self._project_service = project_service
+
+    async def execute(
+        self,
+        offset: int,
+        limit: int,
+        order_by: str,
+        reverse: bool,
+        after: ListCursor | None,
+    ) -> RenderedList:
+        logger.info("Getting rendered project list with offset=%i, limit=%i and after=%s", offset, limit, after)
+        return await self._project_service.get_list_rendered(limit, offset, order_by, reverse, after)
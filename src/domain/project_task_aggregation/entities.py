@@ -1,9 +1,19 @@
 from dataclasses import dataclass
+from datetime import datetime
 
 from src.domain.project.entities import Project
 from src.domain.task.entities import Task
 
 
+@dataclass(frozen=True, slots=True)
+class ProjectTaskAggregationVersion:
+    """Changes with every project or task mutation, the task count catches deletes of older tasks"""
+
+    project_updated_at: datetime
+    tasks_updated_at: datetime | None
+    task_count: int
+
+
 @dataclass(slots=True)
 class ProjectTaskAggregation:
     project: Project
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class ProjectReportDedupStage(StrEnum):
+    REQUEST = "request"
+    DELIVERY = "delivery"
@@ -0,0 +1,56 @@
+from typing import Final
+from uuid import UUID
+
+from src.common.single_flight import SingleFlight
+from src.domain.project_task_aggregation.entities import ProjectTaskAggregationVersion
+from src.infra.notifications.smtp import SMTPNotificationClient
+from src.services.project_task_aggregation_service import ProjectTaskAggregationService
+
+_REPORT_TEMPLATE_NAME: Final[str] = "project_report_email.html"
+
+
+class ProjectReportRenderSingleFlight(SingleFlight[tuple[UUID, ProjectTaskAggregationVersion], str]):
+    __slots__ = ()
+
+
+class GetProjectReportFlow:
+    """Returns the rendered report of the current project version, rendering it only on a cache miss"""
+
+    def __init__(
+        self,
+        notification_client: SMTPNotificationClient,
+        project_task_aggregation_service: ProjectTaskAggregationService,
+        project_report_render_single_flight: ProjectReportRenderSingleFlight,
+    ) -> None:
+        self._notification_client = notification_client
+        self._project_task_aggregation_service = project_task_aggregation_service
+        self._project_report_render_single_flight = project_report_render_single_flight
+
+    async def _render_report(self, project_guid: UUID) -> str:
+        aggregation = await self._project_task_aggregation_service.get_one_project_with_tasks_by_guid(project_guid)
+        report = await self._notification_client.render_email_body(
+            _REPORT_TEMPLATE_NAME,
+            project=aggregation.project,
+            tasks=aggregation.tasks,
+        )
+        # cached under the version that was rendered, it is newer than the checked one after a concurrent mutation
+        await self._project_task_aggregation_service.add_cached_report(
+            project_guid,
+            self._project_task_aggregation_service.get_version(aggregation),
+            report,
+        )
+        return report
+
+    async def execute(self, project_guid: UUID) -> str:
+        version = await self._project_task_aggregation_service.get_version_by_project_guid(project_guid)
+        report = await self._project_task_aggregation_service.get_cached_report(project_guid, version)
+
+        if report is None:
+            # concurrent requests for the same project version share one load and render
+            report = await self._project_report_render_single_flight.do(
+                (project_guid, version),
+                self._render_report,
+                project_guid,
+            )
+
+        return report
@@ -0,0 +1,81 @@
+from logging import getLogger
+
+from aiosmtplib import SMTPException
+
+from src.domain.project.entities import ProjectReportBatchData, ProjectReportData
+from src.domain.project.exc import ProjectNotFoundError
+from src.domain.project_task_aggregation.enums import ProjectReportDedupStage
+from src.domain.project_task_aggregation.flows.get_project_report import GetProjectReportFlow
+from src.infra.notifications.smtp import SMTPNotificationClient, is_permanent_smtp_failure
+from src.services.project_report_dedup_service import ProjectReportDedupService
+
+logger = getLogger()
+
+
+class SendProjectReportBatchNotificationFlow:
+    def __init__(
+        self,
+        notification_client: SMTPNotificationClient,
+        get_project_report_flow: GetProjectReportFlow,
+        project_report_dedup_service: ProjectReportDedupService,
+    ) -> None:
+        self._notification_client = notification_client
+        self._get_project_report_flow = get_project_report_flow
+        self._project_report_dedup_service = project_report_dedup_service
+
+    async def _send_report(self, report_data: ProjectReportData, report: str, message_id: str) -> None:
+        # recipients served before a redelivery of the batch are skipped
+        if not await self._project_report_dedup_service.claim(
+            ProjectReportDedupStage.DELIVERY,
+            report_data,
+            message_id,
+        ):
+            return
+
+        try:
+            await self._notification_client.send_html_notification(
+                recipient_email=report_data.email,
+                subject=f"Project {report_data.project_guid} report",
+                html_body=report,
+            )
+
+        except BaseException as e:
+            await self._project_report_dedup_service.release(ProjectReportDedupStage.DELIVERY, report_data)
+
+            # a rejected recipient would be rejected by every redelivery too, the rest of the batch is still sent
+            if isinstance(e, SMTPException) and is_permanent_smtp_failure(e):
+                logger.warning(
+                    "Project %s report to email %s rejected: %s",
+                    report_data.project_guid,
+                    report_data.email,
+                    e,
+                )
+                return
+
+            raise
+
+        await self._project_report_dedup_service.complete(ProjectReportDedupStage.DELIVERY, report_data)
+
+    async def execute(self, batch_data: ProjectReportBatchData, message_id: str) -> None:
+        for report_recipients in batch_data.reports:
+            logger.info(
+                "Sending project %s notification to %s emails",
+                report_recipients.project_guid,
+                len(report_recipients.emails),
+            )
+
+            try:
+                report = await self._get_project_report_flow.execute(report_recipients.project_guid)
+
+            except ProjectNotFoundError:
+                # a redelivery would not find it either, the other reports of the batch are still sent
+                logger.warning("Project %s of the report batch not found", report_recipients.project_guid)
+                continue
+
+            # each recipient over the pooled connection, one at a time, so a failure is known per recipient
+            for email in report_recipients.emails:
+                await self._send_report(
+                    ProjectReportData(project_guid=report_recipients.project_guid, email=email),
+                    report,
+                    message_id,
+                )
@@ -1,8 +1,10 @@
 from logging import getLogger
 
 from src.domain.project.entities import ProjectReportData
+from src.domain.project_task_aggregation.enums import ProjectReportDedupStage
+from src.domain.project_task_aggregation.flows.get_project_report import GetProjectReportFlow
 from src.infra.notifications.smtp import SMTPNotificationClient
-from src.services.project_task_aggregation_service import ProjectTaskAggregationService
+from src.services.project_report_dedup_service import ProjectReportDedupService
 
 logger = getLogger()
 
@@ -11,25 +13,39 @@ class SendProjectReportNotificationFlow:
     def __init__(
         self,
         notification_client: SMTPNotificationClient,
-        project_task_aggregation_service: ProjectTaskAggregationService,
+        get_project_report_flow: GetProjectReportFlow,
+        project_report_dedup_service: ProjectReportDedupService,
     ) -> None:
         self._notification_client = notification_client
-        self._project_task_aggregation_service = project_task_aggregation_service
+        self._get_project_report_flow = get_project_report_flow
+        self._project_report_dedup_service = project_report_dedup_service
+
+    async def execute(self, project_report_data: ProjectReportData, message_id: str) -> None:
+        # a copy sent within the window or being sent now is dropped, a redelivery of this message keeps its claim
+        if not await self._project_report_dedup_service.claim(
+            ProjectReportDedupStage.DELIVERY,
+            project_report_data,
+            message_id,
+        ):
+            return
 
-    async def execute(self, project_report_data: ProjectReportData) -> None:
         logger.info(
             "Sending project %s notification to email %s",
             project_report_data.project_guid,
             project_report_data.email,
         )
 
-        aggregation = await self._project_task_aggregation_service.get_one_project_with_tasks_by_guid(
-            project_report_data.project_guid,
-        )
-        await self._notification_client.send_notification(
-            recipient_email=project_report_data.email,
-            subject=f"Project {aggregation.project.guid} report",
-            template_name="project_report_email.html",
-            project=aggregation.project,
-            tasks=aggregation.tasks,
-        )
+        try:
+            report = await self._get_project_report_flow.execute(project_report_data.project_guid)
+            await self._notification_client.send_html_notification(
+                recipient_email=project_report_data.email,
+                subject=f"Project {project_report_data.project_guid} report",
+                html_body=report,
+            )
+
+        except BaseException:
+            # not sent, also on cancellation, the redelivery has to send it
+            await self._project_report_dedup_service.release(ProjectReportDedupStage.DELIVERY, project_report_data)
+            raise
+
+        await self._project_report_dedup_service.complete(ProjectReportDedupStage.DELIVERY, project_report_data)
@@ -1,11 +1,32 @@
+from uuid import uuid4
+
 from src.domain.project.entities import ProjectReportData
+from src.domain.project_task_aggregation.enums import ProjectReportDedupStage
 from src.infra.worker.broker import RabbitMessageBroker
 from src.infra.worker.enum import RabbitQueueName
+from src.services.project_report_dedup_service import ProjectReportDedupService
 
 
 class SendProjectReportUseCase:
-    def __init__(self, message_broker: RabbitMessageBroker) -> None:
+    def __init__(
+        self,
+        message_broker: RabbitMessageBroker,
+        project_report_dedup_service: ProjectReportDedupService,
+    ) -> None:
         self._message_broker = message_broker
+        self._project_report_dedup_service = project_report_dedup_service
 
     async def execute(self, send_data: ProjectReportData) -> None:
-        await self._message_broker.send_message(RabbitQueueName.PROJECT_REPORT_NOTIFICATION, send_data)
+        # double clicks and client retries of the same report are accepted without publishing it again
+        if not await self._project_report_dedup_service.claim(ProjectReportDedupStage.REQUEST, send_data, str(uuid4())):
+            return
+
+        try:
+            await self._message_broker.send_message(RabbitQueueName.PROJECT_REPORT_NOTIFICATION, send_data)
+
+        except BaseException:
+            # not published, also on cancellation, so a retry is not a duplicate
+            await self._project_report_dedup_service.release(ProjectReportDedupStage.REQUEST, send_data)
+            raise
+
+        await self._project_report_dedup_service.complete(ProjectReportDedupStage.REQUEST, send_data)
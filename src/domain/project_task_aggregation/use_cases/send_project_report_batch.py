@@ -0,0 +1,35 @@
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from src.domain.project.entities import ProjectReportBatchData, ProjectReportRecipients
+from src.infra.worker.broker import RabbitMessageBroker
+from src.infra.worker.enum import RabbitQueueName
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+logger = getLogger()
+
+
+class SendProjectReportBatchUseCase:
+    def __init__(self, message_broker: RabbitMessageBroker) -> None:
+        self._message_broker = message_broker
+
+    async def execute(self, batch_data: ProjectReportBatchData) -> None:
+        # one entry per project and one email per recipient, so each report is loaded, rendered and sent once
+        emails_by_project_guid: dict[UUID, dict[str, None]] = {}
+        for report in batch_data.reports:
+            emails_by_project_guid.setdefault(report.project_guid, {}).update(dict.fromkeys(report.emails))
+
+        grouped_batch_data = ProjectReportBatchData(
+            reports=[
+                ProjectReportRecipients(project_guid=project_guid, emails=list(emails))
+                for project_guid, emails in emails_by_project_guid.items()
+            ],
+        )
+        logger.info(
+            "Sending %s project reports to %s recipients",
+            len(grouped_batch_data.reports),
+            sum(len(report.emails) for report in grouped_batch_data.reports),
+        )
+        await self._message_broker.send_message(RabbitQueueName.PROJECT_REPORT_BATCH_NOTIFICATION, grouped_batch_data)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from src.common.exc import BaseAppError
 
@@ -11,3 +11,8 @@ class TaskNotFoundError(BaseAppError):
 @dataclass(eq=False, frozen=True, slots=True)
 class TaskInvalidDataError(BaseAppError):
     pass
+
+
+@dataclass(eq=False, frozen=True, slots=True)
+class TaskBatchInvalidDataError(TaskInvalidDataError):
+    item_errors: dict[int, str] = field(default_factory=dict)
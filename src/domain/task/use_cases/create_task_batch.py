@@ -0,0 +1,19 @@
+from collections.abc import Sequence
+from logging import getLogger
+from uuid import UUID
+
+from src.domain.task.entities import TaskCreateData
+from src.services.task_service import TaskService
+
+logger = getLogger()
+
+
+class CreateTaskBatchUseCase:
+    __slots__ = ("_task_service",)
+
+    def __init__(self, task_service: TaskService) -> None:
+        self._task_service = task_service
+
+    async def execute(self, project_guid: UUID, task_create_data_seq: Sequence[TaskCreateData]) -> list[UUID]:
+        logger.info("Creating %s tasks for project %s", len(task_create_data_seq), project_guid)
+        return await self._task_service.create_many(project_guid, task_create_data_seq)
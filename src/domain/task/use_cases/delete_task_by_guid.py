@@ -1,7 +1,6 @@
 from logging import getLogger
 from uuid import UUID
 
-from src.domain.task.exc import TaskNotFoundError
 from src.services.task_service import TaskService
 
 logger = getLogger()
@@ -15,11 +14,4 @@ class DeleteTaskByGUIDUseCase:
 
     async def execute(self, project_guid: UUID, task_guid: UUID) -> UUID:
         logger.info("Deleting task %s for project %s", task_guid, project_guid)
-
-        task = await self._task_service.get_one_by_guid(task_guid)
-
-        if task.project_guid != project_guid:
-            msg = f"Project {project_guid} has no task {task_guid}"
-            raise TaskNotFoundError(msg)
-
-        return await self._task_service.delete_one(task)
+        return await self._task_service.delete_one(project_guid, task_guid)
@@ -0,0 +1,18 @@
+from logging import getLogger
+from uuid import UUID
+
+from src.domain.common.entities import RenderedList
+from src.services.task_service import TaskService
+
+logger = getLogger()
+
+
+class GetTaskListRenderedByProjectGUIDUseCase:
+    __slots__ = ("_task_service",)
+
+    def __init__(self, task_service: TaskService) -> None:
+        self._task_service = task_service
+
+    async def execute(self, project_guid: UUID) -> RenderedList:
+        logger.info("Getting rendered tasks for project %s", project_guid)
+        return await self._task_service.get_list_rendered_by_project_guid(project_guid)
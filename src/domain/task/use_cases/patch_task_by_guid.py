@@ -2,7 +2,6 @@ from logging import getLogger
 from uuid import UUID
 
 from src.domain.task.entities import TaskPatchData
-from src.domain.task.exc import TaskInvalidDataError
 from src.services.task_service import TaskService
 
 logger = getLogger()
@@ -16,11 +15,4 @@ class PatchTaskByGUIDUseCase:
 
     async def execute(self, project_guid: UUID, task_guid: UUID, task_patch_data: TaskPatchData) -> UUID:
         logger.info("Patching task %s for project %s", task_guid, project_guid)
-
-        task = await self._task_service.get_one_by_guid(task_guid)
-
-        if task.project_guid != project_guid:
-            msg = "Invalid project guid"
-            raise TaskInvalidDataError(msg)
-
-        return await self._task_service.patch_one(task, task_patch_data)
+        return await self._task_service.patch_one(project_guid, task_guid, task_patch_data)
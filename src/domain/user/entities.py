@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from uuid import UUID
 
-from src.domain.user.enums import UserGender
+from src.domain.user.enums import AuthTokenTyp, UserGender
 
 
 @dataclass(slots=True)
@@ -12,6 +12,13 @@ class AuthToken:
     token_type: str
 
 
+@dataclass(frozen=True, slots=True)
+class AuthTokenPayload:
+    user_guid: UUID
+    typ: AuthTokenTyp
+    exp: int
+
+
 @dataclass(slots=True)
 class User:
     guid: UUID
@@ -1,5 +1,6 @@
 from logging import getLogger
 
+from src.domain.common.entities import ListCursor
 from src.domain.user.entities import User
 from src.services.user_service import UserService
 
@@ -18,6 +19,7 @@ class GetUserListUseCase:
         limit: int,
         order_by: str,
         reverse: bool,
+        after: ListCursor | None,
     ) -> list[User]:
-        logger.info("Getting user list with offset=%i and limit=%i", offset, limit)
-        return await self._user_service.get_list(offset, limit, order_by, reverse)
+        logger.info("Getting user list with offset=%i, limit=%i and after=%s", offset, limit, after)
+        return await self._user_service.get_list(offset, limit, order_by, reverse, after)
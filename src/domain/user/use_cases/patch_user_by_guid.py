@@ -15,5 +15,10 @@ class PatchUserByGUIDUseCase:
 
     async def execute(self, user_guid: UUID, user_patch_data: UserPatchData) -> UUID:
         logger.info("Pathing user %s", user_guid)
+        # bcrypt runs before the first query of the request's unit of work, so no connection idles in transaction
+        psw_hash = None
+        if user_patch_data.password is not None:
+            psw_hash = await self._user_service.get_psw_hash(user_patch_data.password)
+
         user = await self._user_service.get_one_by_guid(user_guid)
-        return await self._user_service.patch_one(user, user_patch_data)
+        return await self._user_service.patch_one(user, user_patch_data, psw_hash)
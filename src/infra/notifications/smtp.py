@@ -1,23 +1,142 @@
+from asyncio import Semaphore
+from collections import deque
+from contextlib import suppress
 from email.message import EmailMessage
-from typing import Any
+from logging import getLogger
+from time import monotonic
+from typing import Any, Final
 
 import aiosmtplib
+from aiosmtplib import SMTPException, SMTPRecipientsRefused, SMTPResponseException, SMTPServerDisconnected
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from src.config import get_settings
 
+logger = getLogger()
+
+_PERMANENT_FAILURE_CODE: Final[int] = 500
+
+
+def is_permanent_smtp_failure(error: SMTPException) -> bool:
+    """5xx replies reject the message or the recipient for good, a retry gets the same reply"""
+
+    if isinstance(error, SMTPRecipientsRefused):
+        return all(recipient_error.code >= _PERMANENT_FAILURE_CODE for recipient_error in error.recipients)
+
+    return isinstance(error, SMTPResponseException) and error.code >= _PERMANENT_FAILURE_CODE
+
+
+class SMTPConnectionPool:
+    """Keeps logged in SMTP connections open between messages, so a message costs no TCP connect, EHLO, STARTTLS
+    and AUTH. A connection idle for `health_check_after` seconds is checked with NOOP before reuse and one idle
+    for `keepalive` seconds is closed
+    """
+
+    __slots__ = ("_client_kwargs", "_health_check_after", "_idle", "_keepalive", "_limiter")
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str | None,
+        password: str | None,
+        max_size: int,
+        keepalive: float,
+        health_check_after: float,
+    ) -> None:
+        self._client_kwargs: dict[str, Any] = {
+            "hostname": hostname,
+            "port": port,
+            "username": username,
+            "password": password,
+        }
+        self._keepalive = keepalive
+        self._health_check_after = health_check_after
+        self._limiter = Semaphore(max_size)
+        # (client, last used at), the most recently used connection is taken first
+        self._idle: deque[tuple[aiosmtplib.SMTP, float]] = deque()
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(**self._client_kwargs)
+        await client.connect()
+        return client
+
+    async def _is_alive(self, client: aiosmtplib.SMTP, idle_for: float) -> bool:
+        if not client.is_connected:
+            return False
+
+        if idle_for < self._health_check_after:
+            return True
+
+        try:
+            await client.noop()
+
+        except SMTPException:
+            return False
+
+        return True
+
+    async def _checkout(self) -> aiosmtplib.SMTP:
+        now = monotonic()
+
+        while self._idle and now - self._idle[0][1] > self._keepalive:
+            client, _ = self._idle.popleft()
+            client.close()
+
+        while self._idle:
+            client, last_used_at = self._idle.pop()
+
+            if await self._is_alive(client, now - last_used_at):
+                return client
+
+            client.close()
+
+        return await self._connect()
+
+    async def send_message(self, message: EmailMessage) -> None:
+        async with self._limiter:
+            client = await self._checkout()
+            try:
+                try:
+                    await client.send_message(message)
+
+                except SMTPServerDisconnected:
+                    # dropped by the server after the health check, one more attempt on a new connection
+                    logger.warning("SMTP connection was dropped, reconnecting")
+                    client.close()
+                    client = await self._connect()
+                    await client.send_message(message)
+
+            except (SMTPResponseException, SMTPRecipientsRefused):
+                # the server rejected the message and reset the session, the connection stays usable
+                self._idle.append((client, monotonic()))
+                raise
+
+            except BaseException:
+                client.close()
+                raise
+
+            self._idle.append((client, monotonic()))
+
+    async def close(self) -> None:
+        while self._idle:
+            client, _ = self._idle.pop()
+            with suppress(SMTPException):
+                await client.quit()
+
 
 class SMTPNotificationClient:
-    __slots__ = ("_templates_env",)
+    __slots__ = ("_connection_pool", "_templates_env")
 
-    def __init__(self) -> None:
+    def __init__(self, connection_pool: SMTPConnectionPool) -> None:
+        self._connection_pool = connection_pool
         self._templates_env = Environment(
             loader=FileSystemLoader(get_settings().TEMPLATES_DIR),
             autoescape=select_autoescape(default=True),
             enable_async=True,
         )
 
-    async def _render_email_body(self, template_name: str, **entities_for_render: Any) -> str:
+    async def render_email_body(self, template_name: str, **entities_for_render: Any) -> str:
         template = self._templates_env.get_template(template_name)
         return await template.render_async(**entities_for_render)
 
@@ -29,6 +148,9 @@ class SMTPNotificationClient:
         message.set_content(html_body, subtype="html")
         return message
 
+    async def send_html_notification(self, recipient_email: str, subject: str, html_body: str) -> None:
+        await self._connection_pool.send_message(self._generate_email_message(recipient_email, subject, html_body))
+
     async def send_notification(
         self,
         recipient_email: str,
@@ -36,12 +158,5 @@ class SMTPNotificationClient:
         template_name: str,
         **entities_for_render: Any,
     ) -> None:
-        body = await self._render_email_body(template_name, **entities_for_render)
-        message = self._generate_email_message(recipient_email, subject, body)
-        await aiosmtplib.send(
-            message,
-            hostname=get_settings().EMAIL_HOST,
-            port=get_settings().EMAIL_PORT,
-            username=get_settings().EMAIL_USERNAME,
-            password=get_settings().EMAIL_PASSWORD,
-        )
+        body = await self.render_email_body(template_name, **entities_for_render)
+        await self.send_html_notification(recipient_email, subject, body)
@@ -0,0 +1,136 @@
+import asyncio
+import multiprocessing
+import signal
+from asyncio import Semaphore
+from functools import partial
+from logging import getLogger
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from types import FrameType
+
+from faststream import FastStream
+from faststream.rabbit import Channel, RabbitBroker
+
+from src.config import get_settings
+from src.infra.notifications.smtp import SMTPConnectionPool
+from src.infra.worker.middlewares import ConcurrencyLimitMiddleware
+from src.infra.worker.worker_routes import worker_router
+from src.logic.worker_di_container import get_worker_di_container
+from src.services.project_report_dedup_service import ProjectReportDedupService
+
+logger = getLogger()
+
+
+def create_worker_app() -> FastStream:
+    broker = RabbitBroker(
+        url=get_settings().RMQ_URL.unicode_string(),
+        logger=getLogger(),
+        # the broker hands out at most this many unacked messages per queue consumer of a process
+        default_channel=Channel(prefetch_count=get_settings().WORKER_PREFETCH),
+        middlewares=(partial(ConcurrencyLimitMiddleware, limiter=Semaphore(get_settings().WORKER_MAX_CONCURRENCY)),),
+    )
+    broker.include_router(worker_router)
+
+    return FastStream(broker, logger=getLogger(), after_shutdown=(_close_worker_resources,))
+
+
+async def _close_worker_resources() -> None:
+    # the container is built on the first message, a worker that got none has nothing to close
+    if not get_worker_di_container.cache_info().currsize:
+        return
+
+    smtp_connection_pool: SMTPConnectionPool = get_worker_di_container().resolve(SMTPConnectionPool)  # type: ignore
+    await smtp_connection_pool.close()
+
+    project_report_dedup_service: ProjectReportDedupService = get_worker_di_container().resolve(  # type: ignore
+        ProjectReportDedupService,
+    )
+    logger.info("Duplicate report deliveries suppressed=%s", project_report_dedup_service.suppressed_duplicates)
+
+
+def _run_worker_app(app: FastStream) -> None:
+    # a respawned child is forked after the parent set its own handlers
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    asyncio.run(app.run())
+
+
+class _WorkerProcessSupervisor:
+    """Keeps `processes` forked children running, a child that fails is respawned"""
+
+    __slots__ = ("_app", "_children", "_context", "_processes", "_respawn_failed", "_stopping")
+
+    def __init__(self, app: FastStream, processes: int) -> None:
+        self._app = app
+        self._processes = processes
+        self._context = multiprocessing.get_context("fork")
+        self._children: list[BaseProcess] = []
+        self._stopping = False
+        self._respawn_failed = False
+
+    def _start_child(self) -> None:
+        child = self._context.Process(target=_run_worker_app, args=(self._app,))
+        child.start()
+        self._children.append(child)
+        logger.info("Started report worker process %s", child.pid)
+
+    def _respawn_child(self, child: BaseProcess) -> None:
+        try:
+            self._start_child()
+        except OSError:
+            logger.exception("Failed to respawn report worker process %s", child.pid)
+            self._respawn_failed = True
+            self.stop_children(signal.SIGTERM, None)
+
+    def _wait_for_exited_children(self) -> list[BaseProcess]:
+        wait([child.sentinel for child in self._children])
+        exited_children = [child for child in self._children if not child.is_alive()]
+
+        for child in exited_children:
+            child.join()
+            self._children.remove(child)
+            logger.info("Report worker process %s exited with code %s", child.pid, child.exitcode)
+
+        return exited_children
+
+    def stop_children(self, signum: int, frame: FrameType | None) -> None:  # noqa: ARG002
+        self._stopping = True
+        for child in self._children:
+            child.terminate()
+
+    def run(self) -> bool:
+        """Returns whether every child was kept running until the stop"""
+
+        for _ in range(self._processes):
+            self._start_child()
+
+        while self._children:
+            for child in self._wait_for_exited_children():
+                if not self._stopping and child.exitcode != 0:
+                    self._respawn_child(child)
+
+        return not self._respawn_failed
+
+
+def run_worker_processes(app: FastStream, processes: int) -> None:
+    """Runs the app in `processes` forked processes, each with its own connections, until SIGINT or SIGTERM.
+
+    A child that fails is respawned, the parent exits with code 1 if it can not be.
+    """
+
+    if processes == 1:
+        _run_worker_app(app)
+        return
+
+    supervisor = _WorkerProcessSupervisor(app, processes)
+    previous_sigterm_handler = signal.signal(signal.SIGTERM, supervisor.stop_children)
+    previous_sigint_handler = signal.signal(signal.SIGINT, supervisor.stop_children)
+    try:
+        children_kept_running = supervisor.run()
+
+    finally:
+        signal.signal(signal.SIGTERM, previous_sigterm_handler)
+        signal.signal(signal.SIGINT, previous_sigint_handler)
+
+    if not children_kept_running:
+        raise SystemExit(1)
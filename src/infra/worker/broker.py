@@ -1,49 +1,45 @@
-from faststream.rabbit import QueueType, RabbitBroker, RabbitExchange, RabbitQueue
-from faststream.rabbit.types import AioPikaSendableMessage
+from logging import getLogger
+from typing import TYPE_CHECKING
 
-from src.infra.worker.enum import RabbitExchangeName, RabbitQueueName
+from src.infra.worker.enum import RabbitQueueName
+
+if TYPE_CHECKING:
+    from faststream.rabbit import RabbitBroker, RabbitPublisher
+    from faststream.rabbit.types import AioPikaSendableMessage
+
+# faststream is imported when a process builds its broker and not with the api app, see tests/test_import_time.py
+
+
+def create_rabbit_broker(url: str) -> "RabbitBroker":
+    from faststream.rabbit import RabbitBroker  # noqa: PLC0415
+
+    return RabbitBroker(url=url, logger=getLogger())
 
 
 class RabbitMessageBroker:
-    def __init__(self, broker: RabbitBroker) -> None:
+    def __init__(self, broker: "RabbitBroker") -> None:
         self._broker = broker
+        self._publishers: dict[RabbitQueueName, RabbitPublisher] = {}
 
     async def start_broker(self) -> None:
+        from src.infra.worker.queues import get_dead_letter_exchange, get_dead_letter_queue, get_queue  # noqa: PLC0415
+
         await self._broker.start()
         # declare dlq
-        dlq = await self._broker.declare_queue(
-            queue=RabbitQueue(
-                name=RabbitQueueName.DLQ,
-                queue_type=QueueType.QUORUM,
-                durable=True,
-                arguments={
-                    "x-message-ttl": 60 * 60 * 1000,  # 1 hour in ms
-                    "x-delivery-limit": 5,
-                },
-            ),
-        )
+        dlq = await self._broker.declare_queue(queue=get_dead_letter_queue())
         # declare dlx
-        dlx = await self._broker.declare_exchange(
-            exchange=RabbitExchange(name=RabbitExchangeName.DLX, durable=True),
-        )
+        dlx = await self._broker.declare_exchange(exchange=get_dead_letter_exchange())
         # bind dlq to dlx
         await dlq.bind(exchange=dlx, routing_key=dlq.name)
+        # the broker keeps every publisher it creates, so they are created once and not per message
+        self._publishers = {
+            queue_name: self._broker.publisher(queue=get_queue(queue_name), content_type="application/json")
+            for queue_name in RabbitQueueName
+            if queue_name != RabbitQueueName.DLQ
+        }
 
     async def stop_broker(self) -> None:
         await self._broker.stop()
 
-    async def send_message(self, queue_name: RabbitQueueName, send_data: AioPikaSendableMessage) -> None:
-        queue = RabbitQueue(
-            name=queue_name,
-            queue_type=QueueType.QUORUM,
-            durable=True,
-            arguments={
-                "x-message-ttl": 60 * 60 * 1000,  # 1 hour in ms
-                "x-delivery-limit": 5,
-                "x-dead-letter-exchange": RabbitExchangeName.DLX,
-                "x-dead-letter-routing-key": RabbitQueueName.DLQ,
-                "x-dead-letter-strategy": "at-least-once",
-            },
-        )
-
-        await self._broker.publisher(queue=queue, content_type="application/json").publish(message=send_data)
+    async def send_message(self, queue_name: RabbitQueueName, send_data: "AioPikaSendableMessage") -> None:
+        await self._publishers[queue_name].publish(message=send_data)
@@ -4,6 +4,7 @@ from enum import StrEnum
 class RabbitQueueName(StrEnum):
     DLQ = "dlq"
     PROJECT_REPORT_NOTIFICATION = "project_report_notification"
+    PROJECT_REPORT_BATCH_NOTIFICATION = "project_report_batch_notification"
 
 
 class RabbitExchangeName(StrEnum):
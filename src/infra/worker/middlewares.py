@@ -0,0 +1,17 @@
+from asyncio import Semaphore
+from typing import Any
+
+from faststream import BaseMiddleware, ContextRepo, StreamMessage
+from faststream.types import AsyncFuncAny
+
+
+class ConcurrencyLimitMiddleware(BaseMiddleware):
+    """Runs at most as many handlers at once as the shared limiter allows, prefetched messages wait for a slot"""
+
+    def __init__(self, msg: Any, /, *, context: ContextRepo, limiter: Semaphore) -> None:
+        super().__init__(msg, context=context)
+        self._limiter = limiter
+
+    async def consume_scope(self, call_next: AsyncFuncAny, msg: StreamMessage[Any]) -> Any:
+        async with self._limiter:
+            return await call_next(msg)
@@ -0,0 +1,36 @@
+from faststream.rabbit import QueueType, RabbitExchange, RabbitQueue
+
+from src.infra.worker.enum import RabbitExchangeName, RabbitQueueName
+
+
+def get_dead_letter_exchange() -> RabbitExchange:
+    return RabbitExchange(name=RabbitExchangeName.DLX, durable=True)
+
+
+def get_dead_letter_queue() -> RabbitQueue:
+    return RabbitQueue(
+        name=RabbitQueueName.DLQ,
+        queue_type=QueueType.QUORUM,
+        durable=True,
+        arguments={
+            "x-message-ttl": 60 * 60 * 1000,  # 1 hour in ms
+            "x-delivery-limit": 5,
+        },
+    )
+
+
+def get_queue(queue_name: RabbitQueueName) -> RabbitQueue:
+    """Publishers and subscribers declare a queue with the same arguments, rabbitmq rejects a mismatch"""
+
+    return RabbitQueue(
+        name=queue_name,
+        queue_type=QueueType.QUORUM,
+        durable=True,
+        arguments={
+            "x-message-ttl": 60 * 60 * 1000,  # 1 hour in ms
+            "x-delivery-limit": 5,
+            "x-dead-letter-exchange": RabbitExchangeName.DLX,
+            "x-dead-letter-routing-key": RabbitQueueName.DLQ,
+            "x-dead-letter-strategy": "at-least-once",
+        },
+    )
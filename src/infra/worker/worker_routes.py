@@ -1,29 +1,28 @@
 from typing import Any
 
 from faststream import Depends, Logger
-from faststream.rabbit import QueueType, RabbitQueue, RabbitRouter
+from faststream.rabbit import RabbitRouter
+from faststream.rabbit.annotations import RabbitMessage
 from punq import Container
 
-from src.domain.project.entities import ProjectReportData
+from src.domain.project.entities import ProjectReportBatchData, ProjectReportData
+from src.domain.project_task_aggregation.flows.send_project_report_batch_notification import (
+    SendProjectReportBatchNotificationFlow,
+)
 from src.domain.project_task_aggregation.flows.send_project_report_notification import (
     SendProjectReportNotificationFlow,
 )
-from src.infra.worker.enum import RabbitExchangeName, RabbitQueueName
+from src.infra.worker.enum import RabbitQueueName
+from src.infra.worker.queues import get_dead_letter_exchange, get_dead_letter_queue, get_queue
 from src.logic.worker_di_container import get_worker_di_container
 
 worker_router = RabbitRouter()
 
 
+# the worker declares the dlx and binds the dlq too, it can start before the api
 @worker_router.subscriber(
-    queue=RabbitQueue(
-        name=RabbitQueueName.DLQ,
-        queue_type=QueueType.QUORUM,
-        durable=True,
-        arguments={
-            "x-message-ttl": 60 * 60 * 1000,  # 1 hour in ms
-            "x-delivery-limit": 5,
-        },
-    ),
+    queue=get_dead_letter_queue(),
+    exchange=get_dead_letter_exchange(),
 )
 async def dlq_handler(body: dict[str, Any], logger: Logger) -> None:
     logger.error("dlq payload: %s", body)
@@ -31,22 +30,25 @@ async def dlq_handler(body: dict[str, Any], logger: Logger) -> None:
 
 
 @worker_router.subscriber(
-    queue=RabbitQueue(
-        name=RabbitQueueName.PROJECT_REPORT_NOTIFICATION,
-        queue_type=QueueType.QUORUM,
-        durable=True,
-        arguments={
-            "x-message-ttl": 60 * 60 * 1000,  # 1 hour in ms
-            "x-delivery-limit": 5,
-            "x-dead-letter-exchange": RabbitExchangeName.DLX,
-            "x-dead-letter-routing-key": RabbitQueueName.DLQ,
-            "x-dead-letter-strategy": "at-least-once",
-        },
-    ),
+    queue=get_queue(RabbitQueueName.PROJECT_REPORT_NOTIFICATION),
 )
 async def send_project_report_notification(
     body: ProjectReportData,
+    message: RabbitMessage,
     container: Container = Depends(get_worker_di_container),  # noqa: B008
 ) -> None:
     flow: SendProjectReportNotificationFlow = container.resolve(SendProjectReportNotificationFlow)  # type: ignore
-    return await flow.execute(body)
+    # the correlation id is set on publish and kept by every redelivery of the message
+    return await flow.execute(body, message_id=message.correlation_id)
+
+
+@worker_router.subscriber(
+    queue=get_queue(RabbitQueueName.PROJECT_REPORT_BATCH_NOTIFICATION),
+)
+async def send_project_report_batch_notification(
+    body: ProjectReportBatchData,
+    message: RabbitMessage,
+    container: Container = Depends(get_worker_di_container),  # noqa: B008
+) -> None:
+    flow: SendProjectReportBatchNotificationFlow = container.resolve(SendProjectReportBatchNotificationFlow)  # type: ignore
+    return await flow.execute(body, message_id=message.correlation_id)
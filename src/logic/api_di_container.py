@@ -1,29 +1,44 @@
+from datetime import timedelta
 from functools import lru_cache
-from logging import getLogger
+from typing import Final
 
-from faststream.rabbit import RabbitBroker
 from punq import Container, Scope
 from redis.asyncio import Redis as AsyncRedis
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 
 from src.config import get_settings
+from src.data.connection_budget import ConnectionBudget
+from src.data.repositories.cache_codec import CacheValueCodec
 from src.data.repositories.project.base import AbstractProjectRepository
 from src.data.repositories.project.sqlachemy import SQLAlchemyProjectRepository
+from src.data.repositories.project_task_aggregation.dedup_base import AbstractProjectReportDedupRepository
+from src.data.repositories.project_task_aggregation.dedup_redis import RedisProjectReportDedupRepository
+from src.data.repositories.sqlalchemy_replica_routing import (
+    ReadYourWritesTracker,
+    ReplicaBalancing,
+    ReplicaPool,
+    ReplicaRoutingSession,
+)
 from src.data.repositories.task.base import AbstractTaskRepository
 from src.data.repositories.task.sqlalchemy import SQLAlchemyTaskRepository
 from src.data.repositories.user.base import AbstractUserRepository
 from src.data.repositories.user.cache_redis import RedisUserCasheRepository
+from src.data.repositories.user.cache_two_tier import TwoTierUserCacheRepository
 from src.data.repositories.user.cashe_base import AbstractUserCacheRepository
 from src.data.repositories.user.sqlalchemy import SQLAlchemyUserRepository
 from src.domain.project.use_cases.create_project import CreateProjectUseCase
 from src.domain.project.use_cases.delete_project_by_guid import DeleteProjectByGUIDUseCase
 from src.domain.project.use_cases.get_project_by_guid_by_guid import GetProjectByGUIDUseCase
 from src.domain.project.use_cases.get_project_list import GetProjectListUseCase
+from src.domain.project.use_cases.get_project_list_rendered import GetProjectListRenderedUseCase
 from src.domain.project.use_cases.patch_project_by_guid import PatchProjectByGUIDUseCase
 from src.domain.project_task_aggregation.use_cases.send_project_report import SendProjectReportUseCase
+from src.domain.project_task_aggregation.use_cases.send_project_report_batch import SendProjectReportBatchUseCase
 from src.domain.task.use_cases.create_task import CreateTaskUseCase
+from src.domain.task.use_cases.create_task_batch import CreateTaskBatchUseCase
 from src.domain.task.use_cases.delete_task_by_guid import DeleteTaskByGUIDUseCase
 from src.domain.task.use_cases.get_list import GetTaskListByProjectGUIDUseCase
+from src.domain.task.use_cases.get_list_rendered import GetTaskListRenderedByProjectGUIDUseCase
 from src.domain.task.use_cases.patch_task_by_guid import PatchTaskByGUIDUseCase
 from src.domain.user.use_cases.authenticate_user_by_token import AuthenticateUserByTokenUseCase
 from src.domain.user.use_cases.create_user import CreateUserUseCase
@@ -33,45 +48,86 @@ from src.domain.user.use_cases.get_one_user_by_guid import GetOneUserByGUIDUseCa
 from src.domain.user.use_cases.get_user_list import GetUserListUseCase
 from src.domain.user.use_cases.patch_user_by_guid import PatchUserByGUIDUseCase
 from src.domain.user.use_cases.refresh_user_token import RefreshUserTokenUseCase
-from src.infra.worker.broker import RabbitMessageBroker
-from src.infra.worker.worker_routes import worker_router
-from src.services.auth_service import AuthService
-from src.services.hasher_service import HasherService
+from src.infra.worker.broker import RabbitMessageBroker, create_rabbit_broker
+from src.logic.di_container import SingletonCachingContainer, rebuild_in_forked_children
+from src.services.auth_service import AuthService, AuthTokenPayloadCache
+from src.services.hasher_service import HasherExecutor, HasherService
+from src.services.project_report_dedup_service import ProjectReportDedupService
 from src.services.project_service import ProjectService
 from src.services.task_service import TaskService
-from src.services.user_service import UserService
+from src.services.user_service import UserLoadSingleFlight, UserService
+
+# api processes only hold their own engines, worker processes are counted in the budget separately
+_API_ENGINE_SHARE: Final[float] = 1.0
+_REPLICA_ENGINE_SHARE: Final[float] = 1.0
 
 
 def _get_api_di_container() -> Container:
-    container = Container()
+    container = SingletonCachingContainer()
     # sqlalchemy engine and sessionmaker
-    async_engine = create_async_engine(
+    connection_budget = ConnectionBudget(
+        total=get_settings().PG_CONNECTION_BUDGET,
+        processes=get_settings().WORKERS + get_settings().WORKER_PROCESSES,
+    )
+    async_engine = connection_budget.create_engine(
         url=get_settings().PG_URL.unicode_string(),
-        echo=False,
-        pool_pre_ping=True,
-        pool_size=10,
-        pool_recycle=3600,
+        share=_API_ENGINE_SHARE,
+        pool_timeout=get_settings().PG_POOL_TIMEOUT,
+    )
+    replica_pool = ReplicaPool(
+        engines=[
+            connection_budget.create_engine(
+                url=replica_url.unicode_string(),
+                share=_REPLICA_ENGINE_SHARE,
+                pool_timeout=get_settings().PG_POOL_TIMEOUT,
+            )
+            for replica_url in get_settings().PG_REPLICA_URLS
+        ],
+        balancing=ReplicaBalancing(get_settings().PG_REPLICA_BALANCING),
     )
     async_session_factory = async_sessionmaker(
         bind=async_engine,
+        sync_session_class=ReplicaRoutingSession,
+        replica_pool=replica_pool,
         expire_on_commit=False,
         autoflush=False,
         autocommit=False,
     )
+    container.register(AsyncEngine, instance=async_engine)
     # redis
     redis = AsyncRedis.from_url(
         get_settings().REDIS_URL.unicode_string(),
         decode_responses=False,
     )
+    container.register(
+        ReadYourWritesTracker,
+        factory=lambda: ReadYourWritesTracker(
+            redis=redis,
+            window=get_settings().PG_STICKY_READS_WINDOW,
+            enabled=bool(replica_pool),
+        ),
+        scope=Scope.singleton,
+    )
+    cache_value_codec = CacheValueCodec(compress_threshold=get_settings().CACHE_COMPRESS_THRESHOLD)
     # repos
     container.register(
         AbstractUserRepository,
         factory=lambda: SQLAlchemyUserRepository(async_session_factory),
         scope=Scope.singleton,
     )
+    container.register(
+        TwoTierUserCacheRepository,
+        factory=lambda: TwoTierUserCacheRepository(
+            redis_repository=RedisUserCasheRepository(redis, cache_value_codec),
+            redis=redis,
+            local_max_size=get_settings().USER_LOCAL_CACHE_SIZE,
+            local_ttl=get_settings().USER_LOCAL_CACHE_TTL,
+        ),
+        scope=Scope.singleton,
+    )
     container.register(
         AbstractUserCacheRepository,
-        factory=lambda: RedisUserCasheRepository(redis),
+        factory=lambda: container.resolve(TwoTierUserCacheRepository),
         scope=Scope.singleton,
     )
     container.register(
@@ -84,45 +140,70 @@ def _get_api_di_container() -> Container:
         factory=lambda: SQLAlchemyTaskRepository(async_session_factory),
         scope=Scope.singleton,
     )
-    # infra
-    rabbimq_broker = RabbitBroker(
-        url=get_settings().RMQ_URL.unicode_string(),
-        logger=getLogger(),
+    container.register(
+        AbstractProjectReportDedupRepository,
+        factory=lambda: RedisProjectReportDedupRepository(
+            redis=redis,
+            ttl=timedelta(seconds=get_settings().REPORT_DEDUP_WINDOW),
+            claim_ttl=timedelta(seconds=get_settings().REPORT_DEDUP_CLAIM_TTL),
+        ),
+        scope=Scope.singleton,
     )
-    rabbimq_broker.include_router(worker_router)
+    # infra
+    rabbimq_broker = create_rabbit_broker(url=get_settings().RMQ_URL.unicode_string())
     container.register(
         RabbitMessageBroker,
         factory=lambda: RabbitMessageBroker(rabbimq_broker),
         scope=Scope.singleton,
     )
-    # services
-    container.register(AuthService)
-    container.register(HasherService)
-    container.register(UserService)
-    container.register(ProjectService)
-    container.register(TaskService)
+    # services and use cases keep no request state, one instance per worker is shared
+    container.register(
+        AuthTokenPayloadCache,
+        factory=lambda: AuthTokenPayloadCache(max_size=get_settings().AUTH_TOKEN_CACHE_SIZE),
+        scope=Scope.singleton,
+    )
+    container.register(AuthService, scope=Scope.singleton)
+    container.register(
+        HasherExecutor,
+        factory=lambda: HasherExecutor(
+            max_workers=get_settings().HASHER_POOL_SIZE,
+            max_queue_size=get_settings().HASHER_QUEUE_SIZE,
+            thread_name_prefix="hasher",
+        ),
+        scope=Scope.singleton,
+    )
+    container.register(HasherService, scope=Scope.singleton)
+    container.register(UserLoadSingleFlight, scope=Scope.singleton)
+    container.register(UserService, scope=Scope.singleton)
+    container.register(ProjectService, scope=Scope.singleton)
+    container.register(TaskService, scope=Scope.singleton)
+    container.register(ProjectReportDedupService, scope=Scope.singleton)
     # user use cases
-    container.register(AuthenticateUserByTokenUseCase)
-    container.register(GenerateUserTokenUseCase)
-    container.register(RefreshUserTokenUseCase)
-    container.register(GetUserListUseCase)
-    container.register(CreateUserUseCase)
-    container.register(GetOneUserByGUIDUseCase)
-    container.register(PatchUserByGUIDUseCase)
-    container.register(DeleteUserByGUIDUseCase)
+    container.register(AuthenticateUserByTokenUseCase, scope=Scope.singleton)
+    container.register(GenerateUserTokenUseCase, scope=Scope.singleton)
+    container.register(RefreshUserTokenUseCase, scope=Scope.singleton)
+    container.register(GetUserListUseCase, scope=Scope.singleton)
+    container.register(CreateUserUseCase, scope=Scope.singleton)
+    container.register(GetOneUserByGUIDUseCase, scope=Scope.singleton)
+    container.register(PatchUserByGUIDUseCase, scope=Scope.singleton)
+    container.register(DeleteUserByGUIDUseCase, scope=Scope.singleton)
     # project use cases
-    container.register(GetProjectListUseCase)
-    container.register(CreateProjectUseCase)
-    container.register(GetProjectByGUIDUseCase)
-    container.register(PatchProjectByGUIDUseCase)
-    container.register(DeleteProjectByGUIDUseCase)
+    container.register(GetProjectListUseCase, scope=Scope.singleton)
+    container.register(GetProjectListRenderedUseCase, scope=Scope.singleton)
+    container.register(CreateProjectUseCase, scope=Scope.singleton)
+    container.register(GetProjectByGUIDUseCase, scope=Scope.singleton)
+    container.register(PatchProjectByGUIDUseCase, scope=Scope.singleton)
+    container.register(DeleteProjectByGUIDUseCase, scope=Scope.singleton)
     # task use cases
-    container.register(GetTaskListByProjectGUIDUseCase)
-    container.register(CreateTaskUseCase)
-    container.register(PatchTaskByGUIDUseCase)
-    container.register(DeleteTaskByGUIDUseCase)
+    container.register(GetTaskListByProjectGUIDUseCase, scope=Scope.singleton)
+    container.register(GetTaskListRenderedByProjectGUIDUseCase, scope=Scope.singleton)
+    container.register(CreateTaskUseCase, scope=Scope.singleton)
+    container.register(CreateTaskBatchUseCase, scope=Scope.singleton)
+    container.register(PatchTaskByGUIDUseCase, scope=Scope.singleton)
+    container.register(DeleteTaskByGUIDUseCase, scope=Scope.singleton)
     # project task aggregation use cases
-    container.register(SendProjectReportUseCase)
+    container.register(SendProjectReportUseCase, scope=Scope.singleton)
+    container.register(SendProjectReportBatchUseCase, scope=Scope.singleton)
 
     return container
 
@@ -130,3 +211,6 @@ def _get_api_di_container() -> Container:
 @lru_cache(maxsize=1)
 def get_api_di_container() -> Container:
     return _get_api_di_container()
+
+
+rebuild_in_forked_children(get_api_di_container)
@@ -0,0 +1,30 @@
+import os
+from functools import _lru_cache_wrapper, partial
+from typing import Any
+
+from punq import Container
+
+# containers a forked child inherited, collecting them would close connections the parent still uses
+_inherited_containers: list[Container] = []
+
+
+class SingletonCachingContainer(Container):
+    """Returns built singletons with one dict lookup, punq builds two resolution contexts per `resolve` even for them"""
+
+    def resolve(self, service_key: Any, **kwargs: Any) -> Any:
+        if not kwargs and service_key in self._singletons:
+            return self._singletons[service_key]
+
+        return super().resolve(service_key, **kwargs)
+
+
+def _forget_inherited_container(get_container: "_lru_cache_wrapper[Container]") -> None:
+    if get_container.cache_info().currsize:
+        _inherited_containers.append(get_container())
+        get_container.cache_clear()
+
+
+def rebuild_in_forked_children(get_container: "_lru_cache_wrapper[Container]") -> None:
+    """Makes a forked child build its own container instead of using engines, redis and broker of the parent"""
+
+    os.register_at_fork(after_in_child=partial(_forget_inherited_container, get_container))
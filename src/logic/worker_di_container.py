@@ -1,25 +1,48 @@
+from datetime import timedelta
 from functools import lru_cache
+from typing import Final
 
 from punq import Container, Scope
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from redis.asyncio import Redis as AsyncRedis
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from src.config import get_settings
+from src.data.connection_budget import ConnectionBudget
+from src.data.repositories.cache_codec import CacheValueCodec
 from src.data.repositories.project_task_aggregation.base import AbstractProjectTaskAggregationRepository
+from src.data.repositories.project_task_aggregation.cache_base import AbstractProjectReportCacheRepository
+from src.data.repositories.project_task_aggregation.cache_redis import RedisProjectReportCacheRepository
+from src.data.repositories.project_task_aggregation.dedup_base import AbstractProjectReportDedupRepository
+from src.data.repositories.project_task_aggregation.dedup_redis import RedisProjectReportDedupRepository
 from src.data.repositories.project_task_aggregation.sqlalchemy import SQLAlchemyProjectTaskAggregationRepository
-from src.domain.project_task_aggregation.flows.send_project_report_notification import SendProjectReportNotificationFlow
-from src.infra.notifications.smtp import SMTPNotificationClient
+from src.domain.project_task_aggregation.flows.get_project_report import (
+    GetProjectReportFlow,
+    ProjectReportRenderSingleFlight,
+)
+from src.domain.project_task_aggregation.flows.send_project_report_batch_notification import (
+    SendProjectReportBatchNotificationFlow,
+)
+from src.domain.project_task_aggregation.flows.send_project_report_notification import (
+    SendProjectReportNotificationFlow,
+)
+from src.infra.notifications.smtp import SMTPConnectionPool, SMTPNotificationClient
+from src.logic.di_container import SingletonCachingContainer, rebuild_in_forked_children
+from src.services.project_report_dedup_service import ProjectReportDedupService
 from src.services.project_task_aggregation_service import ProjectTaskAggregationService
 
+_WORKER_ENGINE_SHARE: Final[float] = 1.0
+
 
 def _get_worker_di_container() -> Container:
-    container = Container()
+    container = SingletonCachingContainer()
     # sqlalchemy engine and sessionmaker
-    async_engine = create_async_engine(
+    async_engine = ConnectionBudget(
+        total=get_settings().PG_CONNECTION_BUDGET,
+        processes=get_settings().WORKERS + get_settings().WORKER_PROCESSES,
+    ).create_engine(
         url=get_settings().PG_URL.unicode_string(),
-        echo=False,
-        pool_pre_ping=True,
-        pool_size=10,
-        pool_recycle=3600,
+        share=_WORKER_ENGINE_SHARE,
+        pool_timeout=get_settings().PG_POOL_TIMEOUT,
     )
     async_session_factory = async_sessionmaker(
         bind=async_engine,
@@ -27,18 +50,59 @@ def _get_worker_di_container() -> Container:
         autoflush=False,
         autocommit=False,
     )
+    # redis
+    redis = AsyncRedis.from_url(
+        get_settings().REDIS_URL.unicode_string(),
+        decode_responses=False,
+    )
+    cache_value_codec = CacheValueCodec(compress_threshold=get_settings().CACHE_COMPRESS_THRESHOLD)
     # repos
     container.register(
         AbstractProjectTaskAggregationRepository,
         factory=lambda: SQLAlchemyProjectTaskAggregationRepository(async_session_factory),
         scope=Scope.singleton,
     )
+    container.register(
+        AbstractProjectReportCacheRepository,
+        factory=lambda: RedisProjectReportCacheRepository(
+            redis=redis,
+            codec=cache_value_codec,
+            ttl=timedelta(seconds=get_settings().REPORT_CACHE_TTL),
+        ),
+        scope=Scope.singleton,
+    )
+    container.register(
+        AbstractProjectReportDedupRepository,
+        factory=lambda: RedisProjectReportDedupRepository(
+            redis=redis,
+            ttl=timedelta(seconds=get_settings().REPORT_DEDUP_WINDOW),
+            claim_ttl=timedelta(seconds=get_settings().REPORT_DEDUP_CLAIM_TTL),
+        ),
+        scope=Scope.singleton,
+    )
     # infra
+    container.register(
+        SMTPConnectionPool,
+        factory=lambda: SMTPConnectionPool(
+            hostname=get_settings().EMAIL_HOST,
+            port=get_settings().EMAIL_PORT,
+            username=get_settings().EMAIL_USERNAME,
+            password=get_settings().EMAIL_PASSWORD,
+            max_size=get_settings().EMAIL_POOL_SIZE,
+            keepalive=get_settings().EMAIL_KEEPALIVE,
+            health_check_after=get_settings().EMAIL_HEALTH_CHECK_AFTER,
+        ),
+        scope=Scope.singleton,
+    )
     container.register(SMTPNotificationClient, scope=Scope.singleton)
-    # services
-    container.register(ProjectTaskAggregationService)
+    # services and flows keep no request state, one instance per worker is shared
+    container.register(ProjectTaskAggregationService, scope=Scope.singleton)
+    container.register(ProjectReportDedupService, scope=Scope.singleton)
     # project task aggregation flows
-    container.register(SendProjectReportNotificationFlow)
+    container.register(ProjectReportRenderSingleFlight, scope=Scope.singleton)
+    container.register(GetProjectReportFlow, scope=Scope.singleton)
+    container.register(SendProjectReportNotificationFlow, scope=Scope.singleton)
+    container.register(SendProjectReportBatchNotificationFlow, scope=Scope.singleton)
 
     return container
 
@@ -46,3 +110,6 @@ def _get_worker_di_container() -> Container:
 @lru_cache(maxsize=1)
 def get_worker_di_container() -> Container:
     return _get_worker_di_container()
+
+
+rebuild_in_forked_children(get_worker_di_container)
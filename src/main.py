@@ -5,13 +5,20 @@ from logging import getLogger
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRouter
+from sqlalchemy.exc import TimeoutError as SQLAlchemyTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from src.config import get_settings
+from src.data.connection_budget import get_engine_pool_stats
+from src.data.repositories.user.cache_two_tier import TwoTierUserCacheRepository
 from src.infra.worker.broker import RabbitMessageBroker
 from src.logic.api_di_container import get_api_di_container
 from src.presentation.auth.routes import auth_v1_router
+from src.presentation.common.exception_handlers import db_pool_timeout_exception_handler
 from src.presentation.project.routes import project_v1_router
 from src.presentation.user.routes import user_v1_router
+from src.services.hasher_service import HasherExecutor
+from src.services.project_report_dedup_service import ProjectReportDedupService
 
 logger = getLogger()
 
@@ -20,15 +27,42 @@ logger = getLogger()
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Web app %s %s starting up...", app.title, app.version)
 
+    # runs in every worker after fork, so engines, redis and the broker are never shared between processes
     container = get_api_di_container()
 
     message_broker: RabbitMessageBroker = container.resolve(RabbitMessageBroker)  # type: ignore
     await message_broker.start_broker()
 
+    user_cache_repository: TwoTierUserCacheRepository = container.resolve(TwoTierUserCacheRepository)  # type: ignore
+    user_cache_repository.start_invalidation_listener()
+
     yield
 
+    await user_cache_repository.stop_invalidation_listener()
+    logger.info(
+        "User cache hit ratio local=%.2f redis=%.2f",
+        user_cache_repository.local_stats.hit_ratio,
+        user_cache_repository.redis_stats.hit_ratio,
+    )
+
     await message_broker.stop_broker()
 
+    project_report_dedup_service: ProjectReportDedupService = container.resolve(ProjectReportDedupService)  # type: ignore
+    logger.info("Duplicate report requests suppressed=%s", project_report_dedup_service.suppressed_duplicates)
+
+    async_engine: AsyncEngine = container.resolve(AsyncEngine)  # type: ignore
+    pool_stats = get_engine_pool_stats(async_engine)
+    if pool_stats is not None:
+        logger.info(
+            "DB pool size=%s peak saturation=%.2f timeouts=%s",
+            pool_stats.size,
+            pool_stats.peak_saturation,
+            pool_stats.timeouts,
+        )
+
+    hasher_executor: HasherExecutor = container.resolve(HasherExecutor)  # type: ignore
+    hasher_executor.shutdown()
+
     logger.info("Web app %s %s shutting down...", app.title, app.version)
 
 
@@ -63,4 +97,8 @@ def create_app() -> FastAPI:
     for router in (get_api_v1_router(),):
         app.include_router(router)
 
+    app.add_exception_handler(SQLAlchemyTimeoutError, db_pool_timeout_exception_handler)  # type: ignore
+    # built here and not on the first request, a preloading gunicorn master builds it once for all workers
+    app.openapi()
+
     return app
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from punq import Container
 
-from src.common.exc import BaseAppError
+from src.common.exc import BaseAppError, ExecutorSaturatedError
 from src.domain.user.entities import AuthToken, User
 from src.domain.user.exc import UserInvalidCredentialsError, UserNotFoundError
 from src.domain.user.use_cases.generate_user_token import GenerateUserTokenUseCase
@@ -26,6 +26,7 @@ auth_v1_router = APIRouter(prefix="/auth", tags=["Auth"])
         status.HTTP_201_CREATED: {"model": AuthTokenScheme},
         status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
         status.HTTP_401_UNAUTHORIZED: {"model": ErrorResponse},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ErrorResponse},
     },
 )
 async def create_token(
@@ -43,6 +44,9 @@ async def create_token(
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
 
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.msg) from e
+
     except BaseAppError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.msg) from e
 
@@ -0,0 +1,13 @@
+from fastapi import Request, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import TimeoutError as SQLAlchemyTimeoutError
+
+_DB_POOL_RETRY_AFTER_SECONDS = "1"
+
+
+async def db_pool_timeout_exception_handler(request: Request, exc: SQLAlchemyTimeoutError) -> ORJSONResponse:  # noqa: ARG001
+    return ORJSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Service is overloaded, try again later"},
+        headers={"Retry-After": _DB_POOL_RETRY_AFTER_SECONDS},
+    )
@@ -0,0 +1,61 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Iterable, Sequence
+from typing import Any
+from uuid import UUID
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+
+from src.domain.common.entities import ListCursor
+
+
+class ListCursorCodec:
+    """Opaque cursors for keyset pagination, supported only for non-nullable scalar order fields"""
+
+    __slots__ = ("_type_adapters",)
+
+    def __init__(self, scheme: type[BaseModel], order_fields: Iterable[str]) -> None:
+        self._type_adapters: dict[str, TypeAdapter[Any]] = {
+            field: TypeAdapter(scheme.model_fields[field].annotation) for field in order_fields
+        }
+
+    def decode(self, cursor: str, order_by: str, reverse: bool) -> ListCursor:
+        if order_by not in self._type_adapters:
+            msg = f"Cursor pagination is not supported for order_by={order_by}"
+            raise ValueError(msg)
+
+        try:
+            cursor_order_by, cursor_reverse, value, guid = orjson.loads(urlsafe_b64decode(cursor))
+            list_cursor = ListCursor(value=self._type_adapters[order_by].validate_python(value), guid=UUID(guid))
+
+        except (ValueError, TypeError, AttributeError) as e:
+            msg = "Invalid cursor"
+            raise ValueError(msg) from e
+
+        if cursor_order_by != order_by or cursor_reverse != reverse:
+            msg = "Cursor was issued for another order_by or reverse"
+            raise ValueError(msg)
+
+        return list_cursor
+
+    def get_next(self, entities: Sequence[Any], limit: int, order_by: str, reverse: bool) -> str | None:
+        if not entities:
+            return None
+
+        last_entity = entities[-1]
+        last = ListCursor(value=getattr(last_entity, order_by), guid=last_entity.guid)
+        return self.get_next_after(last, len(entities), limit, order_by, reverse)
+
+    def get_next_after(
+        self,
+        last: ListCursor | None,
+        count: int,
+        limit: int,
+        order_by: str,
+        reverse: bool,
+    ) -> str | None:
+        if last is None or count < limit or order_by not in self._type_adapters:
+            return None
+
+        cursor = (order_by, reverse, last.value, last.guid)
+        return urlsafe_b64encode(orjson.dumps(cursor)).decode()
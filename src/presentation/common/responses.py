@@ -0,0 +1,49 @@
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+from src.domain.common.entities import RenderedList
+
+
+class EntityEncoder:
+    """Picks the fields of a response scheme from entities to be dumped by orjson, skipping pydantic validation"""
+
+    __slots__ = ("_field_names", "_get_values")
+
+    def __init__(self, scheme: type[BaseModel], entity: type) -> None:
+        self._field_names = tuple(scheme.model_fields)
+
+        missing_field_names = set(self._field_names).difference(field.name for field in fields(entity))
+        if missing_field_names:
+            msg = f"{entity.__name__} has no fields {sorted(missing_field_names)} of {scheme.__name__}"
+            raise ValueError(msg)
+
+        self._get_values = attrgetter(*self._field_names)
+
+    def encode(self, entity: Any) -> dict[str, Any]:
+        if len(self._field_names) == 1:
+            return {self._field_names[0]: self._get_values(entity)}
+
+        return dict(zip(self._field_names, self._get_values(entity), strict=True))
+
+    def encode_many(self, entities: list[Any]) -> list[dict[str, Any]]:
+        return [self.encode(entity) for entity in entities]
+
+
+def get_encoded_response(content: Any) -> Response:
+    # aware datetimes in utc end with Z like in pydantic
+    return Response(content=orjson.dumps(content, option=orjson.OPT_UTC_Z), media_type="application/json")
+
+
+def get_rendered_list_response(key: str, rendered_list: RenderedList, **values: Any) -> Response:
+    """Places the JSON array rendered by the database under `key` without parsing it, response validation is skipped"""
+
+    content = b'{"%s":%s' % (key.encode(), rendered_list.content)
+    for name, value in values.items():
+        content += b',"%s":%s' % (name.encode(), orjson.dumps(value))
+
+    return Response(content=content + b"}", media_type="application/json")
@@ -0,0 +1,23 @@
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from src.data.repositories.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+
+
+class UnitOfWorkAPIRoute(APIRoute):
+    """Dependencies and the endpoint share one db session, committed before the response is sent.
+
+    Exit code of dependencies with yield runs only after the response is sent, too late to commit.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def unit_of_work_route_handler(request: Request) -> Response:
+            async with SQLAlchemyUnitOfWork.begin():
+                return await route_handler(request)
+
+        return unit_of_work_route_handler
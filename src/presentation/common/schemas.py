@@ -5,5 +5,19 @@ class ErrorResponse(BaseModel):
     detail: str
 
 
+class ItemError(BaseModel):
+    type: str
+    loc: list[str | int]
+    msg: str
+
+
+class ItemErrorResponse(BaseModel):
+    detail: list[ItemError]
+
+
 class GUIDResponse(BaseModel):
     guid: UUID4
+
+
+class GUIDListResponse(BaseModel):
+    guids: list[UUID4]
@@ -5,6 +5,7 @@ from fastapi.security import OAuth2PasswordBearer
 from punq import Container
 
 from src.common.exc import BaseAppError
+from src.data.repositories.sqlalchemy_replica_routing import ReadYourWritesTracker
 from src.domain.user.entities import User
 from src.domain.user.use_cases.authenticate_user_by_token import AuthenticateUserByTokenUseCase
 from src.logic.api_di_container import get_api_di_container
@@ -21,7 +22,12 @@ async def get_current_user(
 ) -> User:
     use_case: AuthenticateUserByTokenUseCase = container.resolve(AuthenticateUserByTokenUseCase)  # type: ignore
     try:
-        return await use_case.execute(token)
+        user = await use_case.execute(token)
 
     except BaseAppError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.msg) from e
+
+    read_your_writes_tracker: ReadYourWritesTracker = container.resolve(ReadYourWritesTracker)  # type: ignore
+    await read_your_writes_tracker.bind_user(user.guid)
+
+    return user
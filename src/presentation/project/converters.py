@@ -1,5 +1,16 @@
-from src.domain.project.entities import ProjectCreateData, ProjectPatchData, ProjectReportData
-from src.presentation.project.schemas import ProjectCreateScheme, ProjectPatchScheme, ProjectReportSendDataScheme
+from src.domain.project.entities import (
+    ProjectCreateData,
+    ProjectPatchData,
+    ProjectReportBatchData,
+    ProjectReportData,
+    ProjectReportRecipients,
+)
+from src.presentation.project.schemas import (
+    ProjectCreateScheme,
+    ProjectPatchScheme,
+    ProjectReportBatchSendDataScheme,
+    ProjectReportSendDataScheme,
+)
 
 
 def convert_project_create_scheme_to_entity(
@@ -42,3 +53,14 @@ def convert_project_report_send_data_scheme_to_entity(
         project_guid=scheme.project_guid,
         email=scheme.email,
     )
+
+
+def convert_project_report_batch_send_data_scheme_to_entity(
+    scheme: ProjectReportBatchSendDataScheme,
+) -> ProjectReportBatchData:
+    return ProjectReportBatchData(
+        reports=[
+            ProjectReportRecipients(project_guid=report.project_guid, emails=list(report.emails))
+            for report in scheme.reports
+        ],
+    )
@@ -1,32 +1,41 @@
-from typing import Annotated
+from typing import Annotated, Final
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.params import Query
 from punq import Container
 from pydantic import UUID4
 
 from src.common.exc import BaseAppError
+from src.config import get_settings
 from src.domain.project.entities import Project
 from src.domain.project.exc import ProjectNotFoundError
 from src.domain.project.use_cases.create_project import CreateProjectUseCase
 from src.domain.project.use_cases.delete_project_by_guid import DeleteProjectByGUIDUseCase
 from src.domain.project.use_cases.get_project_by_guid_by_guid import GetProjectByGUIDUseCase
 from src.domain.project.use_cases.get_project_list import GetProjectListUseCase
+from src.domain.project.use_cases.get_project_list_rendered import GetProjectListRenderedUseCase
 from src.domain.project.use_cases.patch_project_by_guid import PatchProjectByGUIDUseCase
 from src.domain.project_task_aggregation.use_cases.send_project_report import SendProjectReportUseCase
+from src.domain.project_task_aggregation.use_cases.send_project_report_batch import SendProjectReportBatchUseCase
 from src.domain.task.entities import Task
-from src.domain.task.exc import TaskNotFoundError
+from src.domain.task.exc import TaskBatchInvalidDataError, TaskNotFoundError
 from src.domain.task.use_cases.create_task import CreateTaskUseCase
+from src.domain.task.use_cases.create_task_batch import CreateTaskBatchUseCase
 from src.domain.task.use_cases.delete_task_by_guid import DeleteTaskByGUIDUseCase
 from src.domain.task.use_cases.get_list import GetTaskListByProjectGUIDUseCase
+from src.domain.task.use_cases.get_list_rendered import GetTaskListRenderedByProjectGUIDUseCase
 from src.domain.task.use_cases.patch_task_by_guid import PatchTaskByGUIDUseCase
 from src.domain.user.entities import User
 from src.logic.api_di_container import get_api_di_container
-from src.presentation.common.schemas import ErrorResponse, GUIDResponse
+from src.presentation.common.pagination import ListCursorCodec
+from src.presentation.common.responses import EntityEncoder, get_encoded_response, get_rendered_list_response
+from src.presentation.common.routing import UnitOfWorkAPIRoute
+from src.presentation.common.schemas import ErrorResponse, GUIDListResponse, GUIDResponse, ItemErrorResponse
 from src.presentation.dependencies import get_current_user
 from src.presentation.project.converters import (
     convert_project_create_scheme_to_entity,
     convert_project_patch_scheme_to_entity,
+    convert_project_report_batch_send_data_scheme_to_entity,
     convert_project_report_send_data_scheme_to_entity,
 )
 from src.presentation.project.schemas import (
@@ -34,12 +43,27 @@ from src.presentation.project.schemas import (
     ProjectGetScheme,
     ProjectListGetScheme,
     ProjectPatchScheme,
+    ProjectReportBatchSendDataScheme,
     ProjectReportSendDataScheme,
 )
 from src.presentation.task.converters import convert_task_create_scheme_to_entity, convert_task_patch_scheme_to_entity
-from src.presentation.task.schemas import TaskCreateScheme, TaskListGetScheme, TaskPatchScheme
+from src.presentation.task.schemas import (
+    TaskBatchCreateScheme,
+    TaskCreateScheme,
+    TaskGetScheme,
+    TaskListGetScheme,
+    TaskPatchScheme,
+)
+
+project_v1_router = APIRouter(prefix="/projects", tags=["Projects"], route_class=UnitOfWorkAPIRoute)
 
-project_v1_router = APIRouter(prefix="/projects", tags=["Projects"])
+# only order fields with a (field, guid) index, other orders get no next_cursor and page by offset
+_project_list_cursor_codec: Final[ListCursorCodec] = ListCursorCodec(
+    scheme=ProjectGetScheme,
+    order_fields=("guid", "created_at", "updated_at"),
+)
+_project_encoder: Final[EntityEncoder] = EntityEncoder(scheme=ProjectGetScheme, entity=Project)
+_task_encoder: Final[EntityEncoder] = EntityEncoder(scheme=TaskGetScheme, entity=Task)
 
 
 @project_v1_router.get(
@@ -57,18 +81,47 @@ async def get_project_list(
     container: Annotated[Container, Depends(get_api_di_container)],
     _: Annotated[User, Depends(get_current_user)],
     offset: Annotated[int, Query(ge=0)] = 0,
-    limit: Annotated[int, Query(gt=0, le=10)] = 5,
+    limit: Annotated[int, Query(gt=0, le=100)] = 5,
     order_by: Annotated[str, Query(enum=tuple(ProjectGetScheme.model_fields))] = "created_at",
     reverse: Annotated[bool, Query()] = False,
-) -> dict[str, list[Project]]:
+    after: Annotated[str | None, Query(description="next_cursor of the previous page")] = None,
+) -> Response:
+    try:
+        list_cursor = None if after is None else _project_list_cursor_codec.decode(after, order_by, reverse)
+
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    if get_settings().PG_RENDERED_JSON:
+        rendered_use_case: GetProjectListRenderedUseCase = container.resolve(GetProjectListRenderedUseCase)  # type: ignore
+        try:
+            rendered_projects = await rendered_use_case.execute(offset, limit, order_by, reverse, list_cursor)
+
+        except BaseAppError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.msg) from e
+
+        next_cursor = _project_list_cursor_codec.get_next_after(
+            rendered_projects.last,
+            rendered_projects.count,
+            limit,
+            order_by,
+            reverse,
+        )
+        return get_rendered_list_response("projects", rendered_projects, next_cursor=next_cursor)
+
     use_case: GetProjectListUseCase = container.resolve(GetProjectListUseCase)  # type: ignore
     try:
-        projects = await use_case.execute(offset, limit, order_by, reverse)
+        projects = await use_case.execute(offset, limit, order_by, reverse, list_cursor)
 
     except BaseAppError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.msg) from e
 
-    return {"projects": projects}
+    return get_encoded_response(
+        {
+            "projects": _project_encoder.encode_many(projects),
+            "next_cursor": _project_list_cursor_codec.get_next(projects, limit, order_by, reverse),
+        },
+    )
 
 
 @project_v1_router.post(
@@ -114,10 +167,10 @@ async def get_project(
     container: Annotated[Container, Depends(get_api_di_container)],
     _: Annotated[User, Depends(get_current_user)],
     project_guid: UUID4,
-) -> Project:
+) -> Response:
     use_case: GetProjectByGUIDUseCase = container.resolve(GetProjectByGUIDUseCase)  # type: ignore
     try:
-        return await use_case.execute(project_guid)
+        project = await use_case.execute(project_guid)
 
     except ProjectNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.msg) from e
@@ -125,6 +178,8 @@ async def get_project(
     except BaseAppError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.msg) from e
 
+    return get_encoded_response(_project_encoder.encode(project))
+
 
 @project_v1_router.patch(
     path="/{project_guid}",
@@ -211,6 +266,31 @@ async def send_project_report(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.msg) from e
 
 
+@project_v1_router.post(
+    path="/send_as_report/batch",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=None,
+    responses={
+        status.HTTP_202_ACCEPTED: {"model": None},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
+        status.HTTP_403_FORBIDDEN: {"model": ErrorResponse},
+    },
+    description="Send the reports of several projects by email",
+)
+async def send_project_report_batch(
+    container: Annotated[Container, Depends(get_api_di_container)],
+    _: Annotated[User, Depends(get_current_user)],
+    scheme_data: ProjectReportBatchSendDataScheme,
+) -> None:
+    use_case: SendProjectReportBatchUseCase = container.resolve(SendProjectReportBatchUseCase)  # type: ignore
+    batch_data = convert_project_report_batch_send_data_scheme_to_entity(scheme_data)
+    try:
+        await use_case.execute(batch_data)
+
+    except BaseAppError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.msg) from e
+
+
 @project_v1_router.get(
     path="/{project_guid}/tasks",
     status_code=status.HTTP_200_OK,
@@ -226,7 +306,19 @@ async def get_task_list(
     container: Annotated[Container, Depends(get_api_di_container)],
     _: Annotated[User, Depends(get_current_user)],
     project_guid: UUID4,
-) -> dict[str, list[Task]]:
+) -> Response:
+    if get_settings().PG_RENDERED_JSON:
+        rendered_use_case: GetTaskListRenderedByProjectGUIDUseCase = container.resolve(
+            GetTaskListRenderedByProjectGUIDUseCase,
+        )  # type: ignore
+        try:
+            rendered_tasks = await rendered_use_case.execute(project_guid)
+
+        except BaseAppError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.msg) from e
+
+        return get_rendered_list_response("tasks", rendered_tasks)
+
     use_case: GetTaskListByProjectGUIDUseCase = container.resolve(GetTaskListByProjectGUIDUseCase)  # type: ignore
     try:
         res = await use_case.execute(project_guid)
@@ -234,7 +326,7 @@ async def get_task_list(
     except BaseAppError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.msg) from e
 
-    return {"tasks": res}
+    return get_encoded_response({"tasks": _task_encoder.encode_many(res)})
 
 
 @project_v1_router.post(
@@ -265,6 +357,43 @@ async def create_task(
     return {"guid": res}
 
 
+@project_v1_router.post(
+    path="/{project_guid}/tasks/batch",
+    status_code=status.HTTP_201_CREATED,
+    response_model=GUIDListResponse,
+    responses={
+        status.HTTP_201_CREATED: {"model": GUIDListResponse},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
+        status.HTTP_403_FORBIDDEN: {"model": ErrorResponse},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ItemErrorResponse},
+    },
+    description="Add tasks to the project in one transaction, guids are returned in the request order",
+)
+async def create_task_batch(
+    container: Annotated[Container, Depends(get_api_di_container)],
+    _: Annotated[User, Depends(get_current_user)],
+    project_guid: UUID4,
+    scheme_data: TaskBatchCreateScheme,
+) -> dict[str, list[UUID4]]:
+    use_case: CreateTaskBatchUseCase = container.resolve(CreateTaskBatchUseCase)  # type: ignore
+    task_create_data_seq = [convert_task_create_scheme_to_entity(task_scheme) for task_scheme in scheme_data.tasks]
+    try:
+        res = await use_case.execute(project_guid, task_create_data_seq)
+
+    except TaskBatchInvalidDataError as e:
+        # same shape as request validation errors, so clients handle both per item
+        detail = [
+            {"type": "value_error", "loc": ("body", "tasks", i, "executor_guid"), "msg": msg}
+            for i, msg in e.item_errors.items()
+        ]
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=detail) from e
+
+    except BaseAppError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.msg) from e
+
+    return {"guids": res}
+
+
 @project_v1_router.patch(
     path="/{project_guid}/tasks/{task_guid}",
     status_code=status.HTTP_200_OK,
@@ -273,6 +402,7 @@ async def create_task(
         status.HTTP_200_OK: {"model": GUIDResponse},
         status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
         status.HTTP_403_FORBIDDEN: {"model": ErrorResponse},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorResponse},
     },
     description="Patch the project task",
 )
@@ -305,6 +435,7 @@ async def patch_task(
         status.HTTP_204_NO_CONTENT: {"model": None},
         status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
         status.HTTP_403_FORBIDDEN: {"model": ErrorResponse},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorResponse},
     },
     description="Delete the project task",
 )
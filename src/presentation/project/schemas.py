@@ -53,8 +53,18 @@ class ProjectGetScheme(_ProjectBaseScheme):
 
 class ProjectListGetScheme(BaseModel):
     projects: list[ProjectGetScheme]
+    next_cursor: str | None
 
 
 class ProjectReportSendDataScheme(BaseModel):
     project_guid: UUID4
     email: EmailStr
+
+
+class ProjectReportRecipientsScheme(BaseModel):
+    project_guid: UUID4
+    emails: Annotated[list[EmailStr], Field(min_length=1, max_length=100)]
+
+
+class ProjectReportBatchSendDataScheme(BaseModel):
+    reports: Annotated[list[ProjectReportRecipientsScheme], Field(min_length=1, max_length=100)]
@@ -15,6 +15,10 @@ class TaskCreateScheme(_TaskBaseScheme):
     pass
 
 
+class TaskBatchCreateScheme(BaseModel):
+    tasks: Annotated[list[TaskCreateScheme], Field(min_length=1, max_length=500)]
+
+
 class TaskPatchScheme(TaskCreateScheme):
     title: Annotated[str | None, Field(min_length=5, max_length=256)]  # type: ignore
     description: str | None  # type: ignore
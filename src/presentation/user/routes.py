@@ -1,10 +1,10 @@
-from typing import Annotated
+from typing import Annotated, Final
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from punq import Container
 from pydantic import UUID4
 
-from src.common.exc import BaseAppError
+from src.common.exc import BaseAppError, ExecutorSaturatedError
 from src.domain.user.entities import User
 from src.domain.user.exc import UserNotFoundError
 from src.domain.user.use_cases.create_user import CreateUserUseCase
@@ -13,6 +13,9 @@ from src.domain.user.use_cases.get_one_user_by_guid import GetOneUserByGUIDUseCa
 from src.domain.user.use_cases.get_user_list import GetUserListUseCase
 from src.domain.user.use_cases.patch_user_by_guid import PatchUserByGUIDUseCase
 from src.logic.api_di_container import get_api_di_container
+from src.presentation.common.pagination import ListCursorCodec
+from src.presentation.common.responses import EntityEncoder, get_encoded_response
+from src.presentation.common.routing import UnitOfWorkAPIRoute
 from src.presentation.common.schemas import ErrorResponse, GUIDResponse
 from src.presentation.dependencies import get_current_user
 from src.presentation.user.converters import (
@@ -21,7 +24,14 @@ from src.presentation.user.converters import (
 )
 from src.presentation.user.schemas import UserCreateScheme, UserGetScheme, UserListGetScheme, UserPatchScheme
 
-user_v1_router = APIRouter(prefix="/users", tags=["Users"])
+user_v1_router = APIRouter(prefix="/users", tags=["Users"], route_class=UnitOfWorkAPIRoute)
+
+# only order fields with a (field, guid) index, other orders get no next_cursor and page by offset
+_user_list_cursor_codec: Final[ListCursorCodec] = ListCursorCodec(
+    scheme=UserGetScheme,
+    order_fields=("guid", "created_at", "updated_at"),
+)
+_user_encoder: Final[EntityEncoder] = EntityEncoder(scheme=UserGetScheme, entity=User)
 
 
 @user_v1_router.get(
@@ -39,18 +49,30 @@ async def get_user_list(
     container: Annotated[Container, Depends(get_api_di_container)],
     _: Annotated[User, Depends(get_current_user)],
     offset: Annotated[int, Query(ge=0)] = 0,
-    limit: Annotated[int, Query(gt=0, le=10)] = 5,
+    limit: Annotated[int, Query(gt=0, le=100)] = 5,
     order_by: Annotated[str, Query(enum=tuple(UserGetScheme.model_fields))] = "created_at",
     reverse: Annotated[bool, Query()] = False,
-) -> dict[str, list[User]]:
+    after: Annotated[str | None, Query(description="next_cursor of the previous page")] = None,
+) -> Response:
     use_case: GetUserListUseCase = container.resolve(GetUserListUseCase)  # type: ignore
     try:
-        users = await use_case.execute(offset, limit, order_by, reverse)
+        list_cursor = None if after is None else _user_list_cursor_codec.decode(after, order_by, reverse)
+
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    try:
+        users = await use_case.execute(offset, limit, order_by, reverse, list_cursor)
 
     except BaseAppError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.msg) from e
 
-    return {"users": users}
+    return get_encoded_response(
+        {
+            "users": _user_encoder.encode_many(users),
+            "next_cursor": _user_list_cursor_codec.get_next(users, limit, order_by, reverse),
+        },
+    )
 
 
 @user_v1_router.post(
@@ -61,6 +83,7 @@ async def get_user_list(
         status.HTTP_201_CREATED: {"model": GUIDResponse},
         status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
         status.HTTP_403_FORBIDDEN: {"model": ErrorResponse},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ErrorResponse},
     },
     description="Create a new user",
 )
@@ -74,6 +97,9 @@ async def create_user(
     try:
         guid = await use_case.execute(user_create_data)
 
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.msg) from e
+
     except BaseAppError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.msg) from e
 
@@ -96,10 +122,10 @@ async def get_user(
     container: Annotated[Container, Depends(get_api_di_container)],
     _: Annotated[User, Depends(get_current_user)],
     user_guid: UUID4,
-) -> User:
+) -> Response:
     use_case: GetOneUserByGUIDUseCase = container.resolve(GetOneUserByGUIDUseCase)  # type: ignore
     try:
-        return await use_case.execute(user_guid=user_guid)
+        user = await use_case.execute(user_guid=user_guid)
 
     except UserNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.msg) from e
@@ -107,6 +133,8 @@ async def get_user(
     except BaseAppError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.msg) from e
 
+    return get_encoded_response(_user_encoder.encode(user))
+
 
 @user_v1_router.patch(
     path="/{user_guid}",
@@ -117,6 +145,7 @@ async def get_user(
         status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse},
         status.HTTP_403_FORBIDDEN: {"model": ErrorResponse},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ErrorResponse},
     },
     description="Patch user by guid",
 )
@@ -134,6 +163,9 @@ async def patch_user(
     except UserNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.msg) from e
 
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.msg) from e
+
     except BaseAppError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.msg) from e
 
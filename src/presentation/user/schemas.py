@@ -36,3 +36,4 @@ class UserGetScheme(_UserBaseScheme):
 
 class UserListGetScheme(BaseModel):
     users: list[UserGetScheme]
+    next_cursor: str | None
@@ -1,50 +1,81 @@
 from datetime import UTC, datetime, timedelta
+from hashlib import sha256
 from logging import getLogger
 from uuid import UUID
 
 import jwt
 
+from src.common.ttl_lru_cache import TTLLRUCache
 from src.config import get_settings
+from src.domain.user.entities import AuthTokenPayload
 from src.domain.user.enums import AuthTokenTyp
 from src.domain.user.exc import UserInvalidTokenError
 
 logger = getLogger()
 
 
-class AuthService:
+class AuthTokenPayloadCache(TTLLRUCache[bytes, AuthTokenPayload]):
+    """Per-worker cache of already verified tokens, keyed by the token digest"""
+
     __slots__ = ()
 
-    def validate_token_and_extract_user_guid(
-        self,
-        token: str,
-        expected_token_typ: AuthTokenTyp = AuthTokenTyp.ACCESS,
-    ) -> UUID:
+    @staticmethod
+    def get_token_digest(token: str) -> bytes:
+        return sha256(token.encode()).digest()
+
+
+class AuthService:
+    __slots__ = ("_token_payload_cache",)
+
+    def __init__(self, token_payload_cache: AuthTokenPayloadCache) -> None:
+        self._token_payload_cache = token_payload_cache
+
+    def _decode_token(self, token: str) -> AuthTokenPayload:
+        token_digest = self._token_payload_cache.get_token_digest(token)
+        cached_token_payload = self._token_payload_cache.get(token_digest)
+
+        if cached_token_payload is not None:
+            return cached_token_payload
+
         try:
-            token_payload = jwt.decode(
+            decoded_token = jwt.decode(
                 jwt=token,
                 key=get_settings().JWT_SECRET_KEY,
                 algorithms=(get_settings().JWT_ALGORITHM,),
             )
-            user_guid = UUID(token_payload["sub"])
-            token_typ = AuthTokenTyp(token_payload["typ"])
-            exp = token_payload["exp"]
+            token_payload = AuthTokenPayload(
+                user_guid=UUID(decoded_token["sub"]),
+                typ=AuthTokenTyp(decoded_token["typ"]),
+                exp=decoded_token["exp"],
+            )
 
         except (jwt.PyJWTError, KeyError, ValueError) as e:
             logger.warning("Error while decoding token %s error: %s", token, e)
             msg = f"Error while decoding token {token}"
             raise UserInvalidTokenError(msg) from e
 
-        if token_typ != expected_token_typ:
+        self._token_payload_cache.set(token_digest, token_payload, expires_at=token_payload.exp)
+
+        return token_payload
+
+    def validate_token_and_extract_user_guid(
+        self,
+        token: str,
+        expected_token_typ: AuthTokenTyp = AuthTokenTyp.ACCESS,
+    ) -> UUID:
+        token_payload = self._decode_token(token)
+
+        if token_payload.typ != expected_token_typ:
             logger.warning("Error while decoding token %s invalid token_typ %s", token, expected_token_typ)
             msg = f"Error while decoding token {token}"
             raise UserInvalidTokenError(msg)
 
-        if datetime.fromtimestamp(exp, UTC) < datetime.now(UTC):
+        if datetime.fromtimestamp(token_payload.exp, UTC) < datetime.now(UTC):
             logger.info("Decoded expired token")
             msg = "Expired token"
             raise UserInvalidTokenError(msg)
 
-        return user_guid
+        return token_payload.user_guid
 
     def generate_token(
         self,
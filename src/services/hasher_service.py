@@ -1,11 +1,30 @@
 import bcrypt
 
+from src.common.bounded_executor import BoundedThreadPoolExecutor
+
+
+def get_psw_hash(psw: str) -> str:
+    return (bcrypt.hashpw(password=psw.encode(), salt=bcrypt.gensalt())).decode()
+
+
+def verify_psw(psw_to_check: str, hashed_psw: str) -> bool:
+    return bcrypt.checkpw(password=psw_to_check.encode(), hashed_password=hashed_psw.encode())
+
+
+class HasherExecutor(BoundedThreadPoolExecutor):
+    """bcrypt releases the GIL, so hashing threads run in parallel across cores"""
 
-class HasherService:
     __slots__ = ()
 
-    def get_psw_hash(self, psw: str) -> str:
-        return (bcrypt.hashpw(password=psw.encode(), salt=bcrypt.gensalt())).decode()
 
-    def verify_psw(self, psw_to_check: str, hashed_psw: str) -> bool:
-        return bcrypt.checkpw(password=psw_to_check.encode(), hashed_password=hashed_psw.encode())
+class HasherService:
+    __slots__ = ("_executor",)
+
+    def __init__(self, executor: HasherExecutor) -> None:
+        self._executor = executor
+
+    async def get_psw_hash(self, psw: str) -> str:
+        return await self._executor.run(get_psw_hash, psw)
+
+    async def verify_psw(self, psw_to_check: str, hashed_psw: str) -> bool:
+        return await self._executor.run(verify_psw, psw_to_check, hashed_psw)
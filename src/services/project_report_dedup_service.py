@@ -0,0 +1,42 @@
+from logging import getLogger
+
+from src.data.repositories.project_task_aggregation.dedup_base import AbstractProjectReportDedupRepository
+from src.domain.project.entities import ProjectReportData
+from src.domain.project_task_aggregation.enums import ProjectReportDedupStage
+
+logger = getLogger()
+
+
+class ProjectReportDedupService:
+    __slots__ = ("_project_report_dedup_repository", "suppressed_duplicates")
+
+    def __init__(self, project_report_dedup_repository: AbstractProjectReportDedupRepository) -> None:
+        self._project_report_dedup_repository = project_report_dedup_repository
+        # per process, logged on shutdown
+        self.suppressed_duplicates = 0
+
+    async def claim(self, stage: ProjectReportDedupStage, report_data: ProjectReportData, claim_id: str) -> bool:
+        """Claims the report for the stage. Returns False and counts the report as a suppressed duplicate if it was
+        done within the window or another copy holds the claim. A claim is ended with `complete` or `release`
+        """
+
+        if await self._project_report_dedup_repository.add_claim(stage, report_data, claim_id):
+            if not await self._project_report_dedup_repository.exists_done(stage, report_data):
+                return True
+
+            await self._project_report_dedup_repository.delete_claim(stage, report_data)
+
+        self.suppressed_duplicates += 1
+        logger.info(
+            "Duplicate project %s report to email %s suppressed at %s",
+            report_data.project_guid,
+            report_data.email,
+            stage,
+        )
+        return False
+
+    async def complete(self, stage: ProjectReportDedupStage, report_data: ProjectReportData) -> None:
+        await self._project_report_dedup_repository.add_done(stage, report_data)
+
+    async def release(self, stage: ProjectReportDedupStage, report_data: ProjectReportData) -> None:
+        await self._project_report_dedup_repository.delete_claim(stage, report_data)
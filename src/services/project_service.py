@@ -1,7 +1,10 @@
+from dataclasses import replace
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
+from src.common.dataclass_changes import get_changed_fields
 from src.data.repositories.project.base import AbstractProjectRepository
+from src.domain.common.entities import ListCursor, RenderedList
 from src.domain.project.entities import Project, ProjectCreateData, ProjectPatchData
 
 
@@ -17,12 +20,30 @@ class ProjectService:
         offset: int,
         order_by: str,
         reverse: bool,
+        after: ListCursor | None,
     ) -> list[Project]:
         return await self._project_repository.get_list(
             limit=limit,
             offset=offset,
             order_by=order_by,
             reverse=reverse,
+            after=after,
+        )
+
+    async def get_list_rendered(
+        self,
+        limit: int,
+        offset: int,
+        order_by: str,
+        reverse: bool,
+        after: ListCursor | None,
+    ) -> RenderedList:
+        return await self._project_repository.get_list_rendered(
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            reverse=reverse,
+            after=after,
         )
 
     async def get_one_by_guid(self, guid: UUID) -> Project:
@@ -45,6 +66,8 @@ class ProjectService:
         return await self._project_repository.create_one(project=project)
 
     async def patch_one(self, project: Project, project_patch_data: ProjectPatchData) -> UUID:
+        original_project = replace(project)
+
         if project_patch_data.title is not None:
             project.title = project_patch_data.title
 
@@ -66,7 +89,11 @@ class ProjectService:
         project.mentor_guid = project_patch_data.mentor_guid
         project.updated_at = datetime.now(UTC)
 
-        return await self._project_repository.patch_one(project=project)
+        # only changed columns are written, unchanged large text and jsonb values are left alone
+        return await self._project_repository.patch_one(
+            guid=project.guid,
+            values=get_changed_fields(original_project, project),
+        )
 
     async def delete_one(self, project: Project) -> UUID:
         return await self._project_repository.delete_one(project=project)
@@ -1,17 +1,37 @@
 from uuid import UUID
 
 from src.data.repositories.project_task_aggregation.base import AbstractProjectTaskAggregationRepository
-from src.domain.project_task_aggregation.entities import ProjectTaskAggregation
+from src.data.repositories.project_task_aggregation.cache_base import AbstractProjectReportCacheRepository
+from src.domain.project_task_aggregation.entities import ProjectTaskAggregation, ProjectTaskAggregationVersion
 
 
 class ProjectTaskAggregationService:
-    __slots__ = ("_project_task_aggregation_repository",)
+    __slots__ = ("_project_report_cache_repository", "_project_task_aggregation_repository")
 
     def __init__(
         self,
         project_task_aggregation_repository: AbstractProjectTaskAggregationRepository,
+        project_report_cache_repository: AbstractProjectReportCacheRepository,
     ) -> None:
         self._project_task_aggregation_repository = project_task_aggregation_repository
+        self._project_report_cache_repository = project_report_cache_repository
+
+    @staticmethod
+    def get_version(aggregation: ProjectTaskAggregation) -> ProjectTaskAggregationVersion:
+        return ProjectTaskAggregationVersion(
+            project_updated_at=aggregation.project.updated_at,
+            tasks_updated_at=max((task.updated_at for task in aggregation.tasks), default=None),
+            task_count=len(aggregation.tasks),
+        )
 
     async def get_one_project_with_tasks_by_guid(self, project_guid: UUID) -> ProjectTaskAggregation:
         return await self._project_task_aggregation_repository.get_one_project_with_tasks_by_guid(project_guid)
+
+    async def get_version_by_project_guid(self, project_guid: UUID) -> ProjectTaskAggregationVersion:
+        return await self._project_task_aggregation_repository.get_version_by_project_guid(project_guid)
+
+    async def get_cached_report(self, project_guid: UUID, version: ProjectTaskAggregationVersion) -> str | None:
+        return await self._project_report_cache_repository.get_one(project_guid, version)
+
+    async def add_cached_report(self, project_guid: UUID, version: ProjectTaskAggregationVersion, report: str) -> None:
+        await self._project_report_cache_repository.add_one(project_guid, version, report)
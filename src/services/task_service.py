@@ -1,7 +1,10 @@
+from collections.abc import Sequence
+from dataclasses import asdict
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 from src.data.repositories.task.base import AbstractTaskRepository
+from src.domain.common.entities import RenderedList
 from src.domain.task.entities import Task, TaskCreateData, TaskPatchData
 
 
@@ -14,11 +17,15 @@ class TaskService:
     async def get_list_by_project_guid(self, project_guid: UUID) -> list[Task]:
         return await self._task_repository.get_list_by_project_guid(project_guid)
 
+    async def get_list_rendered_by_project_guid(self, project_guid: UUID) -> RenderedList:
+        return await self._task_repository.get_list_rendered_by_project_guid(project_guid)
+
     async def get_one_by_guid(self, guid: UUID) -> Task:
         return await self._task_repository.get_one_by_guid(guid)
 
-    async def create_one(self, project_guid: UUID, task_create_data: TaskCreateData) -> UUID:
-        task = Task(
+    @staticmethod
+    def _build_task(project_guid: UUID, task_create_data: TaskCreateData) -> Task:
+        return Task(
             guid=uuid4(),
             created_at=datetime.now(UTC),
             updated_at=datetime.now(UTC),
@@ -28,23 +35,19 @@ class TaskService:
             project_guid=project_guid,
             executor_guid=task_create_data.executor_guid,
         )
-        return await self._task_repository.create_one(task)
-
-    async def patch_one(self, task: Task, task_patch_data: TaskPatchData) -> UUID:
-        if task_patch_data.title is not None:
-            task.title = task_patch_data.title
 
-        if task_patch_data.description is not None:
-            task.description = task_patch_data.description
-
-        if task_patch_data.is_completed is not None:
-            task.is_completed = task_patch_data.is_completed
+    async def create_one(self, project_guid: UUID, task_create_data: TaskCreateData) -> UUID:
+        task = self._build_task(project_guid, task_create_data)
+        return await self._task_repository.create_one(task)
 
-        if task_patch_data.executor_guid is not None:
-            task.executor_guid = task_patch_data.executor_guid
+    async def create_many(self, project_guid: UUID, task_create_data_seq: Sequence[TaskCreateData]) -> list[UUID]:
+        tasks = [self._build_task(project_guid, task_create_data) for task_create_data in task_create_data_seq]
+        return await self._task_repository.create_many(tasks)
 
-        task.updated_at = datetime.now(UTC)
-        return await self._task_repository.patch_one(task)
+    async def patch_one(self, project_guid: UUID, guid: UUID, task_patch_data: TaskPatchData) -> UUID:
+        values = {field: value for field, value in asdict(task_patch_data).items() if value is not None}
+        values["updated_at"] = datetime.now(UTC)
+        return await self._task_repository.patch_one(project_guid, guid, values)
 
-    async def delete_one(self, task: Task) -> UUID:
-        return await self._task_repository.delete_one(task)
+    async def delete_one(self, project_guid: UUID, guid: UUID) -> UUID:
+        return await self._task_repository.delete_one(project_guid, guid)
@@ -1,9 +1,15 @@
+from dataclasses import replace
 from datetime import UTC, datetime
+from functools import partial
 from logging import getLogger
 from uuid import UUID, uuid4
 
+from src.common.dataclass_changes import get_changed_fields
+from src.common.single_flight import SingleFlight
+from src.data.repositories.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
 from src.data.repositories.user.base import AbstractUserRepository
 from src.data.repositories.user.cashe_base import AbstractUserCacheRepository
+from src.domain.common.entities import ListCursor
 from src.domain.user.entities import User, UserCreateData, UserPatchData
 from src.domain.user.exc import UserIsSoftDeletedError
 from src.services.hasher_service import HasherService
@@ -11,10 +17,15 @@ from src.services.hasher_service import HasherService
 logger = getLogger()
 
 
+class UserLoadSingleFlight(SingleFlight[UUID, User]):
+    __slots__ = ()
+
+
 class UserService:
     __slots__ = (
         "_hasher_service",
         "_user_cache_repository",
+        "_user_load_single_flight",
         "_user_repository",
     )
 
@@ -23,10 +34,12 @@ class UserService:
         user_cache_repository: AbstractUserCacheRepository,
         user_repository: AbstractUserRepository,
         hasher_service: HasherService,
+        user_load_single_flight: UserLoadSingleFlight,
     ) -> None:
         self._user_cache_repository = user_cache_repository
         self._user_repository = user_repository
         self._hasher_service = hasher_service
+        self._user_load_single_flight = user_load_single_flight
 
     async def get_list(
         self,
@@ -34,30 +47,39 @@ class UserService:
         limit: int,
         order_by: str,
         reverse: bool,
+        after: ListCursor | None,
     ) -> list[User]:
         return await self._user_repository.get_list(
             limit=limit,
             offset=offset,
             order_by=order_by,
             reverse=reverse,
+            after=after,
         )
 
+    async def _load_one_by_guid(self, guid: UUID) -> User:
+        user = await self._user_repository.get_one_by_guid(guid)
+
+        if not user.is_deleted:
+            await self._user_cache_repository.add_one(user)
+
+        return user
+
     async def get_one_by_guid(self, guid: UUID) -> User:
-        user_from_cashe = await self._user_cache_repository.get_one(guid)
+        user = await self._user_cache_repository.get_one(guid)
 
-        if user_from_cashe is not None:
-            user = user_from_cashe
-        else:
-            user = await self._user_repository.get_one_by_guid(guid)
+        if user is None and SQLAlchemyUnitOfWork.get_current() is not None:
+            # the shared load runs on its own connection, a unit of work already holds one
+            user = await self._load_one_by_guid(guid)
+        elif user is None:
+            # concurrent cache misses share one db load, each caller gets its own copy to mutate
+            user = replace(await self._user_load_single_flight.do(guid, self._load_one_by_guid, guid))
 
         if user.is_deleted:
             logger.warning("Attempt to fetch soft deleted user by guid %s", guid)
             msg = f"User {guid} not found"
             raise UserIsSoftDeletedError(msg)
 
-        if user_from_cashe is None:
-            await self._user_cache_repository.add_one(user)
-
         return user
 
     async def get_one_by_username(self, username: str) -> User:
@@ -75,7 +97,7 @@ class UserService:
             guid=uuid4(),
             username=user_create_data.username,
             email=user_create_data.email,
-            password=self._hasher_service.get_psw_hash(user_create_data.password),
+            password=await self._hasher_service.get_psw_hash(user_create_data.password),
             first_name=user_create_data.first_name,
             second_name=user_create_data.second_name,
             gender=user_create_data.gender,
@@ -90,19 +112,26 @@ class UserService:
         )
         user_guid = await self._user_repository.create_one(user=user)
 
-        await self._user_cache_repository.delete_one(user_guid)
+        await SQLAlchemyUnitOfWork.run_after_commit(partial(self._user_cache_repository.delete_one, user_guid))
 
         return user_guid
 
-    async def patch_one(self, user: User, user_patch_data: UserPatchData) -> UUID:
+    async def get_psw_hash(self, password: str) -> str:
+        return await self._hasher_service.get_psw_hash(password)
+
+    async def patch_one(self, user: User, user_patch_data: UserPatchData, psw_hash: str | None) -> UUID:
+        """`psw_hash` of `user_patch_data.password`, hashed by the caller before its unit of work reads the db"""
+
+        original_user = replace(user)
+
         if user_patch_data.username is not None:
             user.username = user_patch_data.username
 
         if user_patch_data.email is not None:
             user.email = user_patch_data.email
 
-        if user_patch_data.password is not None:
-            user.password = self._hasher_service.get_psw_hash(user.password)
+        if psw_hash is not None:
+            user.password = psw_hash
 
         user.first_name = user_patch_data.first_name
         user.second_name = user_patch_data.second_name
@@ -113,17 +142,20 @@ class UserService:
         user.date_of_birth = user_patch_data.date_of_birth
         user.updated_at = datetime.now(UTC)
 
-        user_guid = await self._user_repository.patch_one(user=user)
+        user_guid = await self._user_repository.patch_one(
+            guid=user.guid,
+            values=get_changed_fields(original_user, user),
+        )
 
-        await self._user_cache_repository.delete_one(user_guid)
+        await SQLAlchemyUnitOfWork.run_after_commit(partial(self._user_cache_repository.delete_one, user_guid))
 
         return user_guid
 
     async def soft_delete_one_by_guid(self, user: User) -> UUID:
-        user.is_deleted = True
-        user.deleted_at = datetime.now(UTC)
-
-        user_guid = await self._user_repository.patch_one(user)
-        await self._user_cache_repository.delete_one(user_guid)
+        user_guid = await self._user_repository.patch_one(
+            guid=user.guid,
+            values={"is_deleted": True, "deleted_at": datetime.now(UTC)},
+        )
+        await SQLAlchemyUnitOfWork.run_after_commit(partial(self._user_cache_repository.delete_one, user_guid))
 
         return user_guid
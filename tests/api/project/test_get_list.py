@@ -1,8 +1,13 @@
+from typing import Any
+
 import orjson
 import pytest
 from fastapi import FastAPI, status
 from httpx import AsyncClient
 
+from src.config import get_settings
+from src.presentation.project import routes
+
 
 @pytest.mark.asyncio(loop_scope="session")
 async def test_get_project_list(
@@ -21,3 +26,91 @@ async def test_get_project_list(
 
     for project in prjects:
         assert project["title"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_project_list_by_cursor(
+    app: FastAPI,
+    client: AsyncClient,
+    auth_token_headers: dict[str, str],
+) -> None:
+    url = app.url_path_for("get_project_list")
+    params: dict[str, str | int] = {"limit": 1, "order_by": "created_at"}
+    seen_guids = []
+
+    while True:
+        res = await client.get(url, headers=auth_token_headers, params=params)
+        assert res.status_code == status.HTTP_200_OK
+
+        res_json = orjson.loads(res.content)
+        seen_guids.extend(project["guid"] for project in res_json["projects"])
+
+        if res_json["next_cursor"] is None:
+            break
+
+        params["after"] = res_json["next_cursor"]
+
+    assert seen_guids
+    assert len(seen_guids) == len(set(seen_guids))
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_project_list_by_invalid_cursor(
+    app: FastAPI,
+    client: AsyncClient,
+    auth_token_headers: dict[str, str],
+) -> None:
+    url = app.url_path_for("get_project_list")
+
+    res = await client.get(url, headers=auth_token_headers, params={"after": "invalid"})
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_project_list_has_no_cursor_for_unindexed_order(
+    app: FastAPI,
+    client: AsyncClient,
+    auth_token_headers: dict[str, str],
+) -> None:
+    url = app.url_path_for("get_project_list")
+
+    res = await client.get(url, headers=auth_token_headers, params={"limit": 1, "order_by": "title"})
+    assert res.status_code == status.HTTP_200_OK
+    assert orjson.loads(res.content)["next_cursor"] is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_project_list_rendered_by_db(
+    app: FastAPI,
+    client: AsyncClient,
+    auth_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    url = app.url_path_for("get_project_list")
+    params: dict[str, str | int] = {"limit": 2, "order_by": "updated_at", "reverse": "true"}
+    pages: list[list[dict[str, Any]]] = [[], []]
+
+    for rendered_json, page in zip((False, True), pages, strict=True):
+        settings = get_settings().model_copy(update={"PG_RENDERED_JSON": rendered_json})
+        monkeypatch.setattr(routes, "get_settings", lambda settings=settings: settings)
+        params.pop("after", None)
+
+        while True:
+            res = await client.get(url, headers=auth_token_headers, params=params)
+            assert res.status_code == status.HTTP_200_OK
+
+            res_json = orjson.loads(res.content)
+            page.extend(res_json["projects"])
+
+            if res_json["next_cursor"] is None:
+                break
+
+            params["after"] = res_json["next_cursor"]
+
+    orm_projects, rendered_projects = pages
+    for project in (*orm_projects, *rendered_projects):
+        # a set in the scheme, its order is not stable
+        project["tech_stack"] = sorted(project["tech_stack"])
+
+    assert rendered_projects
+    assert rendered_projects == orm_projects
@@ -2,7 +2,11 @@ import pytest
 from fastapi import FastAPI, status
 from httpx import AsyncClient
 
-from src.presentation.project.schemas import ProjectReportSendDataScheme
+from src.presentation.project.schemas import (
+    ProjectReportBatchSendDataScheme,
+    ProjectReportRecipientsScheme,
+    ProjectReportSendDataScheme,
+)
 from tests.mock_data import MOCK_PROJECT_GET_GUID
 
 
@@ -24,3 +28,25 @@ async def test_send_project_report(
         headers=auth_token_headers,
     )
     assert res.status_code == status.HTTP_202_ACCEPTED
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_send_project_report_batch(
+    app: FastAPI,
+    client: AsyncClient,
+    auth_token_headers: dict[str, str],
+) -> None:
+    url = app.url_path_for("send_project_report_batch")
+    data = ProjectReportBatchSendDataScheme(
+        reports=[
+            ProjectReportRecipientsScheme(project_guid=MOCK_PROJECT_GET_GUID, emails=["test@email.com"]),
+            ProjectReportRecipientsScheme(project_guid=MOCK_PROJECT_GET_GUID, emails=["other@email.com"]),
+        ],
+    )
+
+    res = await client.post(
+        url,
+        json=data.model_dump(mode="json"),
+        headers=auth_token_headers,
+    )
+    assert res.status_code == status.HTTP_202_ACCEPTED
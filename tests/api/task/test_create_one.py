@@ -6,6 +6,7 @@ import pytest
 from fastapi import FastAPI, status
 from httpx import AsyncClient
 
+from src.presentation.common.schemas import ItemErrorResponse
 from src.presentation.task.schemas import TaskCreateScheme
 from tests.mock_data import MOCK_PROJECT_GET_GUID, MOCK_USER_AUTH_GUID
 
@@ -65,3 +66,84 @@ async def test_create_task_failed_with_non_existing_executor(
 
     res = await client.post(url, headers=auth_token_headers, json=data.model_dump(mode="json"))
     assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_task_batch(
+    app: FastAPI,
+    client: AsyncClient,
+    auth_token_headers: dict[str, str],
+) -> None:
+    url = app.url_path_for("create_task_batch", project_guid=str(MOCK_PROJECT_GET_GUID))
+    titles = [f"batch_title_{i}" for i in range(3)]
+    data = {
+        "tasks": [
+            TaskCreateScheme(
+                title=title,
+                description=token_urlsafe(16),
+                is_completed=False,
+                executor_guid=MOCK_USER_AUTH_GUID,
+            ).model_dump(mode="json")
+            for title in titles
+        ],
+    }
+
+    res = await client.post(url, headers=auth_token_headers, json=data)
+    assert res.status_code == status.HTTP_201_CREATED
+
+    guids = orjson.loads(res.content)["guids"]
+    assert len(guids) == len(titles)
+
+    url = app.url_path_for("get_task_list", project_guid=str(MOCK_PROJECT_GET_GUID))
+    res = await client.get(url, headers=auth_token_headers)
+    titles_by_guid = {task["guid"]: task["title"] for task in orjson.loads(res.content)["tasks"]}
+    assert [titles_by_guid[guid] for guid in guids] == titles
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_task_batch_failed_with_non_existing_executor(
+    app: FastAPI,
+    client: AsyncClient,
+    auth_token_headers: dict[str, str],
+) -> None:
+    url = app.url_path_for("create_task_batch", project_guid=str(MOCK_PROJECT_GET_GUID))
+    executor_guids = (MOCK_USER_AUTH_GUID, uuid4(), MOCK_USER_AUTH_GUID)
+    data = {
+        "tasks": [
+            TaskCreateScheme(
+                title="batch_title",
+                description=token_urlsafe(16),
+                is_completed=False,
+                executor_guid=executor_guid,
+            ).model_dump(mode="json")
+            for executor_guid in executor_guids
+        ],
+    }
+
+    res = await client.post(url, headers=auth_token_headers, json=data)
+    assert res.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    [item_error] = ItemErrorResponse.model_validate_json(res.content).detail
+    assert item_error.loc == ["body", "tasks", 1, "executor_guid"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_task_batch_failed_with_non_existing_project(
+    app: FastAPI,
+    client: AsyncClient,
+    auth_token_headers: dict[str, str],
+) -> None:
+    url = app.url_path_for("create_task_batch", project_guid=str(uuid4()))
+    data = {
+        "tasks": [
+            TaskCreateScheme(
+                title="batch_title",
+                description=token_urlsafe(16),
+                is_completed=False,
+                executor_guid=MOCK_USER_AUTH_GUID,
+            ).model_dump(mode="json"),
+        ],
+    }
+
+    res = await client.post(url, headers=auth_token_headers, json=data)
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
@@ -5,6 +5,8 @@ import pytest
 from fastapi import FastAPI, status
 from httpx import AsyncClient
 
+from src.config import get_settings
+from src.presentation.project import routes
 from tests.mock_data import MOCK_PROJECT_GET_GUID
 
 
@@ -31,3 +33,22 @@ async def test_get_task_list(
         assert task["created_at"]
         assert task["updated_at"]
         assert task["title"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_task_list_rendered_by_db(
+    app: FastAPI,
+    client: AsyncClient,
+    auth_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    url = app.url_path_for("get_task_list", project_guid=str(MOCK_PROJECT_GET_GUID))
+    res = await client.get(url, headers=auth_token_headers)
+
+    settings = get_settings().model_copy(update={"PG_RENDERED_JSON": True})
+    monkeypatch.setattr(routes, "get_settings", lambda: settings)
+    rendered_res = await client.get(url, headers=auth_token_headers)
+
+    assert rendered_res.status_code == status.HTTP_200_OK
+    assert orjson.loads(rendered_res.content)["tasks"]
+    assert orjson.loads(rendered_res.content) == orjson.loads(res.content)
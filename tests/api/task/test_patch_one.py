@@ -54,7 +54,7 @@ async def test_patch_task_failed_with_non_existing_project(
     )
 
     res = await client.patch(url, headers=auth_token_headers, json=data.model_dump(mode="json"))
-    assert res.status_code == status.HTTP_400_BAD_REQUEST
+    assert res.status_code == status.HTTP_404_NOT_FOUND
 
 
 @pytest.mark.asyncio(loop_scope="session")
@@ -23,3 +23,41 @@ async def test_get_user_list(
         assert user["username"]
         assert user["email"]
         assert user.get("password") is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_user_list_by_cursor(
+    app: FastAPI,
+    client: AsyncClient,
+    auth_token_headers: dict[str, str],
+) -> None:
+    url = app.url_path_for("get_user_list")
+    params: dict[str, str | int] = {"limit": 1, "order_by": "created_at"}
+    seen_guids = []
+
+    while True:
+        res = await client.get(url, headers=auth_token_headers, params=params)
+        assert res.status_code == status.HTTP_200_OK
+
+        res_json = orjson.loads(res.content)
+        seen_guids.extend(user["guid"] for user in res_json["users"])
+
+        if res_json["next_cursor"] is None:
+            break
+
+        params["after"] = res_json["next_cursor"]
+
+    assert seen_guids
+    assert len(seen_guids) == len(set(seen_guids))
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_user_list_by_invalid_cursor(
+    app: FastAPI,
+    client: AsyncClient,
+    auth_token_headers: dict[str, str],
+) -> None:
+    url = app.url_path_for("get_user_list")
+
+    res = await client.get(url, headers=auth_token_headers, params={"after": "invalid"})
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
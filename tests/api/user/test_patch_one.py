@@ -1,14 +1,22 @@
 from datetime import UTC, datetime
+from secrets import token_urlsafe
+from typing import Any
 from uuid import UUID, uuid4
 
 import orjson
 import pytest
 from fastapi import FastAPI, status
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
 
+from src.data.repositories.user.cashe_base import AbstractUserCacheRepository
 from src.domain.user.enums import UserGender
 from src.presentation.user.schemas import UserPatchScheme
-from tests.mock_data import MOCK_USER_PATCH_GUID
+from src.services.hasher_service import HasherService
+from src.services.user_service import UserService
+from tests.logic.mock_api_di_container import get_mock_api_di_container
+from tests.mock_data import MOCK_USER_AUTH_GUID, MOCK_USER_PATCH_GUID
 
 
 @pytest.mark.asyncio(loop_scope="session")
@@ -68,3 +76,87 @@ async def test_patch_user_failed_with_non_existing_user(
         headers=auth_token_headers,
     )
     assert res.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_patch_user_checks_out_one_connection_for_its_unit_of_work(
+    app: FastAPI,
+    client: AsyncClient,
+    auth_token_headers: dict[str, str],
+) -> None:
+    container = get_mock_api_di_container()
+    user_cache_repository: AbstractUserCacheRepository = container.resolve(AbstractUserCacheRepository)  # type: ignore
+    async_engine: AsyncEngine = container.resolve(AsyncEngine)  # type: ignore
+    # cache misses make both the current and the patched user load from the db
+    await user_cache_repository.delete_one(MOCK_USER_AUTH_GUID)
+    await user_cache_repository.delete_one(MOCK_USER_PATCH_GUID)
+
+    checkouts = []
+
+    def count_checkout(*args: Any) -> None:
+        checkouts.append(args)
+
+    url = app.url_path_for("patch_user", user_guid=str(MOCK_USER_PATCH_GUID))
+    data = UserPatchScheme(
+        username=None,
+        email=None,
+        password=None,
+        first_name="first_name",
+        second_name=None,
+        gender=None,
+        company=None,
+        join_date=None,
+        job_title=None,
+        date_of_birth=None,
+    )
+
+    event.listen(async_engine.sync_engine, "checkout", count_checkout)
+    try:
+        res = await client.patch(url, json=data.model_dump(mode="json"), headers=auth_token_headers)
+    finally:
+        event.remove(async_engine.sync_engine, "checkout", count_checkout)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert len(checkouts) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_patch_user_password_is_hashed_without_a_connection_checked_out(
+    app: FastAPI,
+    client: AsyncClient,
+    auth_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    container = get_mock_api_di_container()
+    user_cache_repository: AbstractUserCacheRepository = container.resolve(AbstractUserCacheRepository)  # type: ignore
+    async_engine: AsyncEngine = container.resolve(AsyncEngine)  # type: ignore
+    user_service: UserService = container.resolve(UserService)  # type: ignore
+    # the current user is cached by its earlier requests, a cold load of it runs on the unit of work before the hash
+    await user_service.get_one_by_guid(MOCK_USER_AUTH_GUID)
+    await user_cache_repository.delete_one(MOCK_USER_PATCH_GUID)
+    checked_out_while_hashing = []
+    get_psw_hash = HasherService.get_psw_hash
+
+    async def get_psw_hash_recording_checkouts(self: HasherService, password: str) -> str:
+        checked_out_while_hashing.append(async_engine.sync_engine.pool.checkedout())  # type: ignore
+        return await get_psw_hash(self, password)
+
+    monkeypatch.setattr(HasherService, "get_psw_hash", get_psw_hash_recording_checkouts)
+    url = app.url_path_for("patch_user", user_guid=str(MOCK_USER_PATCH_GUID))
+    data = UserPatchScheme(
+        username=None,
+        email=None,
+        password=token_urlsafe(16),
+        first_name=None,
+        second_name=None,
+        gender=None,
+        company=None,
+        join_date=None,
+        job_title=None,
+        date_of_birth=None,
+    )
+
+    res = await client.patch(url, json=data.model_dump(mode="json"), headers=auth_token_headers)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert checked_out_while_hashing == [0]
@@ -0,0 +1,34 @@
+import zlib
+
+import orjson
+
+from src.data.repositories.cache_codec import CacheCodecHeader, CacheValueCodec
+from tests.mock_data import mock_project_entities, mock_user_entities
+
+
+def test_small_value_is_stored_uncompressed() -> None:
+    codec = CacheValueCodec(compress_threshold=1024)
+    user, *_ = mock_user_entities
+
+    data = codec.encode(user)
+
+    assert data[0] == CacheCodecHeader.ORJSON
+    assert codec.decode(data) == orjson.loads(orjson.dumps(user))
+
+
+def test_large_value_is_compressed() -> None:
+    codec = CacheValueCodec(compress_threshold=16)
+    project, *_ = mock_project_entities
+
+    data = codec.encode(project)
+
+    assert data[0] == CacheCodecHeader.ZLIB_ORJSON
+    assert codec.decode(data) == orjson.loads(orjson.dumps(project))
+
+
+def test_value_in_unknown_format_is_a_miss() -> None:
+    codec = CacheValueCodec(compress_threshold=1024)
+    user, *_ = mock_user_entities
+
+    assert codec.decode(zlib.compress(orjson.dumps(user))) is None
+    assert codec.decode(b"") is None
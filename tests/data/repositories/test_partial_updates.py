@@ -0,0 +1,80 @@
+from collections.abc import AsyncGenerator
+from dataclasses import replace
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection, async_sessionmaker, create_async_engine
+
+from src.config import get_settings
+from src.data.models.user_model import UserModel  # noqa: F401
+from src.data.repositories.project.sqlachemy import SQLAlchemyProjectRepository
+from src.data.repositories.task.sqlalchemy import SQLAlchemyTaskRepository
+from src.domain.project.entities import ProjectPatchData
+from src.domain.task.entities import TaskPatchData
+from src.services.project_service import ProjectService
+from src.services.task_service import TaskService
+from tests.mock_data import mock_project_entities, mock_task_entities
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def rolled_back_conn() -> AsyncGenerator[AsyncConnection, None]:
+    engine = create_async_engine(get_settings().PG_URL_TEST.unicode_string())
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        yield conn
+        await transaction.rollback()
+
+    await engine.dispose()
+
+
+def _capture_update_columns(conn: AsyncConnection) -> list[list[str]]:
+    updated_columns: list[list[str]] = []
+
+    def capture(*args: Any) -> None:
+        _, _, statement, *_ = args
+        if statement.startswith("UPDATE"):
+            set_clause = statement.split(" SET ", 1)[1].split(" WHERE ", 1)[0]
+            updated_columns.append([assignment.split("=", 1)[0] for assignment in set_clause.split(", ")])
+
+    event.listen(conn.sync_connection, "before_cursor_execute", capture)
+    return updated_columns
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_project_patch_updates_only_changed_columns(rolled_back_conn: AsyncConnection) -> None:
+    project = replace(mock_project_entities[0])
+    project_service = ProjectService(SQLAlchemyProjectRepository(async_sessionmaker(bind=rolled_back_conn)))
+    updated_columns = _capture_update_columns(rolled_back_conn)
+
+    await project_service.patch_one(
+        project,
+        ProjectPatchData(
+            title=f"{project.title}_patched",
+            description=project.description,
+            tech_stack=None,
+            additional_metadata=None,
+            start_date=None,
+            constraint_date=None,
+            mentor_guid=project.mentor_guid,
+        ),
+    )
+
+    assert updated_columns == [["title", "updated_at"]]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_task_patch_updates_only_patched_columns(rolled_back_conn: AsyncConnection) -> None:
+    task = mock_task_entities[0]
+    task_service = TaskService(SQLAlchemyTaskRepository(async_sessionmaker(bind=rolled_back_conn)))
+    updated_columns = _capture_update_columns(rolled_back_conn)
+
+    await task_service.patch_one(
+        task.project_guid,
+        task.guid,
+        TaskPatchData(title=None, description=None, is_completed=True, executor_guid=None),
+    )
+
+    assert updated_columns == [["is_completed", "updated_at"]]
@@ -0,0 +1,120 @@
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from datetime import datetime
+from hashlib import md5
+from typing import Any
+from uuid import UUID
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
+
+from src.config import get_settings
+from src.data.repositories.project.sqlachemy import SQLAlchemyProjectRepository
+from src.data.repositories.project_task_aggregation.sqlalchemy import SQLAlchemyProjectTaskAggregationRepository
+from src.data.repositories.task.sqlalchemy import SQLAlchemyTaskRepository
+from src.data.repositories.user.sqlalchemy import SQLAlchemyUserRepository
+from src.domain.common.entities import ListCursor
+
+type RepositoryQuery = Callable[[async_sessionmaker[AsyncSession]], Awaitable[Any]]
+
+# large enough for the planner to prefer indexes over sequential scans
+_SEED_SQL = (
+    """INSERT INTO "user" (guid, username, email, password, is_deleted, created_at, updated_at)
+    SELECT md5('plan_user_' || i)::uuid, 'plan_user_' || i, 'plan_user_' || i || '@example.com', 'password',
+        i % 10 = 0, now() - i * interval '1 minute', now()
+    FROM generate_series(1, 20000) AS i;""",
+    """INSERT INTO "project" (
+        guid, title, description, tech_stack, additional_metadata, start_date, constraint_date,
+        creator_guid, mentor_guid, created_at, updated_at
+    )
+    SELECT md5('plan_project_' || i)::uuid, 'title', 'description', '{}', '{}', now(), now(),
+        md5('plan_user_' || (i % 20000 + 1))::uuid, md5('plan_user_' || ((i + 1) % 20000 + 1))::uuid,
+        now() - i * interval '1 minute', now()
+    FROM generate_series(1, 5000) AS i;""",
+    """INSERT INTO "task" (guid, title, description, is_completed, project_guid, executor_guid, created_at, updated_at)
+    SELECT md5('plan_task_' || i)::uuid, 'title', 'description', false,
+        md5('plan_project_' || (i % 5000 + 1))::uuid, md5('plan_user_' || (i % 20000 + 1))::uuid,
+        now() - i * interval '1 second', now()
+    FROM generate_series(1, 100000) AS i;""",
+    """ANALYZE "user", "project", "task";""",
+)
+
+
+def _get_seeded_guid(name: str) -> UUID:
+    return UUID(md5(name.encode()).hexdigest())  # noqa: S324
+
+
+def _has_seq_scan(plan: dict[str, Any]) -> bool:
+    if plan["Node Type"] == "Seq Scan":
+        return True
+    return any(_has_seq_scan(subplan) for subplan in plan.get("Plans", ()))
+
+
+_HOT_QUERIES: dict[str, RepositoryQuery] = {
+    "task_list_by_project": lambda session_factory: SQLAlchemyTaskRepository(session_factory).get_list_by_project_guid(
+        _get_seeded_guid("plan_project_1"),
+    ),
+    "project_with_tasks": lambda session_factory: SQLAlchemyProjectTaskAggregationRepository(
+        session_factory,
+    ).get_one_project_with_tasks_by_guid(_get_seeded_guid("plan_project_1")),
+    "project_list_after_cursor": lambda session_factory: SQLAlchemyProjectRepository(session_factory).get_list(
+        limit=10,
+        offset=0,
+        order_by="created_at",
+        reverse=True,
+        after=ListCursor(value=datetime.now(), guid=_get_seeded_guid("plan_project_1")),  # noqa: DTZ005
+    ),
+    "user_list_after_cursor": lambda session_factory: SQLAlchemyUserRepository(session_factory).get_list(
+        offset=0,
+        limit=10,
+        order_by="created_at",
+        reverse=True,
+        after=ListCursor(value=datetime.now(), guid=_get_seeded_guid("plan_user_1")),  # noqa: DTZ005
+    ),
+    "user_by_guid": lambda session_factory: SQLAlchemyUserRepository(session_factory).get_one_by_guid(
+        _get_seeded_guid("plan_user_1"),
+    ),
+    "user_by_username": lambda session_factory: SQLAlchemyUserRepository(session_factory).get_one_by_username(
+        "plan_user_1",
+    ),
+}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def seeded_conn() -> AsyncGenerator[AsyncConnection, None]:
+    engine = create_async_engine(get_settings().PG_URL_TEST.unicode_string())
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        for sql in _SEED_SQL:
+            await conn.execute(text(sql))
+
+        yield conn
+
+        await transaction.rollback()
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("query_name", _HOT_QUERIES)
+async def test_hot_query_has_no_seq_scan(seeded_conn: AsyncConnection, query_name: str) -> None:
+    executed: list[tuple[str, Any]] = []
+
+    def capture(*args: Any) -> None:
+        _, _, statement, parameters, *_ = args
+        executed.append((statement, parameters))
+
+    event.listen(seeded_conn.sync_connection, "before_cursor_execute", capture)
+    try:
+        await _HOT_QUERIES[query_name](async_sessionmaker(bind=seeded_conn, expire_on_commit=False))
+    finally:
+        event.remove(seeded_conn.sync_connection, "before_cursor_execute", capture)
+
+    assert executed
+
+    for statement, parameters in executed:
+        res = await seeded_conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        [explained] = res.scalars().one()
+        assert not _has_seq_scan(explained["Plan"]), f"{query_name}: {statement}"
@@ -0,0 +1,117 @@
+from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis as AsyncRedis
+from sqlalchemy import event, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from src.config import get_settings
+from src.data.models.project_model import ProjectModel  # noqa: F401
+from src.data.models.task_model import TaskModel  # noqa: F401
+from src.data.models.user_model import UserModel
+from src.data.repositories.sqlalchemy_replica_routing import (
+    ReadYourWritesTracker,
+    ReplicaBalancing,
+    ReplicaPool,
+    ReplicaRoutingSession,
+)
+from src.data.repositories.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+
+_STICKY_READS_WINDOW = 5.0
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def engines() -> AsyncGenerator[tuple[AsyncEngine, AsyncEngine], None]:
+    # two engines on one database are enough to tell where statements go
+    primary = create_async_engine(get_settings().PG_URL_TEST.unicode_string())
+    replica = create_async_engine(get_settings().PG_URL_TEST.unicode_string())
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+def _get_session_factory(primary: AsyncEngine, replica: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=primary,
+        sync_session_class=ReplicaRoutingSession,
+        replica_pool=ReplicaPool([replica], ReplicaBalancing.ROUND_ROBIN),
+    )
+
+
+def _record_statements(engine: AsyncEngine) -> list[str]:
+    statements: list[str] = []
+
+    def record(*args: Any) -> None:
+        _, _, statement, *_ = args
+        statements.append(statement.split(" ", 1)[0])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    return statements
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_reads_go_to_replica_until_session_writes(engines: tuple[AsyncEngine, AsyncEngine]) -> None:
+    primary, replica = engines
+    primary_statements, replica_statements = _record_statements(primary), _record_statements(replica)
+
+    async with _get_session_factory(primary, replica)() as session:
+        await session.execute(select(UserModel.guid).limit(1))
+        await session.execute(update(UserModel).where(UserModel.guid == uuid4()).values(company=None))
+        await session.execute(select(UserModel.guid).limit(1))
+        await session.rollback()
+
+    assert replica_statements == ["SELECT"]
+    assert primary_statements == ["UPDATE", "SELECT"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_use_primary_bind_argument_reads_from_primary(engines: tuple[AsyncEngine, AsyncEngine]) -> None:
+    primary, replica = engines
+    primary_statements, replica_statements = _record_statements(primary), _record_statements(replica)
+
+    async with _get_session_factory(primary, replica)() as session:
+        await session.execute(select(UserModel.guid).limit(1), bind_arguments={"use_primary": True})
+
+    assert replica_statements == []
+    assert primary_statements == ["SELECT"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_recent_writer_reads_from_primary(engines: tuple[AsyncEngine, AsyncEngine]) -> None:
+    primary, replica = engines
+    redis = AsyncRedis.from_url(get_settings().REDIS_URL.unicode_string())
+    tracker = ReadYourWritesTracker(redis=redis, window=_STICKY_READS_WINDOW, enabled=True)
+    session_factory = _get_session_factory(primary, replica)
+    user_guid = uuid4()
+
+    await tracker.bind_user(user_guid)
+    async with SQLAlchemyUnitOfWork.begin() as unit_of_work:
+        session = unit_of_work.get_session(session_factory)
+        await session.execute(update(UserModel).where(UserModel.guid == user_guid).values(company=None))
+
+    # the next request of the same user, possibly on another worker
+    primary_statements, replica_statements = _record_statements(primary), _record_statements(replica)
+    await tracker.bind_user(user_guid)
+    async with session_factory() as session:
+        await session.execute(select(UserModel.guid).limit(1))
+
+    assert replica_statements == []
+    assert primary_statements == ["SELECT"]
+
+    await redis.aclose()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_least_connections_picks_idle_replica() -> None:
+    busy_replica = create_async_engine(get_settings().PG_URL_TEST.unicode_string())
+    idle_replica = create_async_engine(get_settings().PG_URL_TEST.unicode_string())
+    replica_pool = ReplicaPool([busy_replica, idle_replica], ReplicaBalancing.LEAST_CONNECTIONS)
+
+    async with busy_replica.connect():
+        assert replica_pool.pick() is idle_replica.sync_engine
+
+    await busy_replica.dispose()
+    await idle_replica.dispose()
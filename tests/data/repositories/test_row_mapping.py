@@ -0,0 +1,50 @@
+from collections.abc import AsyncGenerator
+from dataclasses import asdict
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.config import get_settings
+from src.data.models.project_model import ProjectModel  # noqa: F401
+from src.data.models.task_model import TaskModel  # noqa: F401
+from src.data.models.user_model import UserModel  # noqa: F401
+from src.data.repositories.project.sqlachemy import SQLAlchemyProjectRepository
+from src.data.repositories.project_task_aggregation.sqlalchemy import SQLAlchemyProjectTaskAggregationRepository
+from src.data.repositories.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from src.data.repositories.task.sqlalchemy import SQLAlchemyTaskRepository
+from src.data.repositories.user.sqlalchemy import SQLAlchemyUserRepository
+from tests.mock_data import mock_project_entities, mock_task_entities, mock_user_entities
+
+
+def _get_fields(entity: Any) -> dict[str, Any]:
+    # the test database columns are naive timestamps, the mock entities are aware
+    return {name: value for name, value in asdict(entity).items() if name not in {"created_at", "updated_at"}}
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def session_factory() -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    engine = create_async_engine(get_settings().PG_URL_TEST.unicode_string())
+    yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rows_map_to_entities_without_orm_instances(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    user, project, task = mock_user_entities[0], mock_project_entities[0], mock_task_entities[0]
+
+    async with SQLAlchemyUnitOfWork.begin() as unit_of_work:
+        read_user = await SQLAlchemyUserRepository(session_factory).get_one_by_guid(user.guid)
+        read_project = await SQLAlchemyProjectRepository(session_factory).get_one_by_guid(project.guid)
+        read_task = await SQLAlchemyTaskRepository(session_factory).get_one_by_guid(task.guid)
+        aggregation_repository = SQLAlchemyProjectTaskAggregationRepository(session_factory)
+        aggregation = await aggregation_repository.get_one_project_with_tasks_by_guid(task.project_guid)
+
+        assert not unit_of_work.get_session(session_factory).identity_map
+
+    assert _get_fields(read_user) == _get_fields(user)
+    assert _get_fields(read_project) == _get_fields(project)
+    assert _get_fields(read_task) == _get_fields(task)
+    assert task.guid in {aggregation_task.guid for aggregation_task in aggregation.tasks}
+    assert aggregation.tasks == sorted(aggregation.tasks, key=lambda task: task.created_at, reverse=True)
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+from redis.asyncio import Redis as AsyncRedis
+
+from src.config import get_settings
+from src.data.repositories.cache_codec import CacheValueCodec
+from src.data.repositories.user import cache_two_tier
+from src.data.repositories.user.cache_redis import RedisUserCasheRepository
+from src.data.repositories.user.cache_two_tier import TwoTierUserCacheRepository
+from tests.mock_data import mock_user_entities
+
+
+def _get_two_tier_repository(redis: AsyncRedis) -> TwoTierUserCacheRepository:
+    return TwoTierUserCacheRepository(
+        redis_repository=RedisUserCasheRepository(redis, CacheValueCodec(compress_threshold=1024)),
+        redis=redis,
+        local_max_size=10,
+        local_ttl=60,
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_user_from_local_tier() -> None:
+    redis = AsyncRedis.from_url(get_settings().REDIS_URL.unicode_string())
+    repository = _get_two_tier_repository(redis)
+    user, *_ = mock_user_entities
+
+    await repository.add_one(user)
+
+    assert await repository.get_one(user.guid) == user
+    assert repository.local_stats.hits == 1
+    assert repository.redis_stats.hits == 0
+
+    await repository.delete_one(user.guid)
+    await redis.aclose()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_delete_user_evicts_local_tier_of_other_worker() -> None:
+    redis = AsyncRedis.from_url(get_settings().REDIS_URL.unicode_string())
+    repository = _get_two_tier_repository(redis)
+    other_worker_repository = _get_two_tier_repository(redis)
+    other_worker_repository.start_invalidation_listener()
+    *_, user = mock_user_entities
+
+    await repository.add_one(user)
+    assert await other_worker_repository.get_one(user.guid) == user
+    assert other_worker_repository.redis_stats.hits == 1
+
+    await repository.delete_one(user.guid)
+    await asyncio.sleep(0.1)
+
+    assert await other_worker_repository.get_one(user.guid) is None
+    assert other_worker_repository.redis_stats.misses == 1
+
+    await other_worker_repository.stop_invalidation_listener()
+    await redis.aclose()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_invalidation_listener_survives_malformed_message(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache_two_tier, "_RESUBSCRIBE_DELAY_SECONDS", 0)
+    redis = AsyncRedis.from_url(get_settings().REDIS_URL.unicode_string())
+    repository = _get_two_tier_repository(redis)
+    other_worker_repository = _get_two_tier_repository(redis)
+    other_worker_repository.start_invalidation_listener()
+    user, *_, other_user = mock_user_entities
+
+    await repository.add_one(user)
+    await other_worker_repository.get_one(user.guid)
+    redis_hits = other_worker_repository.redis_stats.hits
+    await asyncio.sleep(0.1)
+    await redis.publish("cache:user:invalidate", b"not a guid")
+    await asyncio.sleep(0.1)
+
+    # the local tier is dropped after a failure and the listener keeps running
+    assert await other_worker_repository.get_one(user.guid) == user
+    assert other_worker_repository.redis_stats.hits == redis_hits + 1
+
+    await repository.add_one(other_user)
+    await other_worker_repository.get_one(other_user.guid)
+    await repository.delete_one(other_user.guid)
+    await asyncio.sleep(0.1)
+
+    assert await other_worker_repository.get_one(other_user.guid) is None
+
+    await repository.delete_one(user.guid)
+    await other_worker_repository.stop_invalidation_listener()
+    await redis.aclose()
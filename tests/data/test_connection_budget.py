@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import exc
+
+from src.config import get_settings
+from src.data.connection_budget import ConnectionBudget, get_engine_pool_stats
+
+_POOL_TIMEOUT = 0.1
+_TOTAL_CONNECTIONS = 90
+_PROCESSES = 9
+
+
+def test_pool_sizes_fit_the_budget() -> None:
+    connection_budget = ConnectionBudget(total=_TOTAL_CONNECTIONS, processes=_PROCESSES)
+    pool_sizes = [connection_budget.get_pool_size(0.75), connection_budget.get_pool_size(0.25)]
+
+    assert pool_sizes == [7, 2]
+    assert sum(pool_sizes) * _PROCESSES <= _TOTAL_CONNECTIONS
+
+
+def test_pool_size_is_at_least_one() -> None:
+    assert ConnectionBudget(total=4, processes=9).get_pool_size(0.25) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_checkout_over_pool_size_times_out() -> None:
+    async_engine = ConnectionBudget(total=1, processes=1).create_engine(
+        url=get_settings().PG_URL_TEST.unicode_string(),
+        share=1.0,
+        pool_timeout=_POOL_TIMEOUT,
+    )
+
+    async with async_engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            await async_engine.connect()
+
+    pool_stats = get_engine_pool_stats(async_engine)
+    assert pool_stats is not None
+    assert pool_stats.size == 1
+    assert pool_stats.peak_saturation == 1.0
+    assert pool_stats.timeouts == 1
+    assert pool_stats.waiting == 0
+
+    await async_engine.dispose()
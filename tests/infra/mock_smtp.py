@@ -0,0 +1,56 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any
+
+from aiosmtpd.controller import Controller
+
+SMTP_SINK_HOST = "127.0.0.1"
+SMTP_SINK_PORT = 8026
+
+
+class SMTPSinkHandler:
+    def __init__(self, refused_emails: set[str] | None = None) -> None:
+        self.refused_emails = refused_emails or set()
+        self.connections = 0
+        self.messages = 0
+        self.recipients: list[str] = []
+
+    async def handle_EHLO(
+        self,
+        _server: Any,
+        session: Any,
+        _envelope: Any,
+        hostname: str,
+        responses: list[str],
+    ) -> list[str]:
+        self.connections += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_RCPT(
+        self,
+        _server: Any,
+        _session: Any,
+        envelope: Any,
+        address: str,
+        _rcpt_options: list[str],
+    ) -> str:
+        if address in self.refused_emails:
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, _server: Any, _session: Any, envelope: Any) -> str:
+        self.messages += 1
+        self.recipients.extend(envelope.rcpt_tos)
+        return "250 OK"
+
+
+@contextmanager
+def run_smtp_sink(handler: SMTPSinkHandler) -> Generator[None, None, None]:
+    controller = Controller(handler, hostname=SMTP_SINK_HOST, port=SMTP_SINK_PORT)
+    controller.start()
+    try:
+        yield
+    finally:
+        controller.stop()
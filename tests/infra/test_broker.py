@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+from faststream.rabbit import RabbitBroker, TestRabbitBroker
+
+from src.infra.worker.broker import RabbitMessageBroker
+from src.infra.worker.enum import RabbitQueueName
+from src.infra.worker.queues import get_dead_letter_exchange
+from src.infra.worker.worker_routes import dlq_handler, worker_router
+
+_MESSAGES = 5
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_messages_are_published_through_one_publisher_per_queue() -> None:
+    broker = RabbitBroker()
+    received: list[int] = []
+
+    @broker.subscriber(RabbitQueueName.PROJECT_REPORT_NOTIFICATION)
+    async def handle(body: int) -> None:
+        received.append(body)
+
+    async with TestRabbitBroker(broker):
+        message_broker = RabbitMessageBroker(broker)
+        await message_broker.start_broker()
+        publishers = len(broker.publishers)
+
+        await asyncio.gather(
+            *(
+                message_broker.send_message(RabbitQueueName.PROJECT_REPORT_NOTIFICATION, number)
+                for number in range(_MESSAGES)
+            ),
+        )
+        await message_broker.stop_broker()
+
+    assert sorted(received) == list(range(_MESSAGES))
+    assert len(broker.publishers) == publishers
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_worker_binds_dead_letter_queue_to_dead_letter_exchange() -> None:
+    broker = RabbitBroker()
+    broker.include_router(worker_router)
+
+    async with TestRabbitBroker(broker) as test_broker:
+        await test_broker.publish({"body": "dead"}, queue=RabbitQueueName.DLQ, exchange=get_dead_letter_exchange())
+
+        dlq_handler.mock.assert_called_once_with({"body": "dead"})  # type: ignore
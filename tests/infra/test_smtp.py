@@ -0,0 +1,78 @@
+from email.message import EmailMessage
+
+import pytest
+from aiosmtplib import SMTPRecipientsRefused
+
+from src.infra.notifications.smtp import SMTPConnectionPool, is_permanent_smtp_failure
+from tests.infra.mock_smtp import SMTP_SINK_HOST, SMTP_SINK_PORT, SMTPSinkHandler, run_smtp_sink
+
+_MESSAGES = 5
+
+
+def _get_connection_pool() -> SMTPConnectionPool:
+    return SMTPConnectionPool(
+        hostname=SMTP_SINK_HOST,
+        port=SMTP_SINK_PORT,
+        username=None,
+        password=None,
+        max_size=2,
+        keepalive=60.0,
+        health_check_after=60.0,
+    )
+
+
+def _get_message() -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "sender@example.com"
+    message["To"] = "recipient@example.com"
+    message["Subject"] = "report"
+    message.set_content("<p>report</p>", subtype="html")
+    return message
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_messages_reuse_one_connection() -> None:
+    handler = SMTPSinkHandler()
+    connection_pool = _get_connection_pool()
+
+    with run_smtp_sink(handler):
+        for _ in range(_MESSAGES):
+            await connection_pool.send_message(_get_message())
+        await connection_pool.close()
+
+    assert handler.messages == _MESSAGES
+    assert handler.connections == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_dropped_connection_is_replaced() -> None:
+    handler = SMTPSinkHandler()
+    connection_pool = _get_connection_pool()
+
+    with run_smtp_sink(handler):
+        await connection_pool.send_message(_get_message())
+    # the restarted server no longer knows the pooled connection
+    with run_smtp_sink(handler):
+        await connection_pool.send_message(_get_message())
+        await connection_pool.close()
+
+    assert handler.messages == 2  # noqa: PLR2004
+    assert handler.connections == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rejected_message_keeps_the_connection() -> None:
+    handler = SMTPSinkHandler(refused_emails={"refused@example.com"})
+    connection_pool = _get_connection_pool()
+    refused_message = _get_message()
+    refused_message.replace_header("To", "refused@example.com")
+
+    with run_smtp_sink(handler):
+        with pytest.raises(SMTPRecipientsRefused) as exc_info:
+            await connection_pool.send_message(refused_message)
+        await connection_pool.send_message(_get_message())
+        await connection_pool.close()
+
+    assert is_permanent_smtp_failure(exc_info.value)
+    assert handler.messages == 1
+    assert handler.connections == 1
@@ -0,0 +1,61 @@
+import os
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+
+import pytest
+
+from src.infra.worker.app import run_worker_processes
+
+_PROCESSES = 2
+
+
+class _CrashOnceApp:
+    """The first process to run crashes, every other one exits cleanly"""
+
+    def __init__(self, tmp_path: Path) -> None:
+        self._crash_marker = tmp_path / "crashed"
+        self._runs = tmp_path / "runs"
+
+    @property
+    def runs(self) -> int:
+        return len(self._runs.read_text().splitlines())
+
+    async def run(self) -> None:
+        with self._runs.open("a") as runs:
+            runs.write(f"{os.getpid()}\n")
+
+        try:
+            self._crash_marker.touch(exist_ok=False)
+        except FileExistsError:
+            return
+
+        raise SystemExit(1)
+
+
+def test_failed_worker_process_is_respawned(tmp_path: Path) -> None:
+    app = _CrashOnceApp(tmp_path)
+
+    run_worker_processes(app, processes=_PROCESSES)  # type: ignore
+
+    assert app.runs == _PROCESSES + 1
+
+
+def test_parent_exits_with_error_when_respawn_fails(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    app = _CrashOnceApp(tmp_path)
+    start = BaseProcess.start
+    starts = 0
+
+    def start_up_to_processes(self: BaseProcess) -> None:
+        nonlocal starts
+        starts += 1
+        if starts > _PROCESSES:
+            raise OSError
+
+        start(self)
+
+    monkeypatch.setattr(BaseProcess, "start", start_up_to_processes)
+
+    with pytest.raises(SystemExit) as exc_info:
+        run_worker_processes(app, processes=_PROCESSES)  # type: ignore
+
+    assert exc_info.value.code == 1
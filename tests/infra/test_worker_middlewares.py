@@ -0,0 +1,32 @@
+import asyncio
+from asyncio import Semaphore
+from functools import partial
+
+import pytest
+from faststream.rabbit import RabbitBroker, TestRabbitBroker
+
+from src.infra.worker.middlewares import ConcurrencyLimitMiddleware
+
+_QUEUE_NAME = "concurrency_limit_test"
+_MAX_CONCURRENCY = 2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_handlers_run_up_to_the_concurrency_limit() -> None:
+    broker = RabbitBroker(
+        middlewares=(partial(ConcurrencyLimitMiddleware, limiter=Semaphore(_MAX_CONCURRENCY)),),
+    )
+    running, peak_running = 0, 0
+
+    @broker.subscriber(_QUEUE_NAME)
+    async def handle(body: int) -> None:  # noqa: ARG001
+        nonlocal running, peak_running
+        running += 1
+        peak_running = max(peak_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    async with TestRabbitBroker(broker) as test_broker:
+        await asyncio.gather(*(test_broker.publish(number, _QUEUE_NAME) for number in range(5)))
+
+    assert peak_running == _MAX_CONCURRENCY
@@ -1,7 +1,7 @@
 from functools import lru_cache
 
 from punq import Container, Scope
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 from src.config import get_settings
 from src.data.repositories.project.base import AbstractProjectRepository
@@ -33,6 +33,7 @@ def get_mock_api_di_container() -> Container:
         autoflush=False,
         autocommit=False,
     )
+    container.register(AsyncEngine, instance=test_async_engine)
     # repos
     container.register(
         AbstractUserRepository,
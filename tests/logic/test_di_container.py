@@ -0,0 +1,39 @@
+import os
+from functools import lru_cache
+
+import pytest
+from punq import Container
+
+from src.domain.user.use_cases.authenticate_user_by_token import AuthenticateUserByTokenUseCase
+from src.logic.api_di_container import _get_api_di_container
+from src.logic.di_container import rebuild_in_forked_children
+from src.services.user_service import UserService
+
+
+def test_use_cases_are_built_once() -> None:
+    container = _get_api_di_container()
+
+    use_case = container.resolve(AuthenticateUserByTokenUseCase)
+
+    assert container.resolve(AuthenticateUserByTokenUseCase) is use_case
+    assert container.resolve(UserService) is use_case._user_service  # type: ignore  # noqa: SLF001
+
+
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning")
+def test_forked_child_builds_own_container() -> None:
+    @lru_cache(maxsize=1)
+    def get_container() -> Container:
+        return Container()
+
+    rebuild_in_forked_children(get_container)
+    parent_container = get_container()
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        os.write(write_fd, b"1" if get_container() is not parent_container else b"0")
+        os._exit(0)
+
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 1) == b"1"
+    assert get_container() is parent_container
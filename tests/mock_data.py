@@ -6,7 +6,7 @@ from uuid import UUID, uuid4
 from src.domain.project.entities import Project
 from src.domain.task.entities import Task
 from src.domain.user.entities import User
-from src.services.hasher_service import HasherService
+from src.services.hasher_service import get_psw_hash
 
 MOCK_USER_AUTH_GUID: Final[UUID] = uuid4()
 MOCK_USER_GET_GUID: Final[UUID] = uuid4()
@@ -45,7 +45,7 @@ mock_user_entities = tuple(
         updated_at=datetime.now(UTC),
         username=username,
         email=email,
-        password=HasherService().get_psw_hash("passwordpassword"),
+        password=get_psw_hash("passwordpassword"),
         first_name=None,
         second_name=None,
         gender=None,
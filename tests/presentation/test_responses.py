@@ -0,0 +1,39 @@
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import BaseModel
+
+from src.domain.project.entities import Project
+from src.domain.task.entities import Task
+from src.domain.user.entities import User
+from src.presentation.common.responses import EntityEncoder, get_encoded_response
+from src.presentation.project.schemas import ProjectGetScheme
+from src.presentation.task.schemas import TaskGetScheme
+from src.presentation.user.schemas import UserGetScheme
+from tests.mock_data import mock_project_entities, mock_task_entities, mock_user_entities
+
+
+@pytest.mark.parametrize(
+    ("scheme", "entity"),
+    [
+        # tech_stack is a set in the scheme, a single item keeps its order stable
+        (ProjectGetScheme, replace(mock_project_entities[0], tech_stack=("python",))),
+        (TaskGetScheme, mock_task_entities[0]),
+        (UserGetScheme, replace(mock_user_entities[0], created_at=datetime(2025, 1, 1, tzinfo=UTC))),
+    ],
+)
+def test_encoded_entity_matches_scheme_serialization(scheme: type[BaseModel], entity: Project | Task | User) -> None:
+    encoder = EntityEncoder(scheme=scheme, entity=type(entity))
+
+    res = get_encoded_response(encoder.encode(entity))
+
+    assert res.body == scheme.model_validate(entity, from_attributes=True).model_dump_json().encode()
+
+
+def test_encoder_rejects_scheme_fields_missing_from_entity() -> None:
+    class _ProjectWithTasksGetScheme(ProjectGetScheme):
+        tasks: list[TaskGetScheme]
+
+    with pytest.raises(ValueError, match="tasks"):
+        EntityEncoder(scheme=_ProjectWithTasksGetScheme, entity=Project)
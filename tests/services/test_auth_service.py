@@ -0,0 +1,57 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import jwt
+import pytest
+
+from src.config import get_settings
+from src.domain.user.enums import AuthTokenTyp
+from src.domain.user.exc import UserInvalidTokenError
+from src.services.auth_service import AuthService, AuthTokenPayloadCache
+
+
+def test_validate_token_hits_cache_on_repeat() -> None:
+    token_payload_cache = AuthTokenPayloadCache(max_size=10)
+    auth_service = AuthService(token_payload_cache)
+    user_guid = uuid4()
+    token = auth_service.generate_token(user_guid)
+
+    assert auth_service.validate_token_and_extract_user_guid(token) == user_guid
+    assert auth_service.validate_token_and_extract_user_guid(token) == user_guid
+    assert token_payload_cache.stats.misses == 1
+    assert token_payload_cache.stats.hits == 1
+
+
+def test_validate_token_checks_typ_of_cached_token() -> None:
+    auth_service = AuthService(AuthTokenPayloadCache(max_size=10))
+    token = auth_service.generate_token(uuid4(), AuthTokenTyp.REFRESH)
+
+    auth_service.validate_token_and_extract_user_guid(token, AuthTokenTyp.REFRESH)
+    with pytest.raises(UserInvalidTokenError):
+        auth_service.validate_token_and_extract_user_guid(token, AuthTokenTyp.ACCESS)
+
+
+def test_validate_token_evicts_expired_token() -> None:
+    token_payload_cache = AuthTokenPayloadCache(max_size=10)
+    auth_service = AuthService(token_payload_cache)
+    exp = datetime.now(UTC) - timedelta(seconds=1)
+    token = jwt.encode(
+        payload={"sub": str(uuid4()), "typ": AuthTokenTyp.ACCESS, "exp": exp},
+        key=get_settings().JWT_SECRET_KEY,
+        algorithm=get_settings().JWT_ALGORITHM,
+    )
+
+    with pytest.raises(UserInvalidTokenError):
+        auth_service.validate_token_and_extract_user_guid(token)
+    assert len(token_payload_cache) == 0
+
+
+def test_token_cache_is_bounded() -> None:
+    max_size = 2
+    token_payload_cache = AuthTokenPayloadCache(max_size=max_size)
+    auth_service = AuthService(token_payload_cache)
+
+    for _ in range(5):
+        auth_service.validate_token_and_extract_user_guid(auth_service.generate_token(uuid4()))
+
+    assert len(token_payload_cache) == max_size
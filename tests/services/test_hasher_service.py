@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+
+from src.common.exc import ExecutorSaturatedError
+from src.services.hasher_service import HasherExecutor, HasherService
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_hash_and_verify_psw() -> None:
+    hasher_service = HasherService(HasherExecutor(max_workers=2, max_queue_size=2))
+
+    psw_hash = await hasher_service.get_psw_hash("passwordpassword")
+
+    assert await hasher_service.verify_psw("passwordpassword", psw_hash)
+    assert not await hasher_service.verify_psw("wrongpassword", psw_hash)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_hash_psw_rejected_when_executor_is_saturated() -> None:
+    hasher_service = HasherService(HasherExecutor(max_workers=1, max_queue_size=1))
+
+    results = await asyncio.gather(
+        *(hasher_service.get_psw_hash("passwordpassword") for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(res, ExecutorSaturatedError) for res in results) == 1
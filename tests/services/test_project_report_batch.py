@@ -0,0 +1,67 @@
+from collections.abc import AsyncGenerator
+from datetime import timedelta
+from typing import Any
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis as AsyncRedis
+
+from src.config import get_settings
+from src.data.repositories.project_task_aggregation.dedup_redis import RedisProjectReportDedupRepository
+from src.domain.project.entities import ProjectReportBatchData, ProjectReportRecipients
+from src.domain.project_task_aggregation.flows.send_project_report_batch_notification import (
+    SendProjectReportBatchNotificationFlow,
+)
+from src.infra.notifications.smtp import SMTPConnectionPool, SMTPNotificationClient
+from src.services.project_report_dedup_service import ProjectReportDedupService
+from tests.infra.mock_smtp import SMTP_SINK_HOST, SMTP_SINK_PORT, SMTPSinkHandler, run_smtp_sink
+
+_DEDUP_WINDOW = timedelta(seconds=60)
+
+
+class _StaticReportFlow:
+    async def execute(self, _project_guid: Any) -> str:
+        return "<p>report</p>"
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def redis() -> AsyncGenerator[AsyncRedis, None]:
+    redis = AsyncRedis.from_url(get_settings().REDIS_URL.unicode_string())
+    yield redis
+    await redis.aclose()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rejected_recipient_does_not_resend_the_batch(redis: AsyncRedis) -> None:
+    handler = SMTPSinkHandler(refused_emails={"refused@example.com"})
+    connection_pool = SMTPConnectionPool(
+        hostname=SMTP_SINK_HOST,
+        port=SMTP_SINK_PORT,
+        username=None,
+        password=None,
+        max_size=1,
+        keepalive=60.0,
+        health_check_after=60.0,
+    )
+    flow = SendProjectReportBatchNotificationFlow(
+        notification_client=SMTPNotificationClient(connection_pool),
+        get_project_report_flow=_StaticReportFlow(),  # type: ignore
+        project_report_dedup_service=ProjectReportDedupService(
+            RedisProjectReportDedupRepository(redis, _DEDUP_WINDOW, _DEDUP_WINDOW),
+        ),
+    )
+    batch_data = ProjectReportBatchData(
+        reports=[
+            ProjectReportRecipients(project_guid=uuid4(), emails=["first@example.com", "refused@example.com"]),
+            ProjectReportRecipients(project_guid=uuid4(), emails=["second@example.com"]),
+        ],
+    )
+
+    with run_smtp_sink(handler):
+        await flow.execute(batch_data, message_id="message")
+        # a redelivery of the batch sends nothing again
+        await flow.execute(batch_data, message_id="message")
+        await connection_pool.close()
+
+    assert handler.recipients == ["first@example.com", "second@example.com"]
@@ -0,0 +1,114 @@
+from collections.abc import AsyncGenerator
+from datetime import timedelta
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis as AsyncRedis
+from sqlalchemy.ext.asyncio import AsyncConnection, async_sessionmaker, create_async_engine
+
+from src.config import get_settings
+from src.data.models.user_model import UserModel  # noqa: F401
+from src.data.repositories.cache_codec import CacheValueCodec
+from src.data.repositories.project_task_aggregation.cache_redis import RedisProjectReportCacheRepository
+from src.data.repositories.project_task_aggregation.dedup_redis import RedisProjectReportDedupRepository
+from src.data.repositories.project_task_aggregation.sqlalchemy import SQLAlchemyProjectTaskAggregationRepository
+from src.data.repositories.task.sqlalchemy import SQLAlchemyTaskRepository
+from src.domain.project.entities import ProjectReportData
+from src.domain.project_task_aggregation.flows.get_project_report import (
+    GetProjectReportFlow,
+    ProjectReportRenderSingleFlight,
+)
+from src.domain.project_task_aggregation.flows.send_project_report_notification import (
+    SendProjectReportNotificationFlow,
+)
+from src.domain.task.entities import TaskPatchData
+from src.infra.notifications.smtp import SMTPConnectionPool, SMTPNotificationClient
+from src.services.project_report_dedup_service import ProjectReportDedupService
+from src.services.project_task_aggregation_service import ProjectTaskAggregationService
+from src.services.task_service import TaskService
+from tests.mock_data import mock_task_entities
+
+_REPORT_CACHE_TTL = timedelta(seconds=60)
+
+
+class _RecordingNotificationClient(SMTPNotificationClient):
+    __slots__ = ("rendered", "sent")
+
+    def __init__(self) -> None:
+        super().__init__(SMTPConnectionPool("localhost", 25, None, None, max_size=1, keepalive=1, health_check_after=1))
+        self.rendered = 0
+        self.sent: list[str] = []
+
+    async def render_email_body(self, template_name: str, **entities_for_render: Any) -> str:
+        self.rendered += 1
+        return await super().render_email_body(template_name, **entities_for_render)
+
+    async def send_html_notification(self, recipient_email: str, subject: str, html_body: str) -> None:  # noqa: ARG002
+        self.sent.append(html_body)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def rolled_back_conn() -> AsyncGenerator[AsyncConnection, None]:
+    engine = create_async_engine(get_settings().PG_URL_TEST.unicode_string())
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        yield conn
+        await transaction.rollback()
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def redis() -> AsyncGenerator[AsyncRedis, None]:
+    redis = AsyncRedis.from_url(get_settings().REDIS_URL.unicode_string())
+    # the test database is recreated with the same timestamps, reports of earlier runs would still match
+    for pattern in ("cache:project_report:*", "dedup:project_report:*"):
+        async for key in redis.scan_iter(pattern):
+            await redis.delete(key)
+    yield redis
+    await redis.aclose()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_repeat_report_skips_load_and_render_until_tasks_change(
+    rolled_back_conn: AsyncConnection,
+    redis: AsyncRedis,
+) -> None:
+    task = mock_task_entities[0]
+    session_factory = async_sessionmaker(bind=rolled_back_conn)
+    notification_client = _RecordingNotificationClient()
+    flow = SendProjectReportNotificationFlow(
+        notification_client=notification_client,
+        get_project_report_flow=GetProjectReportFlow(
+            notification_client=notification_client,
+            project_task_aggregation_service=ProjectTaskAggregationService(
+                SQLAlchemyProjectTaskAggregationRepository(session_factory),
+                RedisProjectReportCacheRepository(redis, CacheValueCodec(compress_threshold=0), _REPORT_CACHE_TTL),
+            ),
+            project_report_render_single_flight=ProjectReportRenderSingleFlight(),
+        ),
+        project_report_dedup_service=ProjectReportDedupService(
+            RedisProjectReportDedupRepository(redis, _REPORT_CACHE_TTL, _REPORT_CACHE_TTL),
+        ),
+    )
+
+    def get_report_data(recipient: int) -> ProjectReportData:
+        return ProjectReportData(project_guid=task.project_guid, email=f"recipient{recipient}@example.com")
+
+    await flow.execute(get_report_data(1), message_id="1")
+    await flow.execute(get_report_data(2), message_id="2")
+    # a redelivery of the sent message is not sent again
+    await flow.execute(get_report_data(2), message_id="2")
+    assert notification_client.rendered == 1
+    assert len(notification_client.sent) == 2  # noqa: PLR2004
+    assert notification_client.sent[0] == notification_client.sent[1]
+
+    await TaskService(SQLAlchemyTaskRepository(session_factory)).patch_one(
+        task.project_guid,
+        task.guid,
+        TaskPatchData(title=None, description=None, is_completed=not task.is_completed, executor_guid=None),
+    )
+    await flow.execute(get_report_data(3), message_id="3")
+    assert notification_client.rendered == 2  # noqa: PLR2004
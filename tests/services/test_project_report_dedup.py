@@ -0,0 +1,139 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import timedelta
+from typing import Any
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis as AsyncRedis
+
+from src.config import get_settings
+from src.data.repositories.project_task_aggregation.dedup_redis import RedisProjectReportDedupRepository
+from src.domain.project.entities import ProjectReportData
+from src.domain.project_task_aggregation.enums import ProjectReportDedupStage
+from src.domain.project_task_aggregation.flows.send_project_report_notification import (
+    SendProjectReportNotificationFlow,
+)
+from src.domain.project_task_aggregation.use_cases.send_project_report import SendProjectReportUseCase
+from src.services.project_report_dedup_service import ProjectReportDedupService
+
+_DEDUP_WINDOW = timedelta(seconds=60)
+
+
+class _RecordingMessageBroker:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.sent: list[Any] = []
+
+    async def send_message(self, _queue_name: str, send_data: Any) -> None:
+        if self.fail:
+            raise ConnectionError
+        self.sent.append(send_data)
+
+
+class _StaticReportFlow:
+    async def execute(self, _project_guid: Any) -> str:
+        return "<p>report</p>"
+
+
+class _RecordingNotificationClient:
+    def __init__(self, error: BaseException | None = None) -> None:
+        self.error = error
+        self.sent: list[str] = []
+
+    async def send_html_notification(self, recipient_email: str, subject: str, html_body: str) -> None:  # noqa: ARG002
+        if self.error is not None:
+            raise self.error
+        self.sent.append(recipient_email)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def redis() -> AsyncGenerator[AsyncRedis, None]:
+    redis = AsyncRedis.from_url(get_settings().REDIS_URL.unicode_string())
+    yield redis
+    await redis.aclose()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def project_report_dedup_service(redis: AsyncRedis) -> ProjectReportDedupService:
+    return ProjectReportDedupService(RedisProjectReportDedupRepository(redis, _DEDUP_WINDOW, _DEDUP_WINDOW))
+
+
+def _get_flow(
+    notification_client: _RecordingNotificationClient,
+    project_report_dedup_service: ProjectReportDedupService,
+) -> SendProjectReportNotificationFlow:
+    return SendProjectReportNotificationFlow(
+        notification_client=notification_client,  # type: ignore
+        get_project_report_flow=_StaticReportFlow(),  # type: ignore
+        project_report_dedup_service=project_report_dedup_service,
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_repeated_report_request_is_published_once(
+    project_report_dedup_service: ProjectReportDedupService,
+) -> None:
+    message_broker = _RecordingMessageBroker()
+    use_case = SendProjectReportUseCase(message_broker, project_report_dedup_service)  # type: ignore
+    report_data = ProjectReportData(project_guid=uuid4(), email="recipient@example.com")
+
+    await use_case.execute(report_data)
+    await use_case.execute(report_data)
+    await use_case.execute(ProjectReportData(project_guid=report_data.project_guid, email="other@example.com"))
+
+    assert len(message_broker.sent) == 2  # noqa: PLR2004
+    assert project_report_dedup_service.suppressed_duplicates == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_report_request_not_published_is_not_a_duplicate(
+    project_report_dedup_service: ProjectReportDedupService,
+) -> None:
+    message_broker = _RecordingMessageBroker(fail=True)
+    use_case = SendProjectReportUseCase(message_broker, project_report_dedup_service)  # type: ignore
+    report_data = ProjectReportData(project_guid=uuid4(), email="recipient@example.com")
+
+    with pytest.raises(ConnectionError):
+        await use_case.execute(report_data)
+    message_broker.fail = False
+    await use_case.execute(report_data)
+
+    assert message_broker.sent == [report_data]
+    assert project_report_dedup_service.suppressed_duplicates == 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_cancelled_delivery_is_sent_by_the_redelivery(
+    project_report_dedup_service: ProjectReportDedupService,
+) -> None:
+    notification_client = _RecordingNotificationClient(error=asyncio.CancelledError())
+    flow = _get_flow(notification_client, project_report_dedup_service)
+    report_data = ProjectReportData(project_guid=uuid4(), email="recipient@example.com")
+
+    with pytest.raises(asyncio.CancelledError):
+        await flow.execute(report_data, message_id="message")
+    notification_client.error = None
+    await flow.execute(report_data, message_id="message")
+    await flow.execute(report_data, message_id="message")
+
+    assert notification_client.sent == [report_data.email]
+    assert project_report_dedup_service.suppressed_duplicates == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_claim_of_a_killed_delivery_is_taken_over_only_by_its_redelivery(
+    project_report_dedup_service: ProjectReportDedupService,
+) -> None:
+    notification_client = _RecordingNotificationClient()
+    flow = _get_flow(notification_client, project_report_dedup_service)
+    report_data = ProjectReportData(project_guid=uuid4(), email="recipient@example.com")
+    # the process was killed after claiming the delivery
+    await project_report_dedup_service.claim(ProjectReportDedupStage.DELIVERY, report_data, "message")
+
+    await flow.execute(report_data, message_id="copy")
+    await flow.execute(report_data, message_id="message")
+
+    assert notification_client.sent == [report_data.email]
+    assert project_report_dedup_service.suppressed_duplicates == 1
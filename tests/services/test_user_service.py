@@ -0,0 +1,106 @@
+import asyncio
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.data.repositories.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from src.data.repositories.user.base import AbstractUserRepository
+from src.data.repositories.user.cashe_base import AbstractUserCacheRepository
+from src.domain.user.entities import User
+from src.services.hasher_service import HasherExecutor, HasherService
+from src.services.user_service import UserLoadSingleFlight, UserService
+from tests.logic.mock_api_di_container import get_mock_api_di_container
+from tests.mock_data import mock_user_entities
+
+
+class _CountingUserRepository(AbstractUserRepository):
+    def __init__(self) -> None:
+        self.get_one_by_guid_calls = 0
+
+    async def get_list(self, *_args: Any, **_kwargs: Any) -> list[User]:
+        raise NotImplementedError
+
+    async def get_one_by_guid(self, guid: UUID) -> User:
+        self.get_one_by_guid_calls += 1
+        await asyncio.sleep(0.01)
+        return next(user for user in mock_user_entities if user.guid == guid)
+
+    async def get_one_by_username(self, *_args: Any, **_kwargs: Any) -> User:
+        raise NotImplementedError
+
+    async def create_one(self, *_args: Any, **_kwargs: Any) -> UUID:
+        raise NotImplementedError
+
+    async def patch_one(self, *_args: Any, **_kwargs: Any) -> UUID:
+        raise NotImplementedError
+
+
+class _MissingUserCacheRepository(AbstractUserCacheRepository):
+    async def add_one(self, *_args: Any, **_kwargs: Any) -> None:
+        return
+
+    async def get_one(self, *_args: Any, **_kwargs: Any) -> User | None:
+        return None
+
+    async def delete_one(self, *_args: Any, **_kwargs: Any) -> None:
+        return
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_concurrent_cache_misses_share_one_db_load() -> None:
+    user_repository = _CountingUserRepository()
+    user_service = UserService(
+        user_cache_repository=_MissingUserCacheRepository(),
+        user_repository=user_repository,
+        hasher_service=HasherService(HasherExecutor(max_workers=1, max_queue_size=0)),
+        user_load_single_flight=UserLoadSingleFlight(),
+    )
+    user, *_ = mock_user_entities
+
+    users = await asyncio.gather(*(user_service.get_one_by_guid(user.guid) for _ in range(10)))
+
+    assert user_repository.get_one_by_guid_calls == 1
+    assert all(fetched_user == user for fetched_user in users)
+    assert len({id(fetched_user) for fetched_user in users}) == len(users)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_shared_db_load_does_not_use_the_callers_unit_of_work() -> None:
+    unit_of_works: list[SQLAlchemyUnitOfWork | None] = []
+
+    async def load() -> None:
+        unit_of_works.append(SQLAlchemyUnitOfWork.get_current())
+
+    async with SQLAlchemyUnitOfWork.begin():
+        await UserLoadSingleFlight().do(mock_user_entities[0].guid, load)  # type: ignore
+
+    assert unit_of_works == [None]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_load_in_unit_of_work_uses_its_session() -> None:
+    container = get_mock_api_di_container()
+    user_service: UserService = container.resolve(UserService)  # type: ignore
+    user_cache_repository: AbstractUserCacheRepository = container.resolve(AbstractUserCacheRepository)  # type: ignore
+    async_engine: AsyncEngine = container.resolve(AsyncEngine)  # type: ignore
+    user, other_user, *_ = mock_user_entities
+    await user_cache_repository.delete_one(user.guid)
+    await user_cache_repository.delete_one(other_user.guid)
+    checkouts = []
+
+    def count_checkout(*args: Any) -> None:
+        checkouts.append(args)
+
+    event.listen(async_engine.sync_engine, "checkout", count_checkout)
+    try:
+        async with SQLAlchemyUnitOfWork.begin():
+            assert (await user_service.get_one_by_guid(user.guid)).guid == user.guid
+            assert (await user_service.get_one_by_username(other_user.username)).guid == other_user.guid
+
+    finally:
+        event.remove(async_engine.sync_engine, "checkout", count_checkout)
+
+    assert len(checkouts) == 1
@@ -18,6 +18,7 @@ set_json_loads(orjson.loads)
 _DROP_USER_TABLE_SQL = """DROP TABLE IF EXISTS "user" CASCADE;"""
 _DROP_USER_EMAIL_INDEX_SQL = """DROP INDEX IF EXISTS ix_user_email;"""
 _DROP_USER_USERNAME_INDEX_SQL = """DROP INDEX IF EXISTS ix_user_username;"""
+_DROP_USER_KEYSET_INDEXES_SQL = """DROP INDEX IF EXISTS ix_user_created_at_guid, ix_user_updated_at_guid;"""
 _DROP_PROJECT_TABLE_SQL = """DROP TABLE IF EXISTS "project" CASCADE;"""
 _DROP_TASK_TABLE_SQL = """DROP TABLE IF EXISTS "task" CASCADE;"""
 
@@ -41,6 +42,9 @@ _CREATE_USER_TABLE_SQL = """CREATE TABLE "user" (
 );"""
 _CREATE_USER_EMAIL_INDEX_SQL = """CREATE UNIQUE INDEX ix_user_email ON "user" (email);"""
 _CREATE_USER_USERNAME_INDEX_SQL = """CREATE UNIQUE INDEX ix_user_username ON "user" (username);"""
+_CREATE_USER_KEYSET_INDEXES_SQL = """CREATE INDEX ix_user_created_at_guid ON "user" (created_at, guid)
+WHERE is_deleted = false;
+CREATE INDEX ix_user_updated_at_guid ON "user" (updated_at, guid) WHERE is_deleted = false;"""
 _CREATE_PROJECT_TABLE_SQL = """CREATE TABLE "project" (
     title VARCHAR(256) NOT NULL,
     description TEXT NOT NULL,
@@ -57,6 +61,10 @@ _CREATE_PROJECT_TABLE_SQL = """CREATE TABLE "project" (
     CONSTRAINT fk_project_creator_guid_user FOREIGN KEY(creator_guid) REFERENCES "user" (guid),
     CONSTRAINT fk_project_mentor_guid_user FOREIGN KEY(mentor_guid) REFERENCES "user" (guid)
 );"""
+_CREATE_PROJECT_KEYSET_INDEXES_SQL = """CREATE INDEX ix_project_created_at_guid ON "project" (created_at, guid);
+CREATE INDEX ix_project_updated_at_guid ON "project" (updated_at, guid);"""
+_CREATE_PROJECT_FK_INDEXES_SQL = """CREATE INDEX ix_project_creator_guid ON "project" (creator_guid);
+CREATE INDEX ix_project_mentor_guid ON "project" (mentor_guid);"""
 _CREATE_TASK_TABLE_SQL = """CREATE TABLE "task" (
     title VARCHAR(256) NOT NULL,
     description TEXT NOT NULL,
@@ -70,6 +78,8 @@ _CREATE_TASK_TABLE_SQL = """CREATE TABLE "task" (
     CONSTRAINT fk_task_executor_guid_user FOREIGN KEY(executor_guid) REFERENCES "user" (guid),
     CONSTRAINT fk_task_project_guid_project FOREIGN KEY(project_guid) REFERENCES "project" (guid)
 );"""
+_CREATE_TASK_FK_INDEXES_SQL = """CREATE INDEX ix_task_project_guid_created_at ON "task" (project_guid, created_at);
+CREATE INDEX ix_task_executor_guid ON "task" (executor_guid);"""
 
 _INSERT_USER_DATA_SQL = """INSERT INTO "user" (
     guid,
@@ -167,8 +177,12 @@ async def create_sql_tables(conn: AsyncConnection) -> None:
         await cur.execute(_CREATE_USER_TABLE_SQL)
         await cur.execute(_CREATE_USER_USERNAME_INDEX_SQL)
         await cur.execute(_CREATE_USER_EMAIL_INDEX_SQL)
+        await cur.execute(_CREATE_USER_KEYSET_INDEXES_SQL)
         await cur.execute(_CREATE_PROJECT_TABLE_SQL)
+        await cur.execute(_CREATE_PROJECT_KEYSET_INDEXES_SQL)
+        await cur.execute(_CREATE_PROJECT_FK_INDEXES_SQL)
         await cur.execute(_CREATE_TASK_TABLE_SQL)
+        await cur.execute(_CREATE_TASK_FK_INDEXES_SQL)
 
 
 async def drop_sql_tables(conn: AsyncConnection) -> None:
@@ -177,6 +191,7 @@ async def drop_sql_tables(conn: AsyncConnection) -> None:
         await cur.execute(_DROP_PROJECT_TABLE_SQL)
         await cur.execute(_DROP_USER_USERNAME_INDEX_SQL)
         await cur.execute(_DROP_USER_EMAIL_INDEX_SQL)
+        await cur.execute(_DROP_USER_KEYSET_INDEXES_SQL)
         await cur.execute(_DROP_USER_TABLE_SQL)
 
 
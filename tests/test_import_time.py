@@ -0,0 +1,61 @@
+import subprocess
+import sys
+from typing import Final
+
+_IMPORT_RUNS: Final[int] = 3
+# the app import may take this many times the import of fastapi alone, so the budget follows the machine speed,
+# measured at 1.8 to 2.5
+_BASELINE_MODULE: Final[str] = "fastapi"
+_API_IMPORT_TIME_RATIO: Final[float] = 3.0
+_WORKER_ONLY_MODULES: Final[frozenset[str]] = frozenset(
+    (
+        "aio_pika",
+        "aiosmtplib",
+        "faststream",
+        "jinja2",
+        "src.infra.notifications.smtp",
+        "src.infra.worker.app",
+        "src.infra.worker.queues",
+        "src.infra.worker.worker_routes",
+        "src.logic.worker_di_container",
+    ),
+)
+
+
+def _import_module(module: str) -> dict[str, int]:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    # cumulative times in microseconds, stderr can hold warnings besides the importtime lines
+    cumulative_times = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative_time, imported_module = line.split("|")
+        cumulative_times[imported_module.strip()] = int(cumulative_time)
+
+    return cumulative_times
+
+
+def _get_best_import_time(module: str) -> int:
+    return min(_import_module(module)[module] for _ in range(_IMPORT_RUNS))
+
+
+def test_api_app_import_leaves_out_worker_modules() -> None:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", "import sys, src.main; print(*sys.modules, sep='\\n')"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert not _WORKER_ONLY_MODULES & set(result.stdout.splitlines())
+
+
+def test_api_app_import_stays_within_budget() -> None:
+    assert _get_best_import_time("src.main") < _get_best_import_time(_BASELINE_MODULE) * _API_IMPORT_TIME_RATIO
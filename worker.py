@@ -0,0 +1,10 @@
+from logging.config import dictConfig
+
+from src.config import get_settings
+from src.infra.worker.app import create_worker_app, run_worker_processes
+
+app = create_worker_app()
+
+if __name__ == "__main__":
+    dictConfig(get_settings().LOG_CONFIG)
+    run_worker_processes(app, processes=get_settings().WORKER_PROCESSES)